@@ -0,0 +1,181 @@
+"""
+Atlas de sprites.
+Empaqueta los sprites de todos los conjuntos registrados en los image
+banks de Pyxel (estantes por alto decreciente, sin repetir sprites de
+igual contenido) y asigna a cada uno un handle entero con su región
+precalculada (bank, u, v, w, h), así dibujar no requiere cálculos de
+posición ni tablas escritas a mano.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+from .base import SpriteBase
+from config.settings import GameSettings
+
+class AtlasEntry(NamedTuple):
+    """Región de un sprite en un image bank"""
+    bank: int
+    u: int
+    v: int
+    w: int
+    h: int
+
+class SpriteAtlas:
+    """
+    Tabla plana de regiones indexada por handle, más el índice de nombres
+    ("conjunto/sprite") a handles.
+    """
+    
+    def __init__(self, banks: Sequence[int] = GameSettings.SPRITE_ATLAS_BANKS,
+                 bank_size: int = GameSettings.IMAGE_BANK_SIZE):
+        """
+        Inicializa un atlas vacío.
+        
+        Args:
+            banks: Image banks que puede ocupar, en orden de uso
+            bank_size: Lado de cada image bank en pixels
+        """
+        self.banks = list(banks)
+        self.bank_size = bank_size
+        self.entries: List[AtlasEntry] = []  # Región de cada handle
+        self.handles: Dict[str, int] = {}  # "conjunto/sprite" -> handle
+        self._pixels: List[List[int]] = []  # Colores de cada handle
+        self._by_content: Dict[Tuple[int, int, Tuple[int, ...]], int] = {}
+    
+    @classmethod
+    def build(cls, sprite_sets: Dict[str, SpriteBase], **kwargs) -> 'SpriteAtlas':
+        """
+        Crea y empaqueta el atlas de varios conjuntos de sprites.
+        
+        Args:
+            sprite_sets: Conjuntos por nombre
+            **kwargs: Argumentos del constructor
+        
+        Returns:
+            Atlas empaquetado (falta `upload` para verlo en pantalla)
+        """
+        atlas = cls(**kwargs)
+        for set_name, sprite_set in sprite_sets.items():
+            width, height = sprite_set.get_sprite_dimensions()
+            for sprite_name in sprite_set.get_all_sprite_types():
+                atlas.add(f"{set_name}/{sprite_name}", sprite_set.get_sprite_by_name(sprite_name), width, height)
+        atlas.pack()
+        return atlas
+    
+    def add(self, name: str, pixels: List[int], width: int, height: int) -> int:
+        """
+        Registra un sprite. Los sprites con el mismo contenido comparten
+        handle (y región).
+        
+        Args:
+            name: Nombre completo ("conjunto/sprite")
+            pixels: Colores del sprite, fila por fila
+            width: Ancho en pixels
+            height: Alto en pixels
+        
+        Returns:
+            Handle del sprite (su región se calcula en `pack`)
+        """
+        key = (width, height, tuple(pixels))
+        handle = self._by_content.get(key)
+        if handle is None:
+            handle = len(self.entries)
+            self._by_content[key] = handle
+            self.entries.append(AtlasEntry(-1, 0, 0, width, height))
+            self._pixels.append(list(pixels))
+        self.handles[name] = handle
+        return handle
+    
+    def pack(self) -> None:
+        """
+        Ubica todos los sprites en los image banks: se ordenan por alto (y
+        ancho) decreciente y se acomodan en estantes, usando el primer
+        estante de cualquier bank donde entren.
+        
+        Raises:
+            ValueError: Si los sprites no entran en los banks disponibles
+        """
+        size = self.bank_size
+        shelves = {bank: [] for bank in self.banks}  # [y, alto, x libre] por estante
+        next_y = {bank: 0 for bank in self.banks}
+        
+        order = sorted(range(len(self.entries)), key=lambda handle: (-self.entries[handle].h, -self.entries[handle].w))
+        for handle in order:
+            w, h = self.entries[handle].w, self.entries[handle].h
+            placed = None
+            for bank in self.banks:
+                for shelf in shelves[bank]:
+                    if h <= shelf[1] and shelf[2] + w <= size:
+                        placed = (bank, shelf[2], shelf[0])
+                        shelf[2] += w
+                        break
+                if placed is None and next_y[bank] + h <= size and w <= size:
+                    shelves[bank].append([next_y[bank], h, w])
+                    placed = (bank, 0, next_y[bank])
+                    next_y[bank] += h
+                if placed is not None:
+                    break
+            if placed is None:
+                raise ValueError(f"Los sprites no entran en los image banks {self.banks}")
+            self.entries[handle] = AtlasEntry(placed[0], placed[1], placed[2], w, h)
+    
+    def handle(self, name: str) -> int:
+        """
+        Retorna el handle de un sprite.
+        
+        Args:
+            name: Nombre completo ("conjunto/sprite")
+        
+        Returns:
+            Handle del sprite
+        """
+        return self.handles[name]
+    
+    def to_manifest(self) -> Dict[str, Any]:
+        """
+        Retorna las regiones y handles del atlas en un diccionario
+        serializable a JSON (sin los pixels, que quedan en los image banks).
+        
+        Returns:
+            Manifiesto del atlas
+        """
+        return {
+            'banks': self.banks,
+            'bank_size': self.bank_size,
+            'entries': [list(entry) for entry in self.entries],
+            'handles': self.handles,
+        }
+    
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any]) -> 'SpriteAtlas':
+        """
+        Reconstruye un atlas ya empaquetado a partir de su manifiesto. No
+        tiene pixels: sirve para dibujar con los image banks ya cargados,
+        no para `upload`.
+        
+        Args:
+            manifest: Resultado de `to_manifest`
+        
+        Returns:
+            Atlas con sus regiones y handles
+        """
+        atlas = cls(manifest['banks'], manifest['bank_size'])
+        atlas.entries = [AtlasEntry(*entry) for entry in manifest['entries']]
+        atlas.handles = dict(manifest['handles'])
+        return atlas
+    
+    def used_banks(self) -> List[int]:
+        """Retorna los image banks que ocupa el atlas"""
+        return sorted({entry.bank for entry in self.entries})
+    
+    def upload(self) -> None:
+        """Escribe el atlas en los image banks con una llamada a `Image.set` por bank"""
+        import pyxel
+        for bank in self.used_banks():
+            entries = [(entry, pixels) for entry, pixels in zip(self.entries, self._pixels) if entry.bank == bank]
+            height = max(entry.v + entry.h for entry, _ in entries)
+            width = max(entry.u + entry.w for entry, _ in entries)
+            rows = [['0'] * width for _ in range(height)]
+            for entry, pixels in entries:
+                for offset, row in enumerate(SpriteBase.to_rows(pixels, entry.w)):
+                    rows[entry.v + offset][entry.u:entry.u + entry.w] = row
+            pyxel.images[bank].set(0, 0, [''.join(row) for row in rows])
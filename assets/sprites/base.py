@@ -5,6 +5,26 @@ Define la interfaz común y funcionalidades compartidas.
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
+from core.memory import deep_sizeof
+
+# Dígito de cada color de la paleta en las filas de `pyxel.Image.set`
+HEX_DIGITS = '0123456789abcdef'
+
+# Conjuntos de sprites registrados para el atlas (nombre -> clase)
+SPRITE_SET_REGISTRY: Dict[str, type] = {}
+
+def register_sprite_set(name: str):
+    """
+    Decorador que registra una subclase de SpriteBase; el gestor de
+    sprites empaqueta en el atlas todos los conjuntos registrados.
+    
+    Args:
+        name: Nombre del conjunto ('mario', 'goomba', etc.)
+    """
+    def decorate(cls):
+        SPRITE_SET_REGISTRY[name] = cls
+        return cls
+    return decorate
 
 class SpriteBase(ABC):
     """
@@ -149,6 +169,38 @@ class SpriteBase(ABC):
             
         return flipped
     
+    def get_mirrored(self, sprite_name: str) -> List[int]:
+        """
+        Retorna un sprite espejado horizontalmente. Se calcula una sola vez
+        y queda en el cache del conjunto.
+        
+        Args:
+            sprite_name: Nombre del sprite original
+            
+        Returns:
+            Datos del sprite espejado
+        """
+        mirrored_name = f"{sprite_name}:mirrored"
+        if not self.is_sprite_cached(mirrored_name):
+            self.cache_sprite(mirrored_name, self.flip_sprite_horizontal(self.get_sprite_by_name(sprite_name)))
+        return self.get_cached_sprite(mirrored_name)
+    
+    @staticmethod
+    def to_rows(sprite_data: List[int], width: int = 16) -> List[str]:
+        """
+        Convierte un sprite al formato de `pyxel.Image.set`: una cadena por
+        fila con un dígito hexadecimal por pixel.
+        
+        Args:
+            sprite_data: Lista de colores del sprite
+            width: Ancho del sprite en pixels
+            
+        Returns:
+            Filas del sprite
+        """
+        digits = ''.join(HEX_DIGITS[color] for color in sprite_data)
+        return [digits[start:start + width] for start in range(0, len(digits), width)]
+    
     def create_empty_sprite(self, fill_color: int = 0) -> List[int]:
         """
         Crea un sprite vacío.
@@ -172,5 +224,6 @@ class SpriteBase(ABC):
         return {
             'cached_sprites': len(self._sprites_cache),
             'sprite_names': list(self._sprites_cache.keys()),
-            'estimated_bytes': len(self._sprites_cache) * 256 * 4,  # 4 bytes por int aproximadamente
+            'cache_bytes': deep_sizeof(self._sprites_cache),
+            'bytes': deep_sizeof(self),  # Cache y sprites preparados por la subclase
         }
@@ -0,0 +1,116 @@
+"""
+Cache en disco de los image banks de sprites.
+Guarda el atlas ya subido a los banks en un archivo .pyxres más un
+manifiesto JSON con sus regiones y handles, identificados por un hash del
+código de los módulos de sprites. Al iniciar, si el hash coincide, los
+banks se cargan con una sola llamada a `pyxel.load` sin construir los
+conjuntos de sprites ni empaquetar el atlas.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from typing import Optional
+from .atlas import SpriteAtlas
+from .base import SPRITE_SET_REGISTRY
+from config.settings import GameSettings
+
+# Solo imágenes: los tilemaps, sonidos y músicas no son parte del atlas
+_PYXRES_OPTIONS = {'excl_tilemaps': True, 'excl_sounds': True, 'excl_musics': True}
+
+class SpriteBankCache:
+    """
+    Archivo .pyxres con los banks del atlas y su manifiesto
+    (`<archivo>.json`). El manifiesto guarda el hash de contenido con el
+    que se horneó; si el código de los sprites cambia, el cache se ignora.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Inicializa el cache.
+        
+        Args:
+            path: Archivo .pyxres (por defecto SPRITE_CACHE_FILE junto a
+                los módulos de sprites)
+        """
+        self.path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         GameSettings.SPRITE_CACHE_FILE)
+        self.manifest_path = self.path + '.json'
+    
+    @staticmethod
+    def content_hash() -> str:
+        """
+        Calcula el hash del código que define los sprites: los módulos de
+        los conjuntos registrados, la base y el empaquetado del atlas, más
+        la configuración de los banks y la versión de Pyxel (formato .pyxres).
+        
+        Returns:
+            Hash SHA-256 en hexadecimal
+        """
+        import pyxel
+        from . import atlas, base
+        
+        modules = {inspect.getsourcefile(atlas), inspect.getsourcefile(base)}
+        modules.update(inspect.getsourcefile(sprite_class) for sprite_class in SPRITE_SET_REGISTRY.values())
+        
+        digest = hashlib.sha256()
+        for filename in sorted(modules):
+            with open(filename, 'rb') as f:
+                digest.update(f.read())
+        digest.update(repr((sorted(SPRITE_SET_REGISTRY), GameSettings.SPRITE_ATLAS_BANKS,
+                            GameSettings.IMAGE_BANK_SIZE, pyxel.VERSION)).encode())
+        return digest.hexdigest()
+    
+    def is_current(self) -> bool:
+        """
+        Indica si el archivo horneado corresponde al código actual.
+        
+        Returns:
+            True si existe y su hash coincide
+        """
+        return self._read_manifest() is not None
+    
+    def load(self) -> Optional[SpriteAtlas]:
+        """
+        Carga los banks horneados si están al día.
+        
+        Returns:
+            Atlas (sin pixels) para dibujar, o None si hay que reconstruirlo
+        """
+        import pyxel
+        manifest = self._read_manifest()
+        if manifest is None:
+            return None
+        pyxel.load(self.path, **_PYXRES_OPTIONS)
+        return SpriteAtlas.from_manifest(manifest['atlas'])
+    
+    def save(self, atlas: SpriteAtlas) -> None:
+        """
+        Hornea los image banks actuales (con el atlas ya subido).
+        
+        Args:
+            atlas: Atlas subido a los banks
+        
+        Raises:
+            OSError: Si no se pueden escribir los archivos
+        """
+        import pyxel
+        # Pyxel aborta con un panic si no puede escribir: se prueba antes
+        # desde Python para fallar con un OSError manejable
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        open(self.path, 'ab').close()
+        pyxel.save(self.path, **_PYXRES_OPTIONS)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'hash': self.content_hash(), 'atlas': atlas.to_manifest()}, f)
+    
+    def _read_manifest(self) -> Optional[dict]:
+        """Lee el manifiesto, o retorna None si falta, está roto o es de otro código"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get('hash') == self.content_hash() else None
@@ -3,9 +3,10 @@ Sprites específicos para el enemigo Goomba.
 Contiene todas las variaciones de sprites de Goomba con pixel art.
 """
 
-from .base import SpriteBase
+from .base import SpriteBase, register_sprite_set
 from typing import List
 
+@register_sprite_set('goomba')
 class GoombaSprites(SpriteBase):
     """Clase que contiene todos los sprites de Goomba"""
     
@@ -1,173 +1,128 @@
 """
 Gestor principal de sprites modular.
-Maneja la carga lazy y renderizado de sprites organizados por entidad.
+Maneja la carga (anticipada o lazy) y el renderizado de sprites organizados
+por entidad. Todos los conjuntos se empaquetan en un atlas (`atlas.py`) que
+se sube a los image banks con una llamada a `Image.set` por bank, y se
+hornea en disco (`cache.py`) para que los próximos inicios solo lo carguen.
 """
 
-import pyxel
-from typing import Dict, Any, Optional
+from typing import Dict, List, Optional
+from .base import SpriteBase, SPRITE_SET_REGISTRY
+from .atlas import AtlasEntry, SpriteAtlas
+from .cache import SpriteBankCache
+from . import mario_sprites, goomba_sprites  # Registran sus conjuntos
+from core.tracing import traced
+from core.memory import deep_sizeof
 
 class SpriteManager:
     """
-    Gestor principal de sprites con carga lazy y organización modular.
+    Gestor principal de sprites con carga anticipada y organización modular.
+    Los conjuntos registrados (`register_sprite_set`) se empaquetan juntos
+    en un atlas que ocupa los image banks.
+    
+    Para dibujar cada frame conviene resolver los nombres una sola vez
+    (`resolve`) y usar los handles enteros con `draw`, que solo indexa una
+    tabla plana de regiones.
     """
     
     def __init__(self):
         """Inicializa el gestor de sprites"""
         self.sprites_initialized = False
-        self.loaded_sprite_sets: Dict[str, Any] = {}
-        
-        # Posiciones en el image bank para cada conjunto de sprites
-        self.sprite_positions = {
-            'mario': {'x': 0, 'y': 0},      # Mario en fila 0
-            'goomba': {'x': 0, 'y': 16},    # Goomba en fila 1
-            'koopa': {'x': 0, 'y': 32},     # Koopa en fila 2 (futuro)
-            'items': {'x': 0, 'y': 48},     # Items en fila 3 (futuro)
-        }
-        
-        # Cache de sprites ya dibujados en el image bank
-        self.drawn_sprites: Dict[str, bool] = {}
+        self.loaded_sprite_sets: Dict[str, SpriteBase] = {}
+        self.atlas: Optional[SpriteAtlas] = None  # Se arma en `preload`
+        self._regions: List[AtlasEntry] = []  # Región de cada handle (tabla de `draw`)
+        self.cache: Optional[SpriteBankCache] = SpriteBankCache()  # None para no usar disco
     
-    def initialize_sprites(self):
-        """Inicializa el sistema de sprites después de que Pyxel esté listo"""
+    def initialize_sprites(self, preload: bool = True):
+        """
+        Inicializa el sistema de sprites después de que Pyxel esté listo.
+        
+        Args:
+            preload: True para subir ya todos los conjuntos al image bank;
+                si no, se cargan al dibujar el primer sprite
+                (con un tirón en medio de la partida)
+        """
         if not self.sprites_initialized:
-            # No cargar todos los sprites inmediatamente
-            # Solo marcar como inicializado
             self.sprites_initialized = True
+            if preload:
+                self.preload()
     
-    def _load_sprite_set(self, sprite_set_name: str) -> None:
+    @traced
+    def preload(self, use_cache: bool = True) -> None:
         """
-        Carga un conjunto específico de sprites.
+        Sube el atlas de todos los conjuntos registrados a los image banks
+        (al inicio o al registrar conjuntos nuevos). Si los banks horneados
+        en disco están al día se cargan de ahí; si no, se construyen los
+        conjuntos, se empaqueta el atlas y se vuelve a hornear.
         
         Args:
-            sprite_set_name: Nombre del conjunto ('mario', 'goomba', etc.)
+            use_cache: False para reconstruir aunque el cache esté al día
         """
-        if sprite_set_name in self.loaded_sprite_sets:
-            return  # Ya cargado
-            
-        if sprite_set_name == 'mario':
-            from .mario_sprites import MarioSprites
-            self.loaded_sprite_sets['mario'] = MarioSprites()
-            self._draw_mario_sprites()
-            
-        elif sprite_set_name == 'goomba':
-            from .goomba_sprites import GoombaSprites  
-            self.loaded_sprite_sets['goomba'] = GoombaSprites()
-            self._draw_goomba_sprites()
-            
-        # Futuras expansiones aquí...
-        
-    def _draw_mario_sprites(self) -> None:
-        """Dibuja los sprites de Mario en el image bank"""
-        if 'mario_drawn' in self.drawn_sprites:
-            return
-            
-        mario_sprites = self.loaded_sprite_sets['mario']
-        pos = self.sprite_positions['mario']
-        
-        # Dibujar cada sprite de Mario
-        self._draw_sprite_to_bank(pos['x'], pos['y'], mario_sprites.get_small_right())
-        self._draw_sprite_to_bank(pos['x'] + 16, pos['y'], mario_sprites.get_small_left())
-        self._draw_sprite_to_bank(pos['x'] + 32, pos['y'], mario_sprites.get_walk1_right())
-        self._draw_sprite_to_bank(pos['x'] + 48, pos['y'], mario_sprites.get_walk1_left())
-        
-        self.drawn_sprites['mario_drawn'] = True
+        if use_cache and self.cache is not None:
+            atlas = self.cache.load()
+            if atlas is not None:
+                self._set_atlas(atlas)
+                return
+        
+        # En orden de registro: así los handles ya resueltos siguen valiendo
+        # aunque se registren conjuntos nuevos
+        for name in SPRITE_SET_REGISTRY:
+            self._load_sprite_set(name)
+        self._set_atlas(SpriteAtlas.build({name: self.loaded_sprite_sets[name] for name in SPRITE_SET_REGISTRY}))
+        self.atlas.upload()
+        
+        if self.cache is not None:
+            try:
+                self.cache.save(self.atlas)
+            except OSError as e:
+                print(f"⚠️ No se pudo guardar el cache de sprites: {e}")
     
-    def _draw_goomba_sprites(self) -> None:
-        """Dibuja los sprites de Goomba en el image bank"""
-        if 'goomba_drawn' in self.drawn_sprites:
-            return
-            
-        goomba_sprites = self.loaded_sprite_sets['goomba']
-        pos = self.sprite_positions['goomba']
-        
-        # Dibujar cada sprite de Goomba
-        self._draw_sprite_to_bank(pos['x'], pos['y'], goomba_sprites.get_normal())
-        self._draw_sprite_to_bank(pos['x'] + 16, pos['y'], goomba_sprites.get_walk())
-        self._draw_sprite_to_bank(pos['x'] + 32, pos['y'], goomba_sprites.get_squashed())
-        
-        self.drawn_sprites['goomba_drawn'] = True
+    def _set_atlas(self, atlas: SpriteAtlas) -> None:
+        """Usa un atlas empaquetado para dibujar"""
+        self.atlas = atlas
+        self._regions = atlas.entries
     
-    def _draw_sprite_to_bank(self, x: int, y: int, sprite_data: list) -> None:
+    def _load_sprite_set(self, sprite_set_name: str) -> None:
         """
-        Dibuja un sprite en el image bank de Pyxel.
+        Carga un conjunto específico de sprites.
         
         Args:
-            x: Posición X en el image bank
-            y: Posición Y en el image bank
-            sprite_data: Lista de colores del sprite (16x16)
+            sprite_set_name: Nombre del conjunto ('mario', 'goomba', etc.)
         """
-        for i, color in enumerate(sprite_data):
-            px = x + (i % 16)
-            py = y + (i // 16)
-            if color != 0:  # 0 es transparente
-                pyxel.images[0].pset(px, py, color)
+        if sprite_set_name not in self.loaded_sprite_sets:
+            self.loaded_sprite_sets[sprite_set_name] = SPRITE_SET_REGISTRY[sprite_set_name]()
     
-    def draw_mario_sprite(self, x: float, y: float, sprite_type: str, facing_right: bool = True) -> None:
+    def resolve(self, name: str) -> int:
         """
-        Dibuja un sprite de Mario. Carga los sprites si es necesario.
+        Convierte el nombre de un sprite en su handle. Carga los sprites si
+        es necesario.
         
         Args:
-            x: Posición X en pantalla
-            y: Posición Y en pantalla
-            sprite_type: Tipo de sprite ('idle', 'walk1', 'walk2', 'jump')
-            facing_right: True si Mario mira a la derecha
-        """
-        # Cargar sprites de Mario si no están cargados
-        if 'mario' not in self.loaded_sprite_sets:
-            self._load_sprite_set('mario')
+            name: Nombre completo ("conjunto/sprite", por ejemplo "goomba/walk")
         
-        # Determinar posición del sprite
-        base_pos = self.sprite_positions['mario']
-        sprite_x = base_pos['x']
+        Returns:
+            Handle para `draw`
         
-        if sprite_type == 'idle':
-            sprite_x += 0 if facing_right else 16
-        elif sprite_type in ['walk1', 'walk2']:
-            sprite_x += 32 if facing_right else 48
-        elif sprite_type == 'jump':
-            sprite_x += 0 if facing_right else 16  # Usar idle para salto
-        
-        # Dibujar el sprite
-        pyxel.blt(
-            int(x), int(y),
-            0,  # Image bank 0
-            sprite_x, base_pos['y'],
-            16, 16,  # Tamaño 16x16
-            0  # Color transparente
-        )
+        Raises:
+            KeyError: Si no hay ningún sprite con ese nombre
+        """
+        if self.atlas is None:
+            self.preload()
+        return self.atlas.handle(name)
     
-    def draw_goomba_sprite(self, x: float, y: float, sprite_type: str = 'normal') -> None:
+    def draw(self, handle: int, x: float, y: float, flip: bool = False) -> None:
         """
-        Dibuja un sprite de Goomba. Carga los sprites si es necesario.
+        Dibuja un sprite por su handle.
         
         Args:
+            handle: Handle obtenido con `resolve`
             x: Posición X en pantalla
             y: Posición Y en pantalla
-            sprite_type: Tipo de sprite ('normal', 'walk', 'squashed')
+            flip: True para dibujarlo espejado horizontalmente
         """
-        # Cargar sprites de Goomba si no están cargados
-        if 'goomba' not in self.loaded_sprite_sets:
-            self._load_sprite_set('goomba')
-        
-        # Determinar posición del sprite
-        base_pos = self.sprite_positions['goomba']
-        sprite_x = base_pos['x']
-        
-        if sprite_type == 'normal':
-            sprite_x += 0
-        elif sprite_type == 'walk':
-            sprite_x += 16
-        elif sprite_type == 'squashed':
-            sprite_x += 32
-        
-        # Dibujar el sprite
-        pyxel.blt(
-            int(x), int(y),
-            0,  # Image bank 0
-            sprite_x, base_pos['y'],
-            16, 16,  # Tamaño 16x16
-            0  # Color transparente
-        )
+        import pyxel
+        bank, u, v, w, h = self._regions[handle]
+        pyxel.blt(int(x), int(y), bank, u, v, -w if flip else w, h, 0)  # 0 es transparente
     
     def unload_sprite_set(self, sprite_set_name: str) -> None:
         """
@@ -178,11 +133,6 @@ class SpriteManager:
         """
         if sprite_set_name in self.loaded_sprite_sets:
             del self.loaded_sprite_sets[sprite_set_name]
-            
-        # Remover del cache de sprites dibujados
-        cache_key = f"{sprite_set_name}_drawn"
-        if cache_key in self.drawn_sprites:
-            del self.drawn_sprites[cache_key]
     
     def get_loaded_sprite_sets(self) -> list:
         """Retorna la lista de conjuntos de sprites cargados"""
@@ -190,10 +140,14 @@ class SpriteManager:
     
     def get_memory_usage(self) -> dict:
         """Retorna información sobre el uso de memoria de sprites"""
+        set_bytes = {name: sprite_set.get_memory_usage()['bytes']
+                     for name, sprite_set in self.loaded_sprite_sets.items()}
         return {
             'loaded_sets': len(self.loaded_sprite_sets),
-            'drawn_sprites': len(self.drawn_sprites),
-            'sprite_sets': list(self.loaded_sprite_sets.keys())
+            'atlas_sprites': len(self.atlas.entries) if self.atlas else 0,  # Regiones distintas en los banks
+            'sprite_sets': list(self.loaded_sprite_sets.keys()),
+            'set_bytes': set_bytes,  # Bytes reales de cada conjunto
+            'bytes': deep_sizeof(self)  # Todo el gestor, conjuntos incluidos
         }
 
 # Instancia global del gestor
@@ -0,0 +1,4 @@
+# Benchmarks package
+
+from .scenes import SceneConfig, SyntheticScene, benchmark_input
+from .runner import run_benchmark, summarize, init_pyxel, environment_info
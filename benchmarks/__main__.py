@@ -0,0 +1,97 @@
+"""
+Línea de comandos de los benchmarks.
+Mide todas las combinaciones de enemigos × plataformas × largo de nivel y
+guarda los resultados en JSON; con --compare muestra la diferencia contra
+un JSON anterior (otra versión del código).
+
+Uso:
+    SDL_VIDEODRIVER=offscreen python -m benchmarks --goombas 10 100 --platforms 0 200 \\
+        --length 512 4096 -o resultados.json [--compare base.json]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.scenes import SceneConfig
+from benchmarks.runner import environment_info, init_pyxel, run_benchmark
+
+def print_result(result):
+    """Muestra una línea con los tiempos principales de un caso"""
+    update = result['update']
+    physics = result['physics']
+    draw = result['draw']
+    draw_text = f"{draw['mean_us']:>9.1f}" if draw else f"{'-':>9}"
+    print(f"{result['name']:<28} {update['mean_us']:>9.1f} {update['p95_us']:>9.1f} "
+          f"{physics['enemy_ai']['mean_us']:>9.1f} {physics['enemy_bodies']['mean_us']:>9.1f} "
+          f"{physics['enemy_geometry']['mean_us']:>9.1f} "
+          f"{physics['collisions']['mean_us']:>9.1f} {draw_text} {result['mean_awake_enemies']:>7.1f}")
+
+def compare(results, baseline_path):
+    """
+    Muestra la variación del tick medio y del dibujo contra otro archivo.
+    
+    Args:
+        results: Resultados actuales
+        baseline_path: JSON de una ejecución anterior
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {result['name']: result for result in json.load(f)['results']}
+    
+    print(f"\nComparación con {baseline_path}:")
+    for result in results:
+        base = baseline.get(result['name'])
+        if base is None:
+            print(f"{result['name']:<28} (sin referencia)")
+            continue
+        line = f"{result['name']:<28} update {_change(result['update'], base['update'])}"
+        if result['draw'] and base.get('draw'):
+            line += f"  draw {_change(result['draw'], base['draw'])}"
+        print(line)
+
+def _change(current, base):
+    """Formatea la variación porcentual de la media"""
+    ratio = current['mean_us'] / max(base['mean_us'], 1e-9) - 1
+    return f"{base['mean_us']:.1f} -> {current['mean_us']:.1f} us ({ratio:+.1%})"
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Benchmarks de GameScene con escenas sintéticas")
+    parser.add_argument("--goombas", type=int, nargs="+", default=[3, 30, 300], help="Cantidades de Goombas")
+    parser.add_argument("--platforms", type=int, nargs="+", default=[0, 100], help="Cantidades de bloques")
+    parser.add_argument("--length", type=int, nargs="+", default=[512, 4096], help="Largos de nivel en pixels")
+    parser.add_argument("--all-awake", action="store_true", help="Simular todos los enemigos aunque estén lejos")
+    parser.add_argument("--ticks", type=int, default=600, help="Ticks medidos por caso")
+    parser.add_argument("--warmup", type=int, default=120, help="Ticks previos sin medir")
+    parser.add_argument("--repeats", type=int, default=200, help="Repeticiones de cada pasada aislada")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de las escenas")
+    parser.add_argument("--no-draw", action="store_true", help="No medir el dibujo (no inicializa Pyxel)")
+    parser.add_argument("-o", "--output", help="Guardar los resultados en un archivo JSON")
+    parser.add_argument("--compare", metavar="JSON", help="Comparar con resultados anteriores")
+    args = parser.parse_args()
+    
+    draw = not args.no_draw and init_pyxel()
+    
+    print(f"{'Caso':<28} {'tick':>9} {'tick p95':>9} {'IA':>9} {'cuerpos':>9} {'geometría':>9} "
+          f"{'colisión':>9} {'dibujo':>9} {'activos':>7}")
+    results = []
+    for goombas, platforms, length in itertools.product(args.goombas, args.platforms, args.length):
+        config = SceneConfig(goombas, platforms, length, args.all_awake, args.seed)
+        result = run_benchmark(config, args.ticks, args.warmup, args.repeats, draw)
+        results.append(result)
+        print_result(result)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment_info(), 'results': results}, f, indent=2)
+        print(f"\n💾 Resultados guardados en {args.output}")
+    
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
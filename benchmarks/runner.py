@@ -0,0 +1,182 @@
+"""
+Medición de tiempos de GameScene.
+Para cada escena sintética mide el tick completo, sus etapas, las
+pasadas de física por separado y el dibujo, y devuelve los resultados
+como diccionarios listos para serializar a JSON.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from benchmarks.scenes import SceneConfig, SyntheticScene
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Resume una lista de duraciones.
+    
+    Args:
+        samples: Duraciones en segundos
+    
+    Returns:
+        Media, percentiles 50/95/99 y máximo, en microsegundos
+    """
+    values = np.asarray(samples) * 1e6
+    p50, p95, p99 = np.percentile(values, (50, 95, 99))
+    return {
+        'mean_us': round(float(values.mean()), 3),
+        'p50_us': round(float(p50), 3),
+        'p95_us': round(float(p95), 3),
+        'p99_us': round(float(p99), 3),
+        'max_us': round(float(values.max()), 3),
+    }
+
+def _time_calls(function: Callable[[], None], repeats: int) -> List[float]:
+    """Mide `repeats` llamadas a una función"""
+    clock = time.perf_counter
+    samples = []
+    for _ in range(repeats):
+        start = clock()
+        function()
+        samples.append(clock() - start)
+    return samples
+
+def _time_isolated(scene: SyntheticScene, state: bytes, function: Callable[[], None],
+                   repeats: int) -> List[float]:
+    """
+    Mide una pasada siempre desde el mismo estado: se restaura el snapshot
+    antes de cada llamada (fuera del tiempo medido).
+    """
+    clock = time.perf_counter
+    samples = []
+    for _ in range(repeats):
+        scene.restore(state)
+        start = clock()
+        function()
+        samples.append(clock() - start)
+    return samples
+
+def init_pyxel() -> bool:
+    """
+    Inicializa Pyxel para medir el dibujo. Sin pantalla conviene usar
+    SDL_VIDEODRIVER=offscreen.
+    
+    Returns:
+        True si Pyxel quedó inicializado
+    """
+    try:
+        import pyxel
+        from config.settings import GameSettings
+        pyxel.init(GameSettings.WINDOW_WIDTH, GameSettings.WINDOW_HEIGHT, title="benchmarks")
+        from assets.sprites import sprite_manager
+        sprite_manager.initialize_sprites()
+        return True
+    except Exception as e:
+        print(f"⚠️  No se pudo inicializar Pyxel, no se mide el dibujo: {e}", file=sys.stderr)
+        return False
+
+def run_benchmark(config: SceneConfig, ticks: int = 600, warmup: int = 120,
+                  repeats: int = 200, draw: bool = False) -> Dict:
+    """
+    Mide una escena sintética.
+    
+    Args:
+        config: Parámetros de la escena
+        ticks: Ticks medidos del recorrido completo
+        warmup: Ticks previos sin medir
+        repeats: Repeticiones de cada pasada aislada
+        draw: True para medir también el dibujo (requiere `init_pyxel`)
+    
+    Returns:
+        Diccionario con la configuración y los tiempos
+    """
+    scene = SyntheticScene(config)
+    for _ in range(warmup):
+        scene.update()
+    
+    # Tick completo y sus tres etapas, avanzando la partida
+    update, begin, integrate, end = [], [], [], []
+    draw_samples = []
+    clock = time.perf_counter
+    awake = 0
+    for _ in range(ticks):
+        start = clock()
+        running = scene.update_begin()
+        after_begin = clock()
+        if running:
+            scene.integrate_enemy_bodies()
+            after_integrate = clock()
+            scene.update_end()
+            after_end = clock()
+            integrate.append(after_integrate - after_begin)
+            end.append(after_end - after_integrate)
+        else:
+            after_end = after_begin
+        begin.append(after_begin - start)
+        update.append(after_end - start)
+        awake += len(scene.activation.awake)
+        
+        if draw:
+            draw_start = clock()
+            scene.draw()
+            draw_samples.append(clock() - draw_start)
+    
+    # Pasadas de física aisladas, siempre sobre el estado final
+    state = scene.snapshot()
+    physics = {
+        'players': summarize(_time_isolated(
+            scene, state, lambda: [scene._apply_physics_to_player(player) for player in scene.players], repeats)),
+        'enemy_ai': summarize(_time_isolated(scene, state, scene._update_enemies, repeats)),
+        'enemy_bodies': summarize(_time_isolated(scene, state, scene.integrate_enemy_bodies, repeats)),
+        'enemy_geometry': summarize(_time_isolated(scene, state, scene._resolve_enemy_geometry, repeats)),
+        'collisions': summarize(_time_isolated(scene, state, scene._check_collisions, repeats)),
+        'snapshot': summarize(_time_calls(scene.snapshot, repeats)),
+        'restore': summarize(_time_calls(lambda: scene.restore(state), repeats)),
+    }
+    
+    result = {
+        'name': config.name,
+        'config': config._asdict(),
+        'ticks': ticks,
+        'mean_awake_enemies': round(awake / max(ticks, 1), 2),
+        'update': summarize(update),
+        'stages': {
+            'begin': summarize(begin),
+            'integrate': summarize(integrate) if integrate else None,
+            'end': summarize(end) if end else None,
+        },
+        'physics': physics,
+        'draw': summarize(draw_samples) if draw_samples else None,
+    }
+    return result
+
+def environment_info() -> Dict[str, Optional[str]]:
+    """
+    Describe el entorno de la medición para poder comparar resultados.
+    
+    Returns:
+        Versiones de Python, NumPy y Pyxel, plataforma y commit de git
+    """
+    try:
+        import pyxel
+        pyxel_version = getattr(pyxel, 'VERSION', None)
+    except ImportError:
+        pyxel_version = None
+    
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pyxel': pyxel_version,
+        'platform': platform.platform(),
+        'commit': commit,
+    }
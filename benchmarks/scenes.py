@@ -0,0 +1,102 @@
+"""
+Escenas sintéticas para benchmarks.
+Generan niveles de tamaño configurable (enemigos, plataformas, largo) a
+partir de una semilla, así el mismo caso se puede medir en distintas
+versiones del código.
+"""
+
+import random
+from typing import NamedTuple, Optional
+from scenes.game_scene import GameScene
+from entities.enemies.goomba import Goomba
+from entities.platforms import Block
+from core.input import Button, InputProvider, ScriptedInput
+from config.settings import GameSettings, LevelSettings
+
+class SceneConfig(NamedTuple):
+    """Parámetros de una escena sintética"""
+    goombas: int = 10
+    platforms: int = 20
+    level_width: int = LevelSettings.LEVEL_WIDTH
+    all_awake: bool = False  # True para simular todos los enemigos aunque estén lejos
+    seed: int = 0
+    
+    @property
+    def name(self) -> str:
+        """Retorna un nombre corto para mostrar el caso"""
+        awake = "-awake" if self.all_awake else ""
+        return f"g{self.goombas}-p{self.platforms}-w{self.level_width}{awake}"
+
+# Alturas de las plataformas flotantes (en tiles por encima del suelo)
+PLATFORM_ROWS = (2, 3, 5)
+
+class SyntheticScene(GameScene):
+    """
+    GameScene con un nivel generado: Goombas repartidos a lo largo del
+    nivel y bloques flotantes en posiciones aleatorias (con semilla).
+    """
+    
+    def __init__(self, config: SceneConfig, input_provider: Optional[InputProvider] = None):
+        """
+        Inicializa la escena.
+        
+        Args:
+            config: Parámetros del nivel
+            input_provider: Fuente de entrada (por defecto, `benchmark_input`)
+        """
+        self.config = config
+        super().__init__(input_provider if input_provider is not None else benchmark_input())
+        
+        # Mario no debe terminar la partida durante la medición
+        self.mario.lives = 10 ** 6
+        
+        if config.all_awake:
+            self.activation.margin = float('inf')
+            self.activation.sleep_margin = float('inf')
+    
+    def _create_test_level(self) -> None:
+        """Genera el nivel a partir de la configuración"""
+        config = self.config
+        self.level_width = config.level_width
+        self.spatial_query.level_width = config.level_width
+        self.camera.set_bounds(0, config.level_width, 0, LevelSettings.LEVEL_HEIGHT)
+        
+        rng = random.Random(config.seed)
+        tile = GameSettings.TILE_SIZE
+        ground_y = LevelSettings.GROUND_Y
+        
+        # Goombas repartidos a lo largo del nivel, lejos del inicio de Mario
+        start = 150
+        span = max(config.level_width - start - tile * 2, 1)
+        for index in range(config.goombas):
+            x = start + span * index / max(config.goombas, 1)
+            self.add_enemy(Goomba(x, ground_y - GameSettings.MARIO_HEIGHT))
+        
+        # Las plataformas son estáticas: solo se crean la primera vez
+        # (reset vuelve a llamar a este método)
+        if not self.platforms and config.platforms:
+            columns = max(config.level_width // tile, 1)
+            cells = set()
+            while len(cells) < min(config.platforms, columns * len(PLATFORM_ROWS)):
+                cells.add((rng.randrange(columns), rng.choice(PLATFORM_ROWS)))
+            for column, row in sorted(cells):
+                self.add_platform(Block(column * tile, ground_y - row * tile))
+        
+        self.build_static_collision()
+
+def benchmark_input(ticks_per_cycle: int = 240) -> ScriptedInput:
+    """
+    Entrada repetida para los benchmarks: Mario corre hacia la derecha
+    saltando de a ratos, así la cámara recorre el nivel y despierta enemigos.
+    
+    Args:
+        ticks_per_cycle: Ticks de cada ciclo del guion
+    
+    Returns:
+        Entrada por guion en bucle
+    """
+    run = Button.RIGHT | Button.RUN
+    segments = [(run, 40), (run | Button.JUMP, 1), (run, 30), (Button.RIGHT | Button.JUMP, 1)]
+    used = sum(ticks for _, ticks in segments)
+    segments.append((run, max(ticks_per_cycle - used, 1)))
+    return ScriptedInput.from_segments(segments, loop=True)
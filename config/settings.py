@@ -12,6 +12,38 @@ class GameSettings:
     WINDOW_TITLE = "Mario Bros - Pyxel"
     FPS = 60
     
+    # Simulación de paso fijo
+    MAX_CATCH_UP_TICKS = 5          # Ticks máximos a recuperar por frame
+    FAST_FORWARD_SPEED = 8          # Multiplicador del avance rápido
+    FAST_FORWARD_DRAW_INTERVAL = 4  # En avance rápido, dibujar 1 de cada N frames
+    
+    # Grabación de entrada
+    RECORDING_AUTOSAVE_FRAMES = 600  # Guardar la grabación cada N frames
+    
+    # Rebobinado
+    REWIND_SECONDS = 10             # Segundos de juego que se pueden rebobinar
+    REWIND_KEYFRAME_INTERVAL = 60   # Ticks entre snapshots completos del buffer
+    
+    # Profiler del overlay de debug
+    PROFILER_HISTORY_FRAMES = 240   # Frames guardados para percentiles
+    PROFILER_GRAPH_FRAMES = 96      # Frames mostrados en el gráfico
+    
+    # Trazas (Chrome Trace Event)
+    TRACE_CAPACITY = 1 << 16        # Zonas guardadas en el buffer circular
+    
+    # Gobernador del presupuesto de frame
+    GOVERNOR_DEGRADE_RATIO = 0.9    # Degradar si el frame usa más de esta fracción del presupuesto
+    GOVERNOR_RECOVER_RATIO = 0.6    # Recuperar si el nivel anterior usaría menos que esto
+    GOVERNOR_DEGRADE_FRAMES = 30    # Frames seguidos por encima para degradar
+    GOVERNOR_RECOVER_FRAMES = 180   # Frames seguidos por debajo para recuperar
+    GOVERNOR_DRAW_INTERVAL = 2      # Con frames saltados, dibujar 1 de cada N
+    GOVERNOR_NEAR_MARGIN = 16       # Margen de activación de enemigos reducido
+    
+    # Atlas de sprites
+    IMAGE_BANK_SIZE = 256           # Lado de cada image bank de Pyxel
+    SPRITE_ATLAS_BANKS = (0, 1, 2)  # Image banks que puede ocupar el atlas
+    SPRITE_CACHE_FILE = 'sprites.pyxres'  # Banks horneados (en assets/sprites)
+    
     # Colores principales (usando la paleta de Pyxel)
     COLOR_SKY = 12      # Azul claro
     COLOR_GROUND = 4    # Marrón
@@ -25,6 +57,9 @@ class GameSettings:
     MARIO_SPEED = 2
     MAX_FALL_SPEED = 8
     
+    # Broadphase de colisiones
+    SPATIAL_HASH_CELL_SIZE = 64  # Tamaño de celda del hash espacial (4 tiles)
+    
     # Tamaños de entidades
     MARIO_WIDTH = 16
     MARIO_HEIGHT = 16
@@ -36,6 +71,7 @@ class GameSettings:
     KEY_JUMP = "SPACE"
     KEY_RUN = "Z"
     KEY_PAUSE = "P"
+    KEY_FAST_FORWARD = "F"
     KEY_QUIT = "Q"
 
 class LevelSettings:
@@ -51,6 +87,9 @@ class LevelSettings:
     # Configuración de cámara
     CAMERA_SPEED = 2
     CAMERA_OFFSET_X = 64  # Offset de Mario respecto al borde izquierdo
+    
+    # Región de activación de enemigos
+    ACTIVATION_MARGIN = 64  # Margen alrededor de la cámara para despertar enemigos
 
 class AudioSettings:
     """Configuraciones de audio"""
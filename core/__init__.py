@@ -1,3 +1,12 @@
 # Core package
 
 from .camera import Camera
+from .timestep import FixedTimestep
+from .activation import ActivationRegion
+from .input import Button, InputProvider, PyxelInput, ScriptedInput, ManualInput
+from .recording import InputRecorder, InputReplay
+from .rewind import RewindBuffer
+from .profiler import FrameProfiler
+from .tracing import Tracer, tracer, zone, traced
+from .memory import MemoryTracker, deep_sizeof, scene_memory
+from .governor import FrameGovernor
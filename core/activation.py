@@ -0,0 +1,189 @@
+"""
+Regiones de activación de entidades.
+Las entidades lejos de la cámara duermen (sin IA, física ni colisiones)
+y se despiertan cuando la ventana de activación las alcanza.
+"""
+
+import bisect
+from typing import List, Tuple, TYPE_CHECKING
+from core.camera import Camera
+from config.settings import GameSettings, LevelSettings
+
+if TYPE_CHECKING:
+    # Solo para anotaciones: importar entities aquí crearía un ciclo con assets
+    from entities.base import Entity
+
+class ActivationRegion:
+    """
+    Mantiene la lista de entidades despiertas y un índice ordenado por X
+    de las dormidas. El costo por frame depende de las entidades
+    despiertas y de las que se despiertan, no del total del nivel.
+    """
+    
+    def __init__(self, margin: float = LevelSettings.ACTIVATION_MARGIN):
+        """
+        Inicializa la región de activación.
+        
+        Args:
+            margin: Margen en pixels alrededor de la cámara
+        """
+        self.margin = margin
+        
+        # Margen algo mayor para dormir, así una entidad en el borde
+        # no alterna entre estados cada frame
+        self.sleep_margin = margin + GameSettings.TILE_SIZE
+        
+        # Entidades despiertas (se actualizan cada frame)
+        self.awake: List['Entity'] = []
+        
+        # Entidades dormidas ordenadas por su X al dormirse
+        self._sleeping_keys: List[float] = []
+        self._sleeping: List['Entity'] = []
+        
+        # Ancho máximo visto, para acotar la búsqueda por X
+        self._max_width = 0.0
+    
+    def add(self, entity: 'Entity') -> None:
+        """
+        Registra una entidad. Empieza dormida hasta el próximo `update`.
+        
+        Args:
+            entity: La entidad a registrar
+        """
+        self._max_width = max(self._max_width, entity.width)
+        self._put_to_sleep(entity)
+    
+    def remove(self, entity: 'Entity') -> None:
+        """
+        Elimina una entidad de la región.
+        
+        Args:
+            entity: La entidad a eliminar
+        """
+        if not entity.asleep:
+            if entity in self.awake:
+                self.awake.remove(entity)
+            return
+        
+        # Buscar por clave y luego por identidad entre claves iguales
+        index = bisect.bisect_left(self._sleeping_keys, entity.x)
+        while index < len(self._sleeping) and self._sleeping[index] is not entity:
+            index += 1
+        if index == len(self._sleeping):
+            # La entidad se movió mientras dormía (p. ej. respawn)
+            index = next((i for i, other in enumerate(self._sleeping) if other is entity), -1)
+        if index >= 0:
+            del self._sleeping_keys[index]
+            del self._sleeping[index]
+        entity.asleep = False
+    
+    def set_margin(self, margin: float) -> None:
+        """
+        Cambia el margen de activación (el de dormir se ajusta igual que
+        en el constructor). Las entidades afectadas cambian en el próximo `update`.
+        
+        Args:
+            margin: Margen en pixels alrededor de la cámara
+        """
+        self.margin = margin
+        self.sleep_margin = margin + GameSettings.TILE_SIZE
+    
+    def _put_to_sleep(self, entity: 'Entity') -> None:
+        """Inserta una entidad en el índice de dormidas"""
+        index = bisect.bisect_right(self._sleeping_keys, entity.x)
+        self._sleeping_keys.insert(index, entity.x)
+        self._sleeping.insert(index, entity)
+        entity.asleep = True
+    
+    def update(self, camera: Camera) -> Tuple[List['Entity'], List['Entity']]:
+        """
+        Actualiza qué entidades están despiertas según la cámara.
+        
+        Args:
+            camera: Cámara del juego
+        
+        Returns:
+            Tupla (entidades despertadas, entidades dormidas) en este frame
+        """
+        # Dormir a las despiertas que salieron de la ventana
+        slept = []
+        still_awake = []
+        for entity in self.awake:
+            if camera.is_visible(entity.x, entity.y, entity.width, entity.height, self.sleep_margin):
+                still_awake.append(entity)
+            else:
+                slept.append(entity)
+                self._put_to_sleep(entity)
+        
+        # Despertar a las dormidas dentro de la ventana (búsqueda binaria por X)
+        window_left = camera.x - self.margin - self._max_width
+        window_right = camera.x + GameSettings.WINDOW_WIDTH + self.margin
+        start = bisect.bisect_left(self._sleeping_keys, window_left)
+        end = bisect.bisect_left(self._sleeping_keys, window_right)
+        
+        woken = []
+        if start < end:
+            kept_keys = []
+            kept = []
+            for key, entity in zip(self._sleeping_keys[start:end], self._sleeping[start:end]):
+                if camera.is_visible(entity.x, entity.y, entity.width, entity.height, self.margin):
+                    entity.asleep = False
+                    woken.append(entity)
+                else:
+                    kept_keys.append(key)
+                    kept.append(entity)
+            self._sleeping_keys[start:end] = kept_keys
+            self._sleeping[start:end] = kept
+        
+        still_awake.extend(woken)
+        self.awake = still_awake
+        return woken, slept
+    
+    def clear(self) -> None:
+        """Elimina todas las entidades de la región"""
+        for entity in self.awake + self._sleeping:
+            entity.asleep = False
+        self.awake.clear()
+        self._sleeping_keys.clear()
+        self._sleeping.clear()
+        self._max_width = 0.0
+    
+    @property
+    def sleeping(self) -> List['Entity']:
+        """Retorna las entidades dormidas en orden del índice (no modificar)"""
+        return self._sleeping
+    
+    @property
+    def sleeping_keys(self) -> List[float]:
+        """Retorna las claves X del índice de dormidas (no modificar)"""
+        return self._sleeping_keys
+    
+    def rebuild(self, awake: List['Entity'], sleeping: List['Entity'], sleeping_keys: List[float]) -> None:
+        """
+        Reemplaza el contenido de la región (por ejemplo, al restaurar un
+        snapshot) respetando el orden dado.
+        
+        Args:
+            awake: Entidades despiertas, en orden de actualización
+            sleeping: Entidades dormidas, ordenadas por clave
+            sleeping_keys: Clave X de cada entidad dormida
+        """
+        self.awake = list(awake)
+        self._sleeping = list(sleeping)
+        self._sleeping_keys = list(sleeping_keys)
+        
+        for entity in self.awake:
+            entity.asleep = False
+        for entity in self._sleeping:
+            entity.asleep = True
+        
+        # _max_width no se recalcula: ya acota a todas las entidades registradas
+    
+    @property
+    def sleeping_count(self) -> int:
+        """Retorna el número de entidades dormidas"""
+        return len(self._sleeping)
+    
+    def __len__(self) -> int:
+        """Retorna el número total de entidades registradas"""
+        return len(self.awake) + len(self._sleeping)
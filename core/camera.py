@@ -106,7 +106,7 @@ class Camera:
         """
         return (screen_x + self.x, screen_y + self.y)
     
-    def is_visible(self, x: float, y: float, width: float, height: float) -> bool:
+    def is_visible(self, x: float, y: float, width: float, height: float, margin: float = 0) -> bool:
         """
         Verifica si un rectángulo es visible en la pantalla.
         
@@ -115,14 +115,15 @@ class Camera:
             y: Posición Y del rectángulo
             width: Ancho del rectángulo
             height: Alto del rectángulo
+            margin: Margen extra alrededor de la pantalla
             
         Returns:
             True si el rectángulo es visible
         """
-        return (x + width > self.x and 
-                x < self.x + GameSettings.WINDOW_WIDTH and
-                y + height > self.y and 
-                y < self.y + GameSettings.WINDOW_HEIGHT)
+        return (x + width > self.x - margin and 
+                x < self.x + GameSettings.WINDOW_WIDTH + margin and
+                y + height > self.y - margin and 
+                y < self.y + GameSettings.WINDOW_HEIGHT + margin)
     
     def shake(self, intensity: float, duration: int) -> None:
         """
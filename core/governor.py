@@ -0,0 +1,154 @@
+"""
+Gobernador del presupuesto de frame.
+Mide el costo de cada frame (ticks de simulación + dibujo) y, si no entra
+en el presupuesto de 1 / FPS, degrada la calidad por niveles para que la
+simulación mantenga su velocidad; cuando vuelve a sobrar tiempo recupera
+los niveles de a uno.
+"""
+
+from typing import Callable, List, Optional, Tuple
+from config.settings import GameSettings
+
+class FrameGovernor:
+    """
+    Elige el nivel de degradación a partir del costo medio de los frames.
+    Cada nivel incluye los anteriores:
+    
+    - full: todo normal
+    - skip_draw: se dibuja uno de cada GOVERNOR_DRAW_INTERVAL frames
+    - near_enemies: los enemigos fuera de pantalla se duermen antes
+      (margen de activación reducido), así se simulan menos
+    
+    near_enemies no baja la frecuencia de actualización: cambia la
+    simulación, porque los enemigos dormidos no caminan ni caen. Sin el tope
+    `max_level=1`, la partida en una máquina lenta puede diferir de la misma
+    partida en una rápida.
+    """
+    
+    LEVELS = ('full', 'skip_draw', 'near_enemies')
+    
+    # Peso de cada frame nuevo en las medias móviles
+    SMOOTHING = 0.1
+    
+    def __init__(self, max_level: int = len(LEVELS) - 1,
+                 on_change: Optional[Callable[[str, str, float], None]] = None):
+        """
+        Inicializa el gobernador en el nivel 'full'.
+        
+        Args:
+            max_level: Nivel máximo permitido. Con grabación, reproducción o
+                red hay que usar 1: near_enemies cambia la simulación
+            on_change: Función llamada en cada cambio con
+                (nivel anterior, nivel nuevo, costo estimado en ms)
+        """
+        self.max_level = min(max_level, len(self.LEVELS) - 1)
+        self.on_change = on_change
+        self.budget = 1.0 / GameSettings.FPS
+        
+        self.level = 0
+        self.update_cost = 0.0  # Media móvil del costo de los ticks de un frame
+        self.draw_cost = 0.0  # Media móvil del costo de dibujar un frame
+        self._over_frames = 0  # Frames seguidos por encima del umbral de degradación
+        self._under_frames = 0  # Frames seguidos por debajo del umbral de recuperación
+        self._frame_index = 0
+        self._normal_margin = None  # Margen de activación original de la escena
+        
+        # Historial de cambios: (frame, nivel anterior, nivel nuevo, costo en ms)
+        self.changes: List[Tuple[int, str, str, float]] = []
+    
+    @property
+    def mode(self) -> str:
+        """Nombre del nivel actual"""
+        return self.LEVELS[self.level]
+    
+    @property
+    def draw_interval(self) -> int:
+        """Frames entre dibujos en el nivel actual"""
+        return GameSettings.GOVERNOR_DRAW_INTERVAL if self.level >= 1 else 1
+    
+    def should_draw(self) -> bool:
+        """
+        Indica si el frame actual debe dibujarse según el nivel.
+        
+        Returns:
+            True si hay que dibujar
+        """
+        return self._frame_index % self.draw_interval == 0
+    
+    def estimated_cost(self, level: Optional[int] = None) -> float:
+        """
+        Estima el costo medio de un frame en un nivel (por defecto, el actual):
+        los ticks siempre y el dibujo repartido entre los frames que se saltan.
+        
+        Args:
+            level: Nivel a estimar
+        
+        Returns:
+            Segundos por frame
+        """
+        level = self.level if level is None else level
+        interval = GameSettings.GOVERNOR_DRAW_INTERVAL if level >= 1 else 1
+        return self.update_cost + self.draw_cost / interval
+    
+    def record(self, update_seconds: float, draw_seconds: Optional[float]) -> None:
+        """
+        Registra el costo de un frame y cambia de nivel si corresponde.
+        
+        Args:
+            update_seconds: Tiempo de los ticks de simulación del frame
+            draw_seconds: Tiempo de dibujo, o None si el frame no se dibujó
+        """
+        self._frame_index += 1
+        self.update_cost += (update_seconds - self.update_cost) * self.SMOOTHING
+        if draw_seconds is not None:
+            self.draw_cost += (draw_seconds - self.draw_cost) * self.SMOOTHING
+        
+        # Degradar si el costo actual no entra en el presupuesto
+        if self.estimated_cost() > self.budget * GameSettings.GOVERNOR_DEGRADE_RATIO:
+            self._over_frames += 1
+            self._under_frames = 0
+            if self._over_frames >= GameSettings.GOVERNOR_DEGRADE_FRAMES and self.level < self.max_level:
+                self._set_level(self.level + 1)
+            return
+        self._over_frames = 0
+        
+        # Recuperar si el nivel anterior entraría con margen
+        if self.level > 0 and self.estimated_cost(self.level - 1) < self.budget * GameSettings.GOVERNOR_RECOVER_RATIO:
+            self._under_frames += 1
+            if self._under_frames >= GameSettings.GOVERNOR_RECOVER_FRAMES:
+                self._set_level(self.level - 1)
+        else:
+            self._under_frames = 0
+    
+    def _set_level(self, level: int) -> None:
+        """Cambia de nivel, reinicia los contadores y avisa del cambio"""
+        previous = self.mode
+        cost_ms = self.estimated_cost() * 1000
+        self.level = level
+        self._over_frames = 0
+        self._under_frames = 0
+        self.changes.append((self._frame_index, previous, self.mode, cost_ms))
+        if self.on_change is not None:
+            self.on_change(previous, self.mode, cost_ms)
+    
+    def apply(self, scene) -> None:
+        """
+        Aplica a una GameScene los ajustes del nivel actual.
+        
+        Args:
+            scene: Escena a ajustar
+        """
+        activation = scene.activation
+        if self._normal_margin is None:
+            self._normal_margin = activation.margin
+        margin = GameSettings.GOVERNOR_NEAR_MARGIN if self.level >= 2 else self._normal_margin
+        if activation.margin != margin:
+            activation.set_margin(margin)
+    
+    def reset(self) -> None:
+        """Vuelve al nivel 'full' y descarta las mediciones"""
+        self.level = 0
+        self.update_cost = 0.0
+        self.draw_cost = 0.0
+        self._over_frames = 0
+        self._under_frames = 0
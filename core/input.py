@@ -0,0 +1,213 @@
+"""
+Abstracción de la entrada del jugador.
+La lógica del juego lee botones lógicos desde un InputProvider, así la
+simulación puede alimentarse desde el teclado, desde un guion o desde
+código (bots, repeticiones) sin depender de una ventana de Pyxel.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+class Button:
+    """
+    Botones lógicos del juego, combinables como máscara de bits.
+    Son enteros simples: se consultan varias veces por tick.
+    """
+    NONE = 0
+    LEFT = 1 << 0
+    RIGHT = 1 << 1
+    JUMP = 1 << 2
+    RUN = 1 << 3
+    PAUSE = 1 << 4
+    DEBUG = 1 << 5
+    RESTART = 1 << 6
+    REWIND = 1 << 7
+    
+    # Botones que controlan a Mario (sin los de sistema)
+    GAMEPLAY = LEFT | RIGHT | JUMP | RUN
+
+class InputProvider(ABC):
+    """
+    Fuente de entrada del juego. Guarda la máscara de botones del tick
+    actual y la del anterior para detectar pulsaciones.
+    Las subclases implementan `_read`.
+    """
+    
+    def __init__(self):
+        """Inicializa el proveedor sin botones presionados"""
+        self.buttons = Button.NONE
+        self.previous = Button.NONE
+    
+    def poll(self) -> None:
+        """Lee la entrada de un nuevo tick de simulación"""
+        self.previous = self.buttons
+        self.buttons = self._read()
+    
+    @abstractmethod
+    def _read(self) -> int:
+        """
+        Obtiene la máscara de botones del tick actual.
+        Debe ser implementado por las clases hijas.
+        
+        Returns:
+            Máscara de bits de Button
+        """
+        pass
+    
+    def is_held(self, button: int) -> bool:
+        """
+        Verifica si un botón está presionado en este tick.
+        
+        Args:
+            button: Botón a consultar
+        
+        Returns:
+            True si está presionado
+        """
+        return bool(self.buttons & button)
+    
+    def is_pressed(self, button: int) -> bool:
+        """
+        Verifica si un botón se presionó en este tick (no estaba en el anterior).
+        
+        Args:
+            button: Botón a consultar
+        
+        Returns:
+            True si se acaba de presionar
+        """
+        return bool(self.buttons & button and not self.previous & button)
+    
+    def reset(self) -> None:
+        """Olvida el estado de los botones"""
+        self.buttons = Button.NONE
+        self.previous = Button.NONE
+
+# Teclas de Pyxel asociadas a cada botón lógico
+DEFAULT_KEY_BINDINGS: Dict[int, Sequence[str]] = {
+    Button.LEFT: ("LEFT", "A"),
+    Button.RIGHT: ("RIGHT", "D"),
+    Button.JUMP: ("SPACE", "UP", "W"),
+    Button.RUN: ("Z", "X"),
+    Button.PAUSE: ("P",),
+    Button.DEBUG: ("F1",),
+    Button.RESTART: ("R",),
+    Button.REWIND: ("BACKSPACE",),
+}
+
+class PyxelInput(InputProvider):
+    """
+    Entrada desde el teclado usando Pyxel (requiere ventana inicializada).
+    Pyxel se importa al crearla, así el resto del módulo funciona sin él.
+    """
+    
+    def __init__(self, bindings: Dict[int, Sequence[str]] = None):
+        """
+        Inicializa la entrada por teclado.
+        
+        Args:
+            bindings: Botón -> nombres de teclas de Pyxel (sin prefijo KEY_)
+        """
+        import pyxel
+        super().__init__()
+        self.bindings = bindings or DEFAULT_KEY_BINDINGS
+        
+        # Resolver las constantes de teclas una sola vez
+        self._keys: List[Tuple[int, List[int]]] = [
+            (button, [getattr(pyxel, f"KEY_{name}") for name in names])
+            for button, names in self.bindings.items()
+        ]
+    
+    def _read(self) -> int:
+        """Lee el estado del teclado"""
+        import pyxel
+        mask = 0
+        for button, keys in self._keys:
+            for key in keys:
+                if pyxel.btn(key):
+                    mask |= button
+                    break
+        return mask
+
+class ScriptedInput(InputProvider):
+    """
+    Entrada predefinida: una máscara de botones por tick.
+    Al terminar el guion no hay botones presionados (o vuelve a empezar).
+    """
+    
+    def __init__(self, frames: Iterable[int], loop: bool = False):
+        """
+        Inicializa la entrada por guion.
+        
+        Args:
+            frames: Máscaras de botones, una por tick
+            loop: True para repetir el guion al terminar
+        """
+        super().__init__()
+        self.frames = [int(mask) for mask in frames]
+        self.loop = loop
+        self.position = 0
+    
+    @classmethod
+    def from_segments(cls, segments: Iterable[Tuple[int, int]], loop: bool = False) -> 'ScriptedInput':
+        """
+        Crea un guion a partir de tramos (máscara, cantidad de ticks).
+        
+        Args:
+            segments: Tramos de botones mantenidos durante N ticks
+            loop: True para repetir el guion al terminar
+        
+        Returns:
+            Entrada por guion equivalente
+        """
+        frames = []
+        for mask, ticks in segments:
+            frames.extend([int(mask)] * int(ticks))
+        return cls(frames, loop)
+    
+    @property
+    def finished(self) -> bool:
+        """Retorna True si ya se consumió todo el guion"""
+        return not self.loop and self.position >= len(self.frames)
+    
+    def _read(self) -> int:
+        """Retorna la máscara del tick actual del guion"""
+        if self.position >= len(self.frames):
+            if not self.loop or not self.frames:
+                return Button.NONE
+            self.position = 0
+        
+        mask = self.frames[self.position]
+        self.position += 1
+        return mask
+    
+    def reset(self) -> None:
+        """Vuelve al inicio del guion"""
+        super().reset()
+        self.position = 0
+
+class ManualInput(InputProvider):
+    """Entrada controlada desde código (bots, agentes, red)"""
+    
+    def __init__(self):
+        """Inicializa la entrada sin botones"""
+        super().__init__()
+        self.next_buttons = Button.NONE
+    
+    def set(self, buttons: int) -> None:
+        """
+        Establece los botones que se leerán en el próximo `poll`.
+        
+        Args:
+            buttons: Máscara de bits de Button
+        """
+        self.next_buttons = int(buttons)
+    
+    def _read(self) -> int:
+        """Retorna los botones establecidos con `set`"""
+        return self.next_buttons
+    
+    def reset(self) -> None:
+        """Olvida el estado de los botones"""
+        super().reset()
+        self.next_buttons = Button.NONE
@@ -0,0 +1,223 @@
+"""
+Contabilidad de memoria.
+Mide el tamaño real de las estructuras del juego recorriendo sus objetos
+con `sys.getsizeof` (sin contar dos veces lo compartido) y agrupa la
+memoria reservada por `tracemalloc` según el paquete del juego que la
+reservó, para detectar crecimiento en sesiones largas.
+"""
+
+import os
+import sys
+import tracemalloc
+import types
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Tipos que no se recorren: pertenecen al programa, no a los datos
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                  types.MethodType, types.CodeType, types.FrameType)
+
+# Enteros que CPython comparte entre todos sus usos (no ocupan memoria propia)
+_SMALL_INT_RANGE = range(-5, 257)
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Calcula los bytes de un objeto y de todo lo que contiene.
+    
+    Args:
+        obj: Objeto a medir
+        seen: Ids de objetos ya contados; compartirlo entre llamadas evita
+            contar dos veces los objetos referenciados desde varios lugares
+    
+    Returns:
+        Tamaño en bytes
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or current is None or isinstance(current, (bool, *_SKIPPED_TYPES)):
+            continue
+        if type(current) is int and current in _SMALL_INT_RANGE:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        
+        # Contenido (los arrays de NumPy ya incluyen sus datos en getsizeof)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, bytearray, int, float)):
+            continue
+        else:
+            attributes = getattr(current, '__dict__', None)
+            if attributes is not None:
+                stack.append(attributes)
+            for name in getattr(type(current), '__slots__', ()):
+                stack.append(getattr(current, name, None))
+    return total
+
+def sizes_by_class(objects: Iterable[Any], seen: Set[int]) -> Dict[str, int]:
+    """
+    Agrupa el tamaño de varios objetos por el nombre de su clase.
+    
+    Args:
+        objects: Objetos a medir
+        seen: Ids de objetos ya contados (se actualiza)
+    
+    Returns:
+        Diccionario clase -> bytes
+    """
+    sizes: Dict[str, int] = defaultdict(int)
+    for obj in objects:
+        sizes[type(obj).__name__] += deep_sizeof(obj, seen)
+    return dict(sizes)
+
+def scene_memory(scene) -> Dict[str, Dict[str, int]]:
+    """
+    Desglosa la memoria de una GameScene por subsistema.
+    El orden importa: cada objeto se cuenta en el primer subsistema que lo
+    alcanza (los bloques en `level` aunque también estén en `entities`, los
+    enemigos en `entities` y no en las listas de activación).
+    
+    Args:
+        scene: Escena a medir
+    
+    Returns:
+        Diccionario subsistema -> (parte -> bytes)
+    """
+    from assets.sprites import sprite_manager
+    
+    seen: Set[int] = set()
+    report: Dict[str, Dict[str, int]] = {}
+    
+    report['sprites'] = {name: deep_sizeof(sprite_set, seen)
+                         for name, sprite_set in sprite_manager.loaded_sprite_sets.items()}
+    report['sprites']['manager'] = deep_sizeof(sprite_manager, seen)
+    
+    report['level'] = {
+        'platforms': deep_sizeof(scene.platforms, seen),
+        'collision_geometry': deep_sizeof(scene.collision_geometry, seen),
+        'platform_hash': deep_sizeof(scene.platform_hash, seen),
+        'tilemap': deep_sizeof(scene.tilemap, seen),
+    }
+    
+    # Entidades que se simulan (los enemigos de todo el nivel, aunque duerman).
+    # Los enemigos apuntan al buffer de cuerpos: se lo excluye para contarlo
+    # en `simulation`
+    seen.add(id(scene.enemy_bodies))
+    report['entities'] = sizes_by_class([*scene.players, *scene._enemy_registry, *scene.enemies,
+                                         *scene.entities], seen)
+    seen.discard(id(scene.enemy_bodies))
+    
+    report['simulation'] = {
+        'enemy_bodies': deep_sizeof(scene.enemy_bodies, seen),
+        'broadphase': deep_sizeof(scene.broadphase, seen),
+        'activation': deep_sizeof(scene.activation, seen),
+        'snapshot_layouts': deep_sizeof([scene._player_block, scene._enemy_blocks, scene._enemy_layouts], seen),
+    }
+    
+    report['rewind'] = {'buffer': deep_sizeof(scene.rewind, seen)} if scene.rewind is not None else {}
+    return report
+
+def summarize_report(report: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    """
+    Suma las partes de cada subsistema de un desglose.
+    
+    Args:
+        report: Resultado de `scene_memory`
+    
+    Returns:
+        Diccionario subsistema -> bytes
+    """
+    return {subsystem: sum(parts.values()) for subsystem, parts in report.items()}
+
+class MemoryTracker:
+    """
+    Memoria reservada por Python según `tracemalloc`, agrupada por paquete
+    del juego (el resto va a "python"). Guarda una línea base para medir
+    cuánto creció la memoria desde entonces.
+    """
+    
+    def __init__(self, root: Optional[str] = None, frames: int = 1):
+        """
+        Inicializa el tracker.
+        
+        Args:
+            root: Directorio raíz del juego (por defecto, el del paquete)
+            frames: Cuadros de traceback que guarda tracemalloc
+        """
+        self.root = os.path.abspath(root or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.frames = frames
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+    
+    @property
+    def running(self) -> bool:
+        """True si tracemalloc está registrando"""
+        return tracemalloc.is_tracing()
+    
+    def start(self) -> None:
+        """Empieza a registrar (si no lo estaba) y fija la línea base"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self._baseline = self._take_snapshot()
+    
+    def stop(self) -> None:
+        """Deja de registrar"""
+        tracemalloc.stop()
+        self._baseline = None
+    
+    def current(self) -> Dict[str, int]:
+        """
+        Retorna la memoria registrada en este momento.
+        
+        Returns:
+            Diccionario con 'current' y 'peak' en bytes
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return {'current': current, 'peak': peak}
+    
+    def by_package(self) -> Dict[str, int]:
+        """
+        Agrupa la memoria viva por el paquete que la reservó.
+        
+        Returns:
+            Diccionario paquete -> bytes, de mayor a menor
+        """
+        sizes: Dict[str, int] = defaultdict(int)
+        for stat in self._take_snapshot().statistics('filename'):
+            sizes[self._package(stat.traceback[0].filename)] += stat.size
+        return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+    
+    def growth(self) -> Dict[str, int]:
+        """
+        Calcula cuánto creció la memoria de cada paquete desde `start`.
+        
+        Returns:
+            Diccionario paquete -> bytes de diferencia, de mayor a menor
+        """
+        if self._baseline is None:
+            return {}
+        sizes: Dict[str, int] = defaultdict(int)
+        for stat in self._take_snapshot().compare_to(self._baseline, 'filename'):
+            sizes[self._package(stat.traceback[0].filename)] += stat.size_diff
+        return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+    
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Toma un snapshot sin las reservas del propio tracemalloc"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+    
+    def _package(self, filename: str) -> str:
+        """Retorna el paquete del juego de un archivo, o 'python' si es externo"""
+        if not os.path.isabs(filename) or not filename.startswith(self.root + os.sep):
+            return 'python'  # Biblioteca estándar, dependencias o código generado ("<string>")
+        relative = os.path.relpath(filename, self.root)
+        head = relative.split(os.sep, 1)[0]
+        return head[:-3] if head.endswith('.py') else head
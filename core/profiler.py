@@ -0,0 +1,124 @@
+"""
+Profiler de frames en vivo.
+Acumula el tiempo de cada subsistema durante un frame (que puede incluir
+varios ticks de simulación) y guarda los últimos frames en buffers
+circulares de NumPy para calcular percentiles y dibujar el gráfico del
+overlay de debug.
+"""
+
+import time
+import numpy as np
+from typing import Callable, Dict, Tuple
+from config.settings import GameSettings
+
+class FrameProfiler:
+    """
+    Tiempos por subsistema de los últimos frames.
+    Se mide por vueltas: `mark` fija el inicio y cada `lap` suma el tiempo
+    transcurrido desde la marca anterior a un subsistema.
+    """
+    
+    # Subsistemas medidos, en el orden en que se muestran
+    SECTIONS = ('input', 'mario', 'enemies', 'collisions', 'entities', 'camera', 'rewind', 'draw', 'ui')
+    
+    def __init__(self, capacity: int = GameSettings.PROFILER_HISTORY_FRAMES,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Inicializa el profiler.
+        
+        Args:
+            capacity: Frames guardados en el historial
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.capacity = capacity
+        self.clock = clock
+        
+        # Historial circular: una columna por frame
+        self.section_times = np.zeros((len(self.SECTIONS), capacity))
+        self.frame_times = np.zeros(capacity)  # Trabajo de update + draw
+        self.frame_intervals = np.zeros(capacity)  # Tiempo real entre frames
+        self.index = 0  # Próxima columna a escribir
+        self.count = 0  # Frames registrados (hasta `capacity`)
+        
+        self._section_index: Dict[str, int] = {name: index for index, name in enumerate(self.SECTIONS)}
+        self._current = [0.0] * len(self.SECTIONS)
+        self._frame_start = None
+        self._last = clock()
+    
+    def begin_frame(self) -> None:
+        """Empieza a medir un frame nuevo"""
+        now = self.clock()
+        if self._frame_start is not None:
+            self.frame_intervals[self.index] = now - self._frame_start
+        self._frame_start = now
+        self._last = now
+        self._current = [0.0] * len(self.SECTIONS)
+    
+    def end_frame(self) -> None:
+        """Cierra el frame y lo guarda en el historial"""
+        if self._frame_start is None:
+            return
+        index = self.index
+        self.frame_times[index] = self.clock() - self._frame_start
+        self.section_times[:, index] = self._current
+        self.index = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def mark(self) -> None:
+        """Fija el inicio de la próxima vuelta"""
+        self._last = self.clock()
+    
+    def lap(self, section: str) -> None:
+        """
+        Suma al subsistema el tiempo transcurrido desde la marca anterior.
+        
+        Args:
+            section: Nombre del subsistema (uno de SECTIONS)
+        """
+        now = self.clock()
+        self._current[self._section_index[section]] += now - self._last
+        self._last = now
+    
+    def history(self) -> np.ndarray:
+        """
+        Tiempos de frame registrados, del más antiguo al más reciente.
+        
+        Returns:
+            Array de duraciones en milisegundos
+        """
+        if self.count < self.capacity:
+            return self.frame_times[:self.count] * 1000
+        return np.roll(self.frame_times, -self.index) * 1000
+    
+    def percentiles(self) -> Tuple[float, float, float]:
+        """
+        Calcula los percentiles del tiempo de frame en el historial.
+        
+        Returns:
+            Tupla (p50, p95, p99) en milisegundos
+        """
+        if self.count == 0:
+            return 0.0, 0.0, 0.0
+        p50, p95, p99 = np.percentile(self.frame_times[:self.count] * 1000, (50, 95, 99))
+        return float(p50), float(p95), float(p99)
+    
+    def section_averages(self) -> Dict[str, float]:
+        """
+        Calcula el tiempo medio por frame de cada subsistema.
+        
+        Returns:
+            Diccionario subsistema -> milisegundos
+        """
+        if self.count == 0:
+            return {name: 0.0 for name in self.SECTIONS}
+        means = self.section_times[:, :self.count].mean(axis=1) * 1000
+        return {name: float(mean) for name, mean in zip(self.SECTIONS, means)}
+    
+    def reset(self) -> None:
+        """Descarta el historial"""
+        self.section_times.fill(0.0)
+        self.frame_times.fill(0.0)
+        self.frame_intervals.fill(0.0)
+        self.index = 0
+        self.count = 0
+        self._frame_start = None
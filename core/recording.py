@@ -0,0 +1,218 @@
+"""
+Grabación y reproducción de la entrada del jugador.
+La entrada se guarda tick a tick como máscaras de Button comprimidas por
+longitud de corrida (RLE) con enteros de longitud variable (varint), así
+una partida larga ocupa unos pocos KB y se reproduce de forma determinista.
+"""
+
+import zlib
+from typing import List, Tuple
+from core.input import InputProvider
+
+# Formato: MAGIC, versión (1 byte), varint de ticks totales y luego el
+# flujo zlib de pares varint (máscara, ticks de la corrida)
+RECORDING_MAGIC = b"MBRC"
+RECORDING_VERSION = 1
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Agrega un entero no negativo en formato varint (7 bits por byte)"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    Lee un varint.
+    
+    Returns:
+        Tupla (valor, posición siguiente)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+def encode_runs(runs: List[Tuple[int, int]]) -> bytes:
+    """
+    Serializa corridas (máscara, ticks) en el formato de grabación.
+    
+    Args:
+        runs: Lista de corridas
+    
+    Returns:
+        Bytes de la grabación
+    """
+    body = bytearray()
+    total = 0
+    for mask, length in runs:
+        _write_varint(body, mask)
+        _write_varint(body, length)
+        total += length
+    
+    out = bytearray(RECORDING_MAGIC)
+    out.append(RECORDING_VERSION)
+    _write_varint(out, total)
+    out += zlib.compress(bytes(body), 9)
+    return bytes(out)
+
+def decode_runs(data: bytes) -> List[Tuple[int, int]]:
+    """
+    Lee las corridas (máscara, ticks) de una grabación.
+    
+    Args:
+        data: Bytes de la grabación
+    
+    Returns:
+        Lista de corridas
+    """
+    if data[:len(RECORDING_MAGIC)] != RECORDING_MAGIC:
+        raise ValueError("No es una grabación de entrada")
+    version = data[len(RECORDING_MAGIC)]
+    if version != RECORDING_VERSION:
+        raise ValueError(f"Versión de grabación no soportada: {version}")
+    
+    total, position = _read_varint(data, len(RECORDING_MAGIC) + 1)
+    body = zlib.decompress(data[position:])
+    
+    runs = []
+    position = 0
+    while position < len(body):
+        mask, position = _read_varint(body, position)
+        length, position = _read_varint(body, position)
+        runs.append((mask, length))
+    
+    if sum(length for _, length in runs) != total:
+        raise ValueError("Grabación corrupta: el total de ticks no coincide")
+    return runs
+
+class InputRecorder(InputProvider):
+    """
+    Envuelve a otra fuente de entrada y registra cada tick leído.
+    Se usa en lugar de la fuente original (por ejemplo, de PyxelInput).
+    """
+    
+    def __init__(self, source: InputProvider):
+        """
+        Inicializa el grabador.
+        
+        Args:
+            source: Fuente de entrada real
+        """
+        super().__init__()
+        self.source = source
+        self.runs: List[Tuple[int, int]] = []
+        self._mask = 0
+        self._length = 0
+    
+    def _read(self) -> int:
+        """Lee la fuente real y registra su máscara"""
+        self.source.poll()
+        mask = self.source.buttons
+        
+        if mask == self._mask:
+            self._length += 1
+        else:
+            if self._length:
+                self.runs.append((self._mask, self._length))
+            self._mask = mask
+            self._length = 1
+        return mask
+    
+    @property
+    def frame_count(self) -> int:
+        """Retorna el número de ticks grabados"""
+        return sum(length for _, length in self.runs) + self._length
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa la grabación (incluida la corrida en curso).
+        
+        Returns:
+            Bytes de la grabación
+        """
+        runs = self.runs + ([(self._mask, self._length)] if self._length else [])
+        return encode_runs(runs)
+    
+    def save(self, path: str) -> None:
+        """
+        Guarda la grabación en un archivo.
+        
+        Args:
+            path: Ruta del archivo
+        """
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+class InputReplay(InputProvider):
+    """Reproduce una grabación tick a tick"""
+    
+    def __init__(self, runs: List[Tuple[int, int]]):
+        """
+        Inicializa la reproducción.
+        
+        Args:
+            runs: Corridas (máscara, ticks) de la grabación
+        """
+        super().__init__()
+        self.runs = runs
+        self.frame_count = sum(length for _, length in runs)
+        self.position = 0  # Ticks ya reproducidos
+        self._run_index = 0
+        self._run_left = runs[0][1] if runs else 0
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputReplay':
+        """
+        Crea una reproducción a partir de los bytes de una grabación.
+        
+        Args:
+            data: Bytes de la grabación
+        
+        Returns:
+            La reproducción
+        """
+        return cls(decode_runs(data))
+    
+    @classmethod
+    def load(cls, path: str) -> 'InputReplay':
+        """
+        Carga una grabación desde un archivo.
+        
+        Args:
+            path: Ruta del archivo
+        
+        Returns:
+            La reproducción
+        """
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+    
+    @property
+    def finished(self) -> bool:
+        """Retorna True si ya se reprodujo toda la grabación"""
+        return self.position >= self.frame_count
+    
+    def _read(self) -> int:
+        """Retorna la máscara grabada del tick actual"""
+        while self._run_left == 0:
+            self._run_index += 1
+            if self._run_index >= len(self.runs):
+                return 0
+            self._run_left = self.runs[self._run_index][1]
+        
+        self._run_left -= 1
+        self.position += 1
+        return self.runs[self._run_index][0]
+    
+    def reset(self) -> None:
+        """Vuelve al inicio de la grabación"""
+        super().reset()
+        self.position = 0
+        self._run_index = 0
+        self._run_left = self.runs[0][1] if self.runs else 0
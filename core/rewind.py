@@ -0,0 +1,117 @@
+"""
+Rebobinado de la partida.
+Guarda los últimos segundos de snapshots de la escena en un buffer
+circular. Cada cierto número de ticks se guarda un snapshot completo
+(keyframe); el resto se guarda como XOR contra ese keyframe comprimido con
+zlib, así la mayoría de los bytes son cero y cada tick ocupa muy poco.
+"""
+
+import zlib
+import numpy as np
+from collections import deque
+from typing import Deque, Optional, Tuple
+from config.settings import GameSettings
+
+class RewindBuffer:
+    """
+    Buffer circular de snapshots con compresión delta.
+    Al llenarse descarta los más antiguos; `pop` devuelve los snapshots del
+    más reciente al más antiguo para reproducir el tiempo hacia atrás.
+    """
+    
+    # Nivel de zlib: los deltas son casi todo ceros y el más rápido alcanza
+    COMPRESSION_LEVEL = 1
+    
+    def __init__(self, capacity: int = GameSettings.REWIND_SECONDS * GameSettings.FPS,
+                 keyframe_interval: int = GameSettings.REWIND_KEYFRAME_INTERVAL):
+        """
+        Inicializa el buffer.
+        
+        Args:
+            capacity: Snapshots guardados como máximo (ticks de rebobinado)
+            keyframe_interval: Ticks entre keyframes
+        """
+        self.capacity = capacity
+        self.keyframe_interval = max(1, keyframe_interval)
+        
+        # Cada entrada es (keyframe, delta comprimido o None si es el keyframe).
+        # Los deltas referencian a su keyframe, así que este sigue vivo
+        # mientras quede alguno aunque su propia entrada se haya descartado
+        self._entries: Deque[Tuple[bytes, Optional[bytes]]] = deque(maxlen=capacity)
+        self._keyframe: Optional[bytes] = None
+        self._keyframe_array: Optional[np.ndarray] = None
+        self._since_keyframe = 0
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de snapshots guardados"""
+        return len(self._entries)
+    
+    @property
+    def seconds(self) -> float:
+        """Retorna los segundos de juego que se pueden rebobinar"""
+        return len(self._entries) / GameSettings.FPS
+    
+    def push(self, snapshot: bytes) -> None:
+        """
+        Guarda el snapshot de un tick.
+        
+        Args:
+            snapshot: Bytes de `GameScene.snapshot`
+        """
+        # Keyframe nuevo por intervalo o si cambió el tamaño del snapshot
+        # (se crearon enemigos o se reconstruyó el nivel)
+        keyframe = self._keyframe
+        if (keyframe is None or self._since_keyframe >= self.keyframe_interval
+                or len(snapshot) != len(keyframe)):
+            self._keyframe = snapshot
+            self._keyframe_array = np.frombuffer(snapshot, dtype=np.uint8)
+            self._since_keyframe = 1
+            self._entries.append((snapshot, None))
+            return
+        
+        delta = np.bitwise_xor(np.frombuffer(snapshot, dtype=np.uint8), self._keyframe_array)
+        self._entries.append((keyframe, zlib.compress(delta.tobytes(), self.COMPRESSION_LEVEL)))
+        self._since_keyframe += 1
+    
+    def pop(self) -> Optional[bytes]:
+        """
+        Quita y devuelve el snapshot más reciente.
+        
+        Returns:
+            Bytes del snapshot, o None si el buffer está vacío
+        """
+        if not self._entries:
+            return None
+        
+        # Lo próximo que se guarde parte de un keyframe nuevo
+        self._keyframe = None
+        self._keyframe_array = None
+        
+        keyframe, delta = self._entries.pop()
+        if delta is None:
+            return keyframe
+        
+        delta = np.frombuffer(zlib.decompress(delta), dtype=np.uint8)
+        return np.bitwise_xor(delta, np.frombuffer(keyframe, dtype=np.uint8)).tobytes()
+    
+    def clear(self) -> None:
+        """Descarta todos los snapshots"""
+        self._entries.clear()
+        self._keyframe = None
+        self._keyframe_array = None
+        self._since_keyframe = 0
+    
+    def get_memory_usage(self) -> int:
+        """
+        Calcula los bytes de datos guardados (keyframes y deltas).
+        
+        Returns:
+            Tamaño aproximado en bytes
+        """
+        keyframes = {}
+        total = 0
+        for keyframe, delta in self._entries:
+            keyframes[id(keyframe)] = len(keyframe)
+            if delta is not None:
+                total += len(delta)
+        return total + sum(keyframes.values())
@@ -0,0 +1,147 @@
+"""
+Serialización binaria del estado de las entidades.
+Cada clase declara en STATE_FIELDS qué atributos forman su estado y con
+qué formato de `struct`; a partir de eso se empaqueta en un buffer plano
+sin copiar grafos de objetos.
+"""
+
+import struct
+from operator import attrgetter
+from typing import Any, Dict, List, Sequence, Tuple
+
+class StateLayout:
+    """
+    Formato binario fijo para un conjunto de atributos, opcionalmente
+    precedido por valores extra (prefijo) que aporta quien serializa.
+    Los atributos deben ser atributos de instancia simples: se restauran
+    directamente sobre `__dict__`, sin pasar por descriptores.
+    """
+    
+    def __init__(self, fields: Sequence[Tuple[str, str]], prefix: str = ''):
+        """
+        Inicializa el formato.
+        
+        Args:
+            fields: Pares (nombre del atributo, código de formato de struct)
+            prefix: Códigos de struct de los valores extra del inicio
+        """
+        self.names = tuple(name for name, _ in fields)
+        self.codes = prefix + ''.join(code for _, code in fields)
+        self.struct = struct.Struct('<' + self.codes)
+        self.size = self.struct.size
+        self.prefix_count = len(prefix)
+        self.getter = attrgetter(*self.names)
+    
+    def pack_into(self, buffer: bytearray, offset: int, obj: Any, *prefix: Any) -> None:
+        """
+        Escribe el estado de un objeto en el buffer.
+        
+        Args:
+            buffer: Buffer de destino
+            offset: Posición de escritura
+            obj: Objeto a serializar
+            *prefix: Valores extra del inicio
+        """
+        values = self.getter(obj)
+        if len(self.names) == 1:
+            values = (values,)
+        self.struct.pack_into(buffer, offset, *prefix, *values)
+    
+    def unpack_into(self, buffer: bytes, offset: int, obj: Any) -> Tuple[Any, ...]:
+        """
+        Restaura el estado de un objeto desde el buffer.
+        
+        Args:
+            buffer: Buffer de origen
+            offset: Posición de lectura
+            obj: Objeto a restaurar
+        
+        Returns:
+            Valores extra del inicio
+        """
+        values = self.struct.unpack_from(buffer, offset)
+        count = self.prefix_count
+        obj.__dict__.update(zip(self.names, values[count:]))
+        return values[:count]
+
+class RecordBlock:
+    """
+    Secuencia de registros (uno por objeto, cada uno con su StateLayout)
+    empaquetada con un solo struct: una llamada a `pack_into` y otra a
+    `unpack_from` para todos los objetos en lugar de una por objeto.
+    """
+    
+    def __init__(self, layouts: Sequence[StateLayout]):
+        """
+        Inicializa el bloque.
+        
+        Args:
+            layouts: Formato de cada registro, en orden
+        """
+        self.layouts = list(layouts)
+        self.struct = struct.Struct('<' + ''.join(layout.codes for layout in self.layouts))
+        self.size = self.struct.size
+    
+    def pack_into(self, buffer: bytearray, offset: int, objects: Sequence[Any],
+                  prefixes: Sequence[Tuple[Any, ...]]) -> None:
+        """
+        Escribe los registros de todos los objetos.
+        
+        Args:
+            buffer: Buffer de destino
+            offset: Posición de escritura
+            objects: Objetos, uno por registro
+            prefixes: Valores extra de cada registro
+        """
+        values = []
+        extend = values.extend
+        for obj, layout, prefix in zip(objects, self.layouts, prefixes):
+            extend(prefix)
+            if len(layout.names) == 1:
+                values.append(layout.getter(obj))
+            else:
+                extend(layout.getter(obj))
+        self.struct.pack_into(buffer, offset, *values)
+    
+    def unpack_into(self, buffer: bytes, offset: int, objects: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        """
+        Restaura todos los objetos desde el buffer.
+        
+        Args:
+            buffer: Buffer de origen
+            offset: Posición de lectura
+            objects: Objetos, uno por registro
+        
+        Returns:
+            Valores extra de cada registro
+        """
+        values = self.struct.unpack_from(buffer, offset)
+        prefixes = []
+        position = 0
+        for obj, layout in zip(objects, self.layouts):
+            start = position + layout.prefix_count
+            end = start + len(layout.names)
+            prefixes.append(values[position:start])
+            obj.__dict__.update(zip(layout.names, values[start:end]))
+            position = end
+        return prefixes
+
+# Formatos ya construidos por clase y prefijo
+_layouts: Dict[Tuple[type, str], StateLayout] = {}
+
+def layout_for(cls: type, prefix: str = '') -> StateLayout:
+    """
+    Obtiene el formato binario de una clase a partir de su STATE_FIELDS.
+    
+    Args:
+        cls: Clase con atributo STATE_FIELDS
+        prefix: Códigos de struct de los valores extra del inicio
+    
+    Returns:
+        Formato de estado de la clase
+    """
+    key = (cls, prefix)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = StateLayout(cls.STATE_FIELDS, prefix)
+    return layout
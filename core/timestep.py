@@ -0,0 +1,103 @@
+"""
+Reloj de paso fijo para la simulación.
+Separa la velocidad del juego de la velocidad de renderizado: cada frame
+dibujado puede ejecutar cero, uno o varios ticks de simulación.
+"""
+
+import time
+from typing import Callable
+from config.settings import GameSettings
+
+class FixedTimestep:
+    """
+    Acumulador de tiempo que calcula cuántos ticks de simulación
+    corresponden a cada frame, con límite de recuperación (catch-up)
+    y modo de avance rápido.
+    """
+    
+    def __init__(self, tick_rate: int = GameSettings.FPS,
+                 max_ticks_per_frame: int = GameSettings.MAX_CATCH_UP_TICKS,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Inicializa el reloj.
+        
+        Args:
+            tick_rate: Ticks de simulación por segundo
+            max_ticks_per_frame: Máximo de ticks a recuperar en un frame
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.tick_duration = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = clock
+        
+        self.accumulator = 0.0
+        self.fast_forward = 1
+        self._last_time = None
+        self._frame_index = 0
+        
+        # Estadísticas
+        self.total_ticks = 0
+        self.dropped_ticks = 0  # Ticks descartados por el límite de catch-up
+    
+    def set_fast_forward(self, multiplier: int) -> None:
+        """
+        Establece el multiplicador de velocidad de la simulación.
+        
+        Args:
+            multiplier: 1 para velocidad normal, N para avanzar N veces más rápido
+        """
+        self.fast_forward = max(1, int(multiplier))
+    
+    @property
+    def is_fast_forward(self) -> bool:
+        """Retorna True si el avance rápido está activo"""
+        return self.fast_forward > 1
+    
+    def advance(self) -> int:
+        """
+        Registra el paso de un frame y calcula los ticks a simular.
+        
+        Returns:
+            Número de ticks de simulación a ejecutar en este frame
+        """
+        now = self.clock()
+        if self._last_time is None:
+            elapsed = self.tick_duration
+        else:
+            elapsed = now - self._last_time
+        self._last_time = now
+        self._frame_index += 1
+        
+        self.accumulator += elapsed * self.fast_forward
+        # El épsilon evita perder un tick por errores de redondeo
+        ticks = int(self.accumulator / self.tick_duration + 1e-9)
+        
+        # Limitar el trabajo de recuperación tras un frame lento
+        max_ticks = self.max_ticks_per_frame * self.fast_forward
+        if ticks > max_ticks:
+            self.dropped_ticks += ticks - max_ticks
+            ticks = max_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_duration
+        
+        self.total_ticks += ticks
+        return ticks
+    
+    def should_draw(self) -> bool:
+        """
+        Indica si el frame actual debe dibujarse.
+        En avance rápido solo se dibuja uno de cada
+        FAST_FORWARD_DRAW_INTERVAL frames.
+        
+        Returns:
+            True si hay que dibujar
+        """
+        if not self.is_fast_forward:
+            return True
+        return self._frame_index % GameSettings.FAST_FORWARD_DRAW_INTERVAL == 0
+    
+    def reset(self) -> None:
+        """Descarta el tiempo acumulado (por ejemplo, tras una pausa larga)"""
+        self.accumulator = 0.0
+        self._last_time = None
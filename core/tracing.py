@@ -0,0 +1,213 @@
+"""
+Trazas de zonas de tiempo.
+Las zonas (context manager `zone` o decorador `traced`) se registran en un
+buffer circular preasignado y se exportan en formato Chrome Trace Event
+(JSON), que se abre en Perfetto (ui.perfetto.dev) o en chrome://tracing.
+
+Deshabilitado, `zone` retorna un context manager vacío compartido y
+`traced` solo agrega una comprobación de un atributo, así los ganchos
+pueden quedar en el código sin costo apreciable.
+"""
+
+import functools
+import json
+import os
+import time
+from array import array
+from typing import Callable, Dict, List, Union
+from config.settings import GameSettings
+
+class _NullZone:
+    """Zona vacía que se usa cuando el tracer está deshabilitado"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_ZONE = _NullZone()
+
+class _Zone:
+    """Zona con nombre; se reutiliza en cada entrada (el inicio va en una pila)"""
+    __slots__ = ('tracer', 'name_id')
+    
+    def __init__(self, tracer: 'Tracer', name_id: int):
+        self.tracer = tracer
+        self.name_id = name_id
+    
+    def __enter__(self):
+        self.tracer._starts.append(time.perf_counter_ns())
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        tracer = self.tracer
+        end = time.perf_counter_ns()
+        tracer._record(self.name_id, tracer._starts.pop(), end)
+        return False
+
+class Tracer:
+    """
+    Registro de zonas en un buffer circular de tamaño fijo.
+    Al llenarse se sobrescriben las zonas más antiguas, así siempre se
+    conservan los últimos segundos de juego.
+    """
+    
+    def __init__(self, capacity: int = GameSettings.TRACE_CAPACITY):
+        """
+        Inicializa el tracer (deshabilitado).
+        
+        Args:
+            capacity: Zonas guardadas como máximo
+        """
+        self.capacity = capacity
+        self.enabled = False
+        
+        # Buffer preasignado: nombre, inicio y duración de cada zona (ns)
+        self.name_ids = array('i', bytes(4 * capacity))
+        self.start_times = array('q', bytes(8 * capacity))
+        self.durations = array('q', bytes(8 * capacity))
+        self.index = 0  # Próxima posición a escribir
+        self.count = 0  # Zonas registradas (hasta `capacity`)
+        self.dropped = 0  # Zonas sobrescritas por falta de espacio
+        
+        # Nombres internados; las zonas ya creadas se reutilizan
+        self.names: List[str] = []
+        self._zones: Dict[str, _Zone] = {}
+        self._starts: List[int] = []  # Pila de inicios de las zonas abiertas
+        self._origin = time.perf_counter_ns()
+    
+    def enable(self) -> None:
+        """Empieza a registrar zonas"""
+        self.enabled = True
+    
+    def disable(self) -> None:
+        """Deja de registrar zonas (las que ya están abiertas se cierran igual)"""
+        self.enabled = False
+    
+    def clear(self) -> None:
+        """Descarta las zonas registradas"""
+        self.index = 0
+        self.count = 0
+        self.dropped = 0
+        self._origin = time.perf_counter_ns()
+    
+    def zone(self, name: str) -> Union[_Zone, _NullZone]:
+        """
+        Context manager que mide un bloque de código.
+        
+        Args:
+            name: Nombre de la zona en la traza
+        
+        Returns:
+            La zona, o una zona vacía si el tracer está deshabilitado
+        """
+        if not self.enabled:
+            return _NULL_ZONE
+        zone = self._zones.get(name)
+        if zone is None:
+            zone = self._create_zone(name)
+        return zone
+    
+    def traced(self, target: Union[Callable, str, None] = None) -> Callable:
+        """
+        Decorador que mide cada llamada a una función. Se usa como
+        `@traced` (nombre calificado de la función) o `@traced("nombre")`.
+        
+        Args:
+            target: Función a decorar o nombre de la zona
+        
+        Returns:
+            La función decorada, o el decorador si se pasó un nombre
+        """
+        def decorate(function: Callable) -> Callable:
+            zone = self._create_zone(target if isinstance(target, str) else function.__qualname__)
+            
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with zone:
+                    return function(*args, **kwargs)
+            return wrapper
+        
+        if callable(target):
+            return decorate(target)
+        return decorate
+    
+    def _create_zone(self, name: str) -> _Zone:
+        """Interna un nombre y crea su zona (o retorna la existente)"""
+        zone = self._zones.get(name)
+        if zone is None:
+            zone = _Zone(self, len(self.names))
+            self.names.append(name)
+            self._zones[name] = zone
+        return zone
+    
+    def _record(self, name_id: int, start: int, end: int) -> None:
+        """Guarda una zona terminada en el buffer"""
+        index = self.index
+        self.name_ids[index] = name_id
+        self.start_times[index] = start
+        self.durations[index] = end - start
+        self.index = index + 1 if index + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.dropped += 1
+    
+    def to_chrome_trace(self) -> Dict:
+        """
+        Convierte las zonas registradas al formato Chrome Trace Event.
+        
+        Returns:
+            Diccionario con `traceEvents` (eventos completos "X", en
+            microsegundos desde que se limpió el tracer)
+        """
+        pid = os.getpid()
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+             'args': {'name': GameSettings.WINDOW_TITLE}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'main'}},
+        ]
+        
+        # Del más antiguo al más reciente
+        first = self.index - self.count
+        names = self.names
+        origin = self._origin
+        for position in range(first, self.index):
+            index = position % self.capacity
+            events.append({
+                'name': names[self.name_ids[index]],
+                'ph': 'X',
+                'pid': pid,
+                'tid': 0,
+                'ts': (self.start_times[index] - origin) / 1000,
+                'dur': self.durations[index] / 1000,
+            })
+        
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped_zones': self.dropped},
+        }
+    
+    def save(self, path: str) -> int:
+        """
+        Escribe la traza en un archivo JSON.
+        
+        Args:
+            path: Ruta del archivo
+        
+        Returns:
+            Cantidad de zonas escritas
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return self.count
+
+# Instancia global del tracer
+tracer = Tracer()
+zone = tracer.zone
+traced = tracer.traced
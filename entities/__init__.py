@@ -1,5 +1,5 @@
 # Entities package
 
 from .base import Entity
-from .player import Mario
+from .player import Mario, Luigi
 from .enemies import Enemy, Goomba
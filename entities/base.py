@@ -3,7 +3,6 @@ Clase base para todas las entidades del juego.
 Proporciona funcionalidad común para posición, movimiento y renderizado.
 """
 
-import pyxel
 from abc import ABC, abstractmethod
 from typing import Tuple, Optional
 
@@ -35,6 +34,7 @@ class Entity(ABC):
         # Estados
         self.active = True
         self.visible = True
+        self.asleep = False  # Fuera de la región de activación de la cámara
         
         # Para detección de colisiones
         self.collision_enabled = True
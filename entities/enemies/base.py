@@ -3,9 +3,12 @@ Clase base para todos los enemigos del juego.
 Proporciona funcionalidad común para IA, movimiento y comportamiento.
 """
 
-from abc import ABC, abstractmethod
+import numpy as np
+from operator import attrgetter
+from typing import Optional, Sequence
 from entities.base import Entity
 from config.settings import GameSettings
+from physics.queries import SpatialQuery
 
 class Enemy(Entity):
     """
@@ -13,6 +16,19 @@ class Enemy(Entity):
     Hereda de Entity y añade comportamiento específico de enemigos.
     """
     
+    # Slot en el BodyBuffer de la física por lotes (ver physics.batch)
+    _body_buffer = None
+    _body_slot = -1
+    
+    # Atributos que forman el estado del enemigo en un snapshot (ver
+    # core.snapshot)
+    STATE_FIELDS = (
+        ('x', 'd'), ('y', 'd'), ('velocity_x', 'd'), ('velocity_y', 'd'),
+        ('width', 'd'), ('height', 'd'),
+        ('active', '?'), ('visible', '?'), ('collision_enabled', '?'),
+        ('is_alive', '?'), ('is_dying', '?'), ('death_timer', 'i'), ('moving_left', '?'),
+    )
+    
     def __init__(self, x: float, y: float, width: int, height: int):
         """
         Inicializa un enemigo básico.
@@ -117,53 +133,120 @@ class Enemy(Entity):
         """Hace que el enemigo se dé la vuelta"""
         self.moving_left = not self.moving_left
         
-    def is_on_edge(self, ground_y: float, edge_detection_distance: float = 20) -> bool:
+    def bounce_off(self, other: Entity, left_on_tie: bool = False) -> None:
+        """
+        Reacciona al choque con otro enemigo dándose la vuelta
+        para alejarse de él.
+        
+        Args:
+            other: El enemigo con el que chocó
+            left_on_tie: Dirección si los centros coinciden; quien llama
+                la da opuesta a cada enemigo para que se separen
+        """
+        if self.center_x == other.center_x:
+            move_left = left_on_tie
+        else:
+            move_left = self.center_x < other.center_x
+        if self.moving_left != move_left:
+            self.turn_around()
+        
+    def is_on_edge(self, ground_y: float, edge_detection_distance: float = 20,
+                   query: Optional[SpatialQuery] = None) -> bool:
         """
         Verifica si el enemigo está en el borde de una plataforma.
         
         Args:
             ground_y: Altura del suelo
             edge_detection_distance: Distancia hacia adelante para detectar bordes
+            query: Servicio de consultas espaciales (opcional)
             
         Returns:
             True si está en un borde
         """
+        if query is not None:
+            # Solo hay borde si está apoyado y no hay nada sólido
+            # justo debajo del punto de verificación
+            probe_y = self.bottom + 1
+            if not query.point_solid(self.center_x, probe_y):
+                return False
+            
+            reach = max(0.0, edge_detection_distance - self.width)
+            check_x = self.x - reach if self.moving_left else self.right + reach
+            return not query.point_solid(check_x, probe_y)
+        
         # Punto de verificación hacia adelante
         check_x = self.x + edge_detection_distance if not self.moving_left else self.x - edge_detection_distance
         
-        # Verificar si hay suelo hacia adelante
-        # Esta es una implementación simple; en un juego más complejo
-        # verificarías contra las plataformas reales
+        # Sin servicio de consultas solo se conocen el suelo y la pantalla
         return self.bottom >= ground_y and check_x < 0 or check_x > GameSettings.WINDOW_WIDTH
     
-    def should_turn_around(self, ground_y: float, platforms=None) -> bool:
+    def should_turn_around(self, ground_y: float, query: Optional[SpatialQuery] = None) -> bool:
         """
         Determina si el enemigo debería darse la vuelta.
         
         Args:
             ground_y: Altura del suelo
-            platforms: Lista de plataformas (opcional)
+            query: Servicio de consultas espaciales (opcional)
             
         Returns:
             True si debería darse la vuelta
         """
         # Girar en bordes
-        if self.turn_on_edge and self.is_on_edge(ground_y):
+        if self.turn_on_edge and self.is_on_edge(ground_y, query=query):
             return True
-            
+        
+        # Girar contra paredes
+        if self.turn_on_wall and query is not None:
+            check_x = self.x - 1 if self.moving_left else self.right + 1
+            if query.point_solid(check_x, self.center_y):
+                return True
+        
         # Girar en los límites del mundo
-        if self.x <= 0 or self.right >= GameSettings.WINDOW_WIDTH * 2:  # Mundo más amplio
+        world_width = query.level_width if query is not None else GameSettings.WINDOW_WIDTH * 2
+        if self.x <= 0 or self.right >= world_width:
             return True
             
         return False
     
-    @abstractmethod
-    def get_sprite_type(self) -> str:
+    @staticmethod
+    def should_turn_around_batch(enemies: Sequence['Enemy'], query: SpatialQuery,
+                                 edge_detection_distance: float = 20) -> np.ndarray:
         """
-        Retorna el tipo de sprite actual para el enemigo.
-        Debe ser implementado por cada enemigo específico.
+        Versión vectorizada de `should_turn_around` (con servicio de
+        consultas) para muchos enemigos a la vez: las sondas de borde y de
+        pared se resuelven con `SpatialQuery.points_solid`.
         
+        Args:
+            enemies: Enemigos a verificar
+            query: Servicio de consultas espaciales
+            edge_detection_distance: Distancia hacia adelante para detectar bordes
+            
         Returns:
-            String que identifica el sprite a usar
+            Array booleano, True para los enemigos que deberían darse la vuelta
         """
-        pass
+        count = len(enemies)
+        
+        def column(name, dtype=np.float64):
+            return np.fromiter(map(attrgetter(name), enemies), dtype=dtype, count=count)
+        
+        x = column('x')
+        y = column('y')
+        width = column('width')
+        height = column('height')
+        moving_left = column('moving_left', bool)
+        right = x + width
+        
+        # Girar en bordes: apoyado y sin nada sólido adelante
+        probe_y = y + height + 1
+        reach = np.maximum(0.0, edge_detection_distance - width)
+        check_x = np.where(moving_left, x - reach, right + reach)
+        edge = column('turn_on_edge', bool) & query.points_solid(x + width / 2, probe_y)
+        edge[edge] = ~query.points_solid(check_x[edge], probe_y[edge])
+        
+        # Girar contra paredes
+        wall = column('turn_on_wall', bool)
+        wall_x = np.where(moving_left, x - 1, right + 1)
+        wall[wall] = query.points_solid(wall_x[wall], (y + height / 2)[wall])
+        
+        # Girar en los límites del mundo
+        return edge | wall | (x <= 0) | (right >= query.level_width)
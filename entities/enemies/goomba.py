@@ -3,7 +3,6 @@ Goomba - El enemigo más básico de Mario Bros.
 Camina de lado a lado y puede ser derrotado pisándolo.
 """
 
-import pyxel
 from entities.enemies.base import Enemy
 from assets.sprites import sprite_manager
 from config.settings import GameSettings
@@ -14,6 +13,15 @@ class Goomba(Enemy):
     Puede ser derrotado pisándolo desde arriba.
     """
     
+    STATE_FIELDS = Enemy.STATE_FIELDS + (
+        ('squashed', '?'), ('squash_timer', 'i'),
+        ('animation_timer', 'i'), ('animation_frame', 'i'),
+    )
+    
+    # Handles de los sprites 'normal', 'walk' y 'squashed'; se resuelven en
+    # el primer dibujo
+    _sprite_handles = None
+    
     def __init__(self, x: float, y: float):
         """
         Inicializa un Goomba en la posición especificada.
@@ -74,15 +82,22 @@ class Goomba(Enemy):
         if self.squash_timer >= self.squash_duration:
             self.destroy()
     
-    def get_sprite_type(self) -> str:
-        """Retorna el tipo de sprite actual del Goomba"""
+    def get_sprite_handle(self) -> int:
+        """Retorna el handle del sprite actual del Goomba"""
+        normal, walk, squashed = self._sprite_handles or self._resolve_sprite_handles()
         if self.squashed:
-            return 'squashed'
+            return squashed
         elif self.is_dying:
-            return 'normal'  # Usar sprite normal durante muerte
+            return normal
         else:
-            # Alternar entre normal y walk para animación
-            return 'normal' if self.animation_frame == 0 else 'walk'
+            return normal if self.animation_frame == 0 else walk
+    
+    @classmethod
+    def _resolve_sprite_handles(cls) -> tuple:
+        """Resuelve una sola vez los handles de los sprites de Goomba"""
+        cls._sprite_handles = tuple(sprite_manager.resolve(f"goomba/{name}")
+                                    for name in ('normal', 'walk', 'squashed'))
+        return cls._sprite_handles
     
     def take_damage(self, damage_source: str = "unknown") -> bool:
         """
@@ -179,11 +194,8 @@ class Goomba(Enemy):
         if (-self.width <= screen_x <= GameSettings.WINDOW_WIDTH and
             -self.height <= screen_y <= GameSettings.WINDOW_HEIGHT):
             
-            # Obtener el tipo de sprite actual
-            sprite_type = self.get_sprite_type()
-            
-            # Dibujar usando el sprite manager
-            sprite_manager.draw_goomba_sprite(screen_x, screen_y, sprite_type)
+            # Dibujar el sprite actual usando el sprite manager
+            sprite_manager.draw(self.get_sprite_handle(), screen_x, screen_y)
     
     def respawn(self, x: float, y: float) -> None:
         """
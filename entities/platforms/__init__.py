@@ -1 +1,4 @@
 # Platforms package
+
+from .block import Block
+from .collision_box import CollisionBox
@@ -0,0 +1,45 @@
+"""
+Bloques sólidos del nivel (suelo, ladrillos, bloques).
+Son entidades estáticas de un tile que se dibujan como rectángulos.
+"""
+
+from entities.base import Entity
+from config.settings import GameSettings
+
+class Block(Entity):
+    """
+    Bloque estático de un tile que actúa como plataforma sólida.
+    """
+    
+    def __init__(self, x: float, y: float, color: int = GameSettings.COLOR_GROUND):
+        """
+        Inicializa un bloque.
+        
+        Args:
+            x: Posición X (normalmente múltiplo de TILE_SIZE)
+            y: Posición Y (normalmente múltiplo de TILE_SIZE)
+            color: Color de Pyxel para dibujarlo
+        """
+        super().__init__(x, y, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
+        self.color = color
+    
+    def update(self) -> None:
+        """Los bloques estáticos no tienen lógica por frame"""
+        pass
+    
+    def draw(self, camera_x: float = 0, camera_y: float = 0) -> None:
+        """
+        Dibuja el bloque en pantalla.
+        
+        Args:
+            camera_x: Offset de cámara en X
+            camera_y: Offset de cámara en Y
+        """
+        import pyxel
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        # Solo dibujar si está visible en pantalla
+        if (-self.width <= screen_x <= GameSettings.WINDOW_WIDTH and
+            -self.height <= screen_y <= GameSettings.WINDOW_HEIGHT):
+            pyxel.rect(screen_x, screen_y, self.width, self.height, self.color)
@@ -0,0 +1,33 @@
+"""
+Caja de colisión invisible.
+Representa geometría sólida solo para física (por ejemplo, varios
+bloques fusionados al cargar el nivel); no se dibuja.
+"""
+
+from entities.base import Entity
+
+class CollisionBox(Entity):
+    """
+    Rectángulo sólido usado únicamente para colisiones.
+    """
+    
+    def __init__(self, x: float, y: float, width: float, height: float):
+        """
+        Inicializa la caja de colisión.
+        
+        Args:
+            x: Posición X
+            y: Posición Y
+            width: Ancho en pixels
+            height: Alto en pixels
+        """
+        super().__init__(x, y, width, height)
+        self.visible = False
+    
+    def update(self) -> None:
+        """La geometría estática no tiene lógica por frame"""
+        pass
+    
+    def draw(self, camera_x: float = 0, camera_y: float = 0) -> None:
+        """Las cajas de colisión no se dibujan"""
+        pass
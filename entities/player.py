@@ -3,9 +3,10 @@ Clase Mario - El personaje principal del juego.
 Maneja movimiento, salto, animaciones y estados del jugador.
 """
 
-import pyxel
+from typing import Optional
 from entities.base import Entity
 from config.settings import GameSettings
+from core.input import Button, InputProvider, PyxelInput
 from assets.sprites import sprite_manager
 
 class Mario(Entity):
@@ -14,13 +15,32 @@ class Mario(Entity):
     Hereda de Entity y añade funcionalidad específica del jugador.
     """
     
-    def __init__(self, x: float, y: float):
+    # Atributos que forman el estado de Mario en un snapshot (ver core.snapshot)
+    STATE_FIELDS = (
+        ('x', 'd'), ('y', 'd'), ('velocity_x', 'd'), ('velocity_y', 'd'),
+        ('is_on_ground', '?'), ('is_running', '?'), ('facing_right', '?'), ('is_jumping', '?'),
+        ('animation_frame', 'i'), ('animation_timer', 'i'),
+        ('score', 'i'), ('lives', 'i'), ('coins', 'i'),
+        ('active', '?'), ('visible', '?'), ('collision_enabled', '?'),
+    )
+    
+    # Sprites de cada pose (quieto, caminando, saltando)
+    SPRITE_POSES = ('small', 'walk1', 'jump')
+    POSE_IDLE, POSE_WALK, POSE_JUMP = range(3)
+    
+    # Handles de sprites por pose (mirando a la derecha; a la izquierda se
+    # dibujan espejados); se resuelven en el primer dibujo
+    _sprite_handles = None
+    
+    def __init__(self, x: float, y: float, input_provider: Optional[InputProvider] = None):
         """
         Inicializa a Mario en la posición especificada.
         
         Args:
             x: Posición X inicial
             y: Posición Y inicial
+            input_provider: Fuente de entrada (por defecto, el teclado vía Pyxel).
+                Quien controla la simulación llama a `poll` una vez por tick
         """
         super().__init__(x, y, GameSettings.MARIO_WIDTH, GameSettings.MARIO_HEIGHT)
         
@@ -45,6 +65,7 @@ class Mario(Entity):
         self.coins = 0
         
         # Control de input
+        self.input = input_provider if input_provider is not None else PyxelInput()
         self.input_buffer = 0  # Para mejores controles
         
     def update(self) -> None:
@@ -59,29 +80,28 @@ class Mario(Entity):
         self.velocity_x = 0
         
         # Movimiento horizontal
-        if pyxel.btn(pyxel.KEY_LEFT) or pyxel.btn(pyxel.KEY_A):
+        if self.input.is_held(Button.LEFT):
             self.velocity_x = -self.speed
             self.facing_right = False
             self.is_running = True
             
             # Velocidad extra si se mantiene presionado el botón de correr
-            if pyxel.btn(pyxel.KEY_Z) or pyxel.btn(pyxel.KEY_X):
+            if self.input.is_held(Button.RUN):
                 self.velocity_x *= 1.5
                 
-        elif pyxel.btn(pyxel.KEY_RIGHT) or pyxel.btn(pyxel.KEY_D):
+        elif self.input.is_held(Button.RIGHT):
             self.velocity_x = self.speed
             self.facing_right = True
             self.is_running = True
             
             # Velocidad extra si se mantiene presionado el botón de correr
-            if pyxel.btn(pyxel.KEY_Z) or pyxel.btn(pyxel.KEY_X):
+            if self.input.is_held(Button.RUN):
                 self.velocity_x *= 1.5
         else:
             self.is_running = False
         
         # Salto
-        if (pyxel.btnp(pyxel.KEY_SPACE) or pyxel.btnp(pyxel.KEY_UP) or 
-            pyxel.btnp(pyxel.KEY_W)) and self.is_on_ground:
+        if self.input.is_pressed(Button.JUMP) and self.is_on_ground:
             self.jump()
     
     def jump(self) -> None:
@@ -183,20 +203,30 @@ class Mario(Entity):
             x: Posición X en pantalla
             y: Posición Y en pantalla
         """
-        # Determinar el tipo de sprite basado en el estado
+        handles = self._sprite_handles or self._resolve_sprite_handles()
+        
+        # Determinar la pose basada en el estado
         if self.is_jumping or not self.is_on_ground:
-            sprite_type = 'jump'
+            pose = self.POSE_JUMP
         elif self.is_running and self.is_on_ground:
             # Alternar entre frames de caminata
-            if self.animation_frame == 0:
-                sprite_type = 'idle'
-            else:
-                sprite_type = 'walk1'
+            pose = self.POSE_IDLE if self.animation_frame == 0 else self.POSE_WALK
         else:
-            sprite_type = 'idle'
+            pose = self.POSE_IDLE
         
         # Dibujar el sprite usando el sprite manager
-        sprite_manager.draw_mario_sprite(x, y, sprite_type, self.facing_right)
+        sprite_manager.draw(handles[pose], x, y, flip=not self.facing_right)
+    
+    @classmethod
+    def _resolve_sprite_handles(cls) -> tuple:
+        """
+        Resuelve una sola vez los handles de los sprites de la clase.
+        
+        Returns:
+            Handles por pose
+        """
+        cls._sprite_handles = tuple(sprite_manager.resolve(f"mario/{pose}_right") for pose in cls.SPRITE_POSES)
+        return cls._sprite_handles
     
     def reset_position(self, x: float, y: float) -> None:
         """
@@ -212,3 +242,26 @@ class Mario(Entity):
         self.is_on_ground = False
         self.is_jumping = False
         self.is_running = False
+
+class Luigi(Mario):
+    """
+    Segundo jugador. Se comporta igual que Mario y se dibuja con los
+    mismos sprites cambiando el rojo por verde en la paleta.
+    """
+    
+    # Colores de los sprites de Mario reemplazados al dibujar (origen, destino)
+    PALETTE_SWAP = ((8, 11),)
+    
+    def _draw_mario_sprite(self, x: float, y: float) -> None:
+        """
+        Dibuja el sprite de Mario con la paleta de Luigi.
+        
+        Args:
+            x: Posición X en pantalla
+            y: Posición Y en pantalla
+        """
+        import pyxel
+        for source, target in self.PALETTE_SWAP:
+            pyxel.pal(source, target)
+        super()._draw_mario_sprite(x, y)
+        pyxel.pal()
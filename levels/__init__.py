@@ -1 +1,4 @@
 # Levels package
+
+from .tilemap import TileMap
+from .geometry import merge_static_blocks
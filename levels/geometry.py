@@ -0,0 +1,70 @@
+"""
+Procesamiento de geometría estática al cargar un nivel.
+Fusiona bloques sólidos adyacentes en rectángulos más grandes
+(greedy meshing) para reducir los candidatos de colisión.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+from entities.base import Entity
+from entities.platforms.collision_box import CollisionBox
+from config.settings import GameSettings
+
+def merge_static_blocks(platforms: Sequence[Entity],
+                        tile_size: int = GameSettings.TILE_SIZE) -> List[Entity]:
+    """
+    Fusiona bloques de un tile alineados a la grilla en rectángulos.
+    Primero extiende cada rectángulo hacia la derecha y luego hacia abajo
+    mientras la fila completa siga siendo sólida.
+    
+    Las plataformas que no ocupan exactamente un tile alineado se
+    devuelven sin cambios. El resultado es solo para colisiones: el
+    renderizado sigue usando los bloques originales.
+    
+    Args:
+        platforms: Plataformas estáticas del nivel
+        tile_size: Tamaño de tile de la grilla
+    
+    Returns:
+        Lista de geometría de colisión (cajas fusionadas + plataformas sueltas)
+    """
+    cells: Dict[Tuple[int, int], Entity] = {}
+    loose: List[Entity] = []
+    
+    for platform in platforms:
+        if not platform.active:
+            continue
+        
+        aligned = (platform.width == tile_size and platform.height == tile_size and
+                   platform.x % tile_size == 0 and platform.y % tile_size == 0)
+        if aligned:
+            cells[(int(platform.x // tile_size), int(platform.y // tile_size))] = platform
+        else:
+            loose.append(platform)
+    
+    merged: List[Entity] = []
+    used = set()
+    
+    # Recorrer fila por fila, de izquierda a derecha
+    for column, row in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+        if (column, row) in used:
+            continue
+        
+        # Extender hacia la derecha
+        width = 1
+        while (column + width, row) in cells and (column + width, row) not in used:
+            width += 1
+        
+        # Extender hacia abajo mientras la fila completa esté libre
+        height = 1
+        while all((column + i, row + height) in cells and (column + i, row + height) not in used
+                  for i in range(width)):
+            height += 1
+        
+        for r in range(row, row + height):
+            for c in range(column, column + width):
+                used.add((c, r))
+        
+        merged.append(CollisionBox(column * tile_size, row * tile_size,
+                                   width * tile_size, height * tile_size))
+    
+    return merged + loose
@@ -0,0 +1,240 @@
+"""
+Capa de colisión basada en tiles para los niveles.
+Guarda el nivel como una grilla compacta de IDs de tile (un byte por celda)
+con flags de solidez por ID.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from config.settings import GameSettings
+
+class TileMap:
+    """
+    Grilla 2D de tiles para colisiones y renderizado del nivel.
+    Cada celda guarda un ID de tile (0-255); las propiedades de cada ID
+    (solidez, color) se definen una sola vez en tablas compartidas.
+    """
+    
+    # IDs de tile predefinidos
+    EMPTY = 0
+    GROUND = 1
+    BRICK = 2
+    BLOCK = 3
+    PIPE = 4
+    
+    # Flags de tile
+    FLAG_SOLID = 0x01
+    
+    # Caracteres por defecto para construir mapas desde texto
+    DEFAULT_LEGEND = {
+        '.': EMPTY,
+        ' ': EMPTY,
+        '#': GROUND,
+        'B': BRICK,
+        '?': BLOCK,
+        'P': PIPE,
+    }
+    
+    def __init__(self, columns: int, rows: int, tile_size: int = GameSettings.TILE_SIZE):
+        """
+        Inicializa un mapa de tiles vacío.
+        
+        Args:
+            columns: Número de columnas
+            rows: Número de filas
+            tile_size: Tamaño de cada tile en pixels
+        """
+        self.columns = columns
+        self.rows = rows
+        self.tile_size = tile_size
+        
+        # Un byte por celda, fila por fila
+        self.tiles = bytearray(columns * rows)
+        
+        # Propiedades por ID de tile
+        self.tile_flags = bytearray(256)
+        self.tile_colors: Dict[int, int] = {}
+        
+        self.define_tile(self.GROUND, solid=True, color=GameSettings.COLOR_GROUND)
+        self.define_tile(self.BRICK, solid=True, color=9)
+        self.define_tile(self.BLOCK, solid=True, color=10)
+        self.define_tile(self.PIPE, solid=True, color=3)
+    
+    @classmethod
+    def from_strings(cls, rows: Sequence[str], legend: Optional[Dict[str, int]] = None,
+                     tile_size: int = GameSettings.TILE_SIZE) -> 'TileMap':
+        """
+        Crea un mapa a partir de filas de texto (un carácter por tile).
+        
+        Args:
+            rows: Filas del mapa, de arriba hacia abajo
+            legend: Carácter -> ID de tile (por defecto DEFAULT_LEGEND)
+            tile_size: Tamaño de cada tile en pixels
+        
+        Returns:
+            Nuevo TileMap
+        """
+        legend = legend if legend is not None else cls.DEFAULT_LEGEND
+        columns = max((len(row) for row in rows), default=0)
+        tilemap = cls(columns, len(rows), tile_size)
+        
+        for row_index, row in enumerate(rows):
+            for column_index, char in enumerate(row):
+                tilemap.set_tile(column_index, row_index, legend.get(char, cls.EMPTY))
+        
+        return tilemap
+    
+    @property
+    def pixel_width(self) -> int:
+        """Retorna el ancho del mapa en pixels"""
+        return self.columns * self.tile_size
+    
+    @property
+    def pixel_height(self) -> int:
+        """Retorna el alto del mapa en pixels"""
+        return self.rows * self.tile_size
+    
+    def define_tile(self, tile_id: int, solid: bool, color: Optional[int] = None) -> None:
+        """
+        Define las propiedades de un ID de tile.
+        
+        Args:
+            tile_id: ID del tile (1-255)
+            solid: True si el tile bloquea el movimiento
+            color: Color de Pyxel para dibujarlo (None = invisible)
+        """
+        self.tile_flags[tile_id] = self.FLAG_SOLID if solid else 0
+        if color is None:
+            self.tile_colors.pop(tile_id, None)
+        else:
+            self.tile_colors[tile_id] = color
+    
+    def get_tile(self, column: int, row: int) -> int:
+        """
+        Obtiene el ID de tile de una celda.
+        
+        Args:
+            column: Columna de la celda
+            row: Fila de la celda
+        
+        Returns:
+            ID del tile (EMPTY fuera del mapa)
+        """
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return self.tiles[row * self.columns + column]
+        return self.EMPTY
+    
+    def set_tile(self, column: int, row: int, tile_id: int) -> None:
+        """
+        Cambia el ID de tile de una celda.
+        
+        Args:
+            column: Columna de la celda
+            row: Fila de la celda
+            tile_id: Nuevo ID de tile
+        """
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            self.tiles[row * self.columns + column] = tile_id
+    
+    def fill_rect(self, column: int, row: int, width: int, height: int, tile_id: int) -> None:
+        """
+        Rellena un rectángulo de celdas con un mismo tile.
+        
+        Args:
+            column: Columna inicial
+            row: Fila inicial
+            width: Ancho en tiles
+            height: Alto en tiles
+            tile_id: ID de tile a usar
+        """
+        for r in range(row, row + height):
+            for c in range(column, column + width):
+                self.set_tile(c, r, tile_id)
+    
+    def is_solid(self, column: int, row: int) -> bool:
+        """
+        Verifica si una celda es sólida.
+        
+        Args:
+            column: Columna de la celda
+            row: Fila de la celda
+        
+        Returns:
+            True si la celda es sólida
+        """
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return bool(self.tile_flags[self.tiles[row * self.columns + column]] & self.FLAG_SOLID)
+        return False
+    
+    def is_solid_at(self, x: float, y: float) -> bool:
+        """
+        Verifica si un punto del mundo cae dentro de un tile sólido.
+        
+        Args:
+            x: Coordenada X en el mundo
+            y: Coordenada Y en el mundo
+        
+        Returns:
+            True si el punto está dentro de un tile sólido
+        """
+        return self.is_solid(int(x // self.tile_size), int(y // self.tile_size))
+    
+    def cell_range(self, x: float, y: float, width: float, height: float) -> Tuple[int, int, int, int]:
+        """
+        Calcula el rango de celdas que solapa un rectángulo.
+        
+        Args:
+            x: Posición X del rectángulo
+            y: Posición Y del rectángulo
+            width: Ancho del rectángulo
+            height: Alto del rectángulo
+        
+        Returns:
+            Tupla (primera columna, última columna, primera fila, última fila)
+        """
+        size = self.tile_size
+        first_column = int(x // size)
+        last_column = math.ceil((x + width) / size) - 1
+        first_row = int(y // size)
+        last_row = math.ceil((y + height) / size) - 1
+        return (first_column, last_column, first_row, last_row)
+    
+    def solid_cells_in_rect(self, x: float, y: float, width: float, height: float) -> List[Tuple[int, int]]:
+        """
+        Obtiene las celdas sólidas que solapa un rectángulo.
+        Solo se consultan las celdas cubiertas, sin importar el tamaño del mapa.
+        
+        Args:
+            x: Posición X del rectángulo
+            y: Posición Y del rectángulo
+            width: Ancho del rectángulo
+            height: Alto del rectángulo
+        
+        Returns:
+            Lista de celdas (columna, fila)
+        """
+        first_column, last_column, first_row, last_row = self.cell_range(x, y, width, height)
+        
+        # Recortar al mapa
+        first_column = max(first_column, 0)
+        last_column = min(last_column, self.columns - 1)
+        first_row = max(first_row, 0)
+        last_row = min(last_row, self.rows - 1)
+        
+        tiles = self.tiles
+        flags = self.tile_flags
+        columns = self.columns
+        
+        return [(column, row)
+                for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)
+                if flags[tiles[row * columns + column]] & self.FLAG_SOLID]
+    
+    def get_memory_usage(self) -> int:
+        """
+        Retorna el tamaño en bytes de la grilla de tiles.
+        
+        Returns:
+            Bytes usados por la grilla y la tabla de flags
+        """
+        return len(self.tiles) + len(self.tile_flags)
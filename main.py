@@ -3,9 +3,20 @@ Mario Bros - Archivo principal del juego
 Punto de entrada que inicializa Pyxel y maneja el loop principal del juego.
 """
 
+import argparse
+import time
 import pyxel
+from typing import Optional, Tuple
 from scenes.game_scene import GameScene
 from config.settings import GameSettings
+from core.timestep import FixedTimestep
+from core.input import PyxelInput
+from core.recording import InputRecorder, InputReplay
+from core.rewind import RewindBuffer
+from core.profiler import FrameProfiler
+from core.governor import FrameGovernor
+from core.tracing import traced, tracer
+from netplay import RollbackSession, UdpTransport
 from assets.sprites import sprite_manager  # Importar para inicializar sprites
 
 class MarioGame:
@@ -14,8 +25,22 @@ class MarioGame:
     Maneja la inicialización de Pyxel y el loop principal del juego.
     """
     
-    def __init__(self):
-        """Inicializa el juego"""
+    def __init__(self, fast_forward: int = 1, record_path: Optional[str] = None,
+                 replay_path: Optional[str] = None,
+                 netplay: Optional[Tuple[Tuple[str, int], Tuple[str, int]]] = None,
+                 player: int = 1, trace_path: Optional[str] = None):
+        """
+        Inicializa el juego
+        
+        Args:
+            fast_forward: Multiplicador inicial de velocidad de la simulación
+            record_path: Archivo donde grabar la entrada de la partida (opcional)
+            replay_path: Grabación a reproducir en lugar del teclado (opcional)
+            netplay: Direcciones (local, remota) para jugar en red con Luigi (opcional)
+            player: En red, 1 para controlar a Mario o 2 para Luigi
+            trace_path: Archivo donde guardar la traza de zonas; con él se
+                traza desde el inicio (F2 alterna la traza en cualquier caso)
+        """
         
         # Configurar Pyxel
         pyxel.init(
@@ -25,37 +50,143 @@ class MarioGame:
             fps=GameSettings.FPS
         )
         
-        # Inicializar sprites después de Pyxel
+        # Inicializar sprites después de Pyxel (se suben todos ahora, no en
+        # su primer dibujo en medio de la partida; desde los banks horneados
+        # en disco si están al día)
         sprite_manager.initialize_sprites()
         
         # Estado del juego
         self.current_scene = None
         self.running = True
         
-        # Inicializar escena principal
-        self.game_scene = GameScene()
+        # Reloj de simulación de paso fijo
+        self.timestep = FixedTimestep()
+        self.timestep.set_fast_forward(fast_forward)
+        self.draw_this_frame = True
+        
+        # Fuente de entrada: teclado, grabación del teclado o reproducción
+        self.record_path = record_path
+        self.recorder = None
+        if replay_path:
+            input_provider = InputReplay.load(replay_path)
+        elif record_path:
+            self.recorder = InputRecorder(PyxelInput())
+            input_provider = self.recorder
+        else:
+            input_provider = PyxelInput()
+        
+        # Partida en red: la sesión de rollback crea y avanza su propia escena
+        self.session = None
+        if netplay:
+            transport = UdpTransport(*netplay)
+            transport.start()
+            self.local_input = input_provider
+            self.session = RollbackSession(player - 1, transport)
+            self.game_scene = self.session.scene
+        else:
+            # Inicializar escena principal (con rebobinado: mantener BACKSPACE)
+            self.game_scene = GameScene(input_provider, rewind=RewindBuffer())
         self.current_scene = self.game_scene
         
+        # Tiempos por subsistema (se ven en el overlay de debug, F1)
+        self.profiler = FrameProfiler()
+        self.game_scene.profiler = self.profiler
+        
+        # Traza de zonas para Perfetto (F2 empieza/termina y guarda)
+        self.trace_path = trace_path or "trace.json"
+        if trace_path:
+            tracer.enable()
+        
+        # Gobernador del presupuesto de frame. Grabando, reproduciendo o en
+        # red solo puede saltar dibujos: los demás niveles cambian la simulación
+        deterministic = bool(record_path or replay_path or netplay)
+        self.governor = FrameGovernor(max_level=1 if deterministic else len(FrameGovernor.LEVELS) - 1,
+                                      on_change=self._log_governor_change)
+        self.update_seconds = 0.0
+        
         # Ejecutar el juego
         pyxel.run(self.update, self.draw)
     
+    @traced
     def update(self):
         """Actualiza la lógica del juego cada frame"""
+        self.profiler.begin_frame()
         
         # Manejar input global del juego
         if pyxel.btnp(pyxel.KEY_Q) or pyxel.btnp(pyxel.KEY_ESCAPE):
+            self.save_recording()
+            self.save_trace()
+            if self.session:
+                self.session.close()
             pyxel.quit()
         
-        # Actualizar la escena actual
-        if self.current_scene:
-            self.current_scene.update()
+        # Alternar la traza de zonas
+        if pyxel.btnp(pyxel.KEY_F2):
+            if tracer.enabled:
+                self.save_trace()
+            else:
+                tracer.clear()
+                tracer.enable()
+        
+        # Alternar avance rápido
+        if pyxel.btnp(pyxel.KEY_F):
+            if self.timestep.is_fast_forward:
+                self.timestep.set_fast_forward(1)
+            else:
+                self.timestep.set_fast_forward(GameSettings.FAST_FORWARD_SPEED)
+        
+        # Ejecutar los ticks de simulación que correspondan a este frame
+        update_start = time.perf_counter()
+        ticks = self.timestep.advance()
+        if self.session:
+            for _ in range(ticks):
+                self.local_input.poll()
+                self.session.advance(self.local_input.buttons)
+        elif self.current_scene:
+            for _ in range(ticks):
+                self.current_scene.update()
+        self.update_seconds = time.perf_counter() - update_start
+        
+        self.draw_this_frame = self.timestep.should_draw() and self.governor.should_draw()
+        
+        # Guardar la grabación periódicamente (cerrar la ventana no avisa)
+        if self.recorder and pyxel.frame_count % GameSettings.RECORDING_AUTOSAVE_FRAMES == 0:
+            self.save_recording()
+    
+    def save_recording(self) -> None:
+        """Guarda la grabación de entrada si se está grabando"""
+        if self.recorder:
+            self.recorder.save(self.record_path)
+    
+    def save_trace(self) -> None:
+        """Termina la traza de zonas (si está activa) y la guarda en JSON"""
+        if tracer.enabled:
+            tracer.disable()
+            zones = tracer.save(self.trace_path)
+            print(f"💾 Traza guardada en {self.trace_path} ({zones} zonas)")
     
+    @traced
     def draw(self):
         """Dibuja el juego cada frame"""
         
-        # Dibujar la escena actual
-        if self.current_scene:
+        # En avance rápido (o si el gobernador lo pide) se saltan frames de dibujo
+        draw_seconds = None
+        if self.draw_this_frame and self.current_scene:
+            draw_start = time.perf_counter()
             self.current_scene.draw()
+            draw_seconds = time.perf_counter() - draw_start
+        
+        # El avance rápido supera el presupuesto a propósito: no se mide
+        if not self.timestep.is_fast_forward:
+            self.governor.record(self.update_seconds, draw_seconds)
+            self.governor.apply(self.game_scene)
+        
+        self.profiler.end_frame()
+    
+    def _log_governor_change(self, previous: str, mode: str, cost_ms: float) -> None:
+        """Informa cada cambio de nivel del gobernador de frame"""
+        budget_ms = self.governor.budget * 1000
+        print(f"⚙️  Gobernador de frame: {previous} -> {mode} ({cost_ms:.1f} ms de {budget_ms:.1f} ms)")
     
     def change_scene(self, new_scene):
         """
@@ -68,9 +199,26 @@ class MarioGame:
 
 def main():
     """Función principal que inicia el juego"""
+    parser = argparse.ArgumentParser(description=GameSettings.WINDOW_TITLE)
+    parser.add_argument("--record", metavar="ARCHIVO", help="Grabar la entrada de la partida")
+    parser.add_argument("--replay", metavar="ARCHIVO", help="Reproducir una grabación de entrada")
+    parser.add_argument("--netplay", nargs=2, metavar=("PUERTO", "HOST:PUERTO"),
+                        help="Jugar en red: puerto local y dirección del otro jugador")
+    parser.add_argument("--player", type=int, choices=(1, 2), default=1,
+                        help="En red, 1 para Mario o 2 para Luigi")
+    parser.add_argument("--trace", metavar="ARCHIVO",
+                        help="Trazar desde el inicio y guardar la traza (Chrome Trace Event) al salir")
+    args = parser.parse_args()
+    
+    netplay = None
+    if args.netplay:
+        host, port = args.netplay[1].rsplit(":", 1)
+        netplay = (("0.0.0.0", int(args.netplay[0])), (host, int(port)))
+    
     try:
         # Crear y ejecutar el juego
-        game = MarioGame()
+        game = MarioGame(record_path=args.record, replay_path=args.replay,
+                         netplay=netplay, player=args.player, trace_path=args.trace)
     except KeyboardInterrupt:
         print("\n¡Juego terminado por el usuario!")
     except Exception as e:
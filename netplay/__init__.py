@@ -0,0 +1,4 @@
+# Netplay package
+
+from .transport import Transport, LoopbackTransport, UdpTransport
+from .session import RollbackSession
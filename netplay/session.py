@@ -0,0 +1,234 @@
+"""
+Sesión de juego en red con rollback (al estilo GGPO).
+Cada jugador simula la partida completa; por la red solo viajan las
+entradas. La entrada remota que todavía no llegó se predice (se repite la
+última conocida) y, si al llegar no coincide con la predicción, se
+restaura el snapshot de ese tick y se vuelven a simular los ticks
+siguientes antes de dibujar.
+"""
+
+import struct
+from typing import Callable, Dict, List, Tuple
+from scenes.game_scene import GameScene
+from core.input import Button, InputProvider, ManualInput
+from netplay.transport import Transport
+
+# Paquete: MAGIC, primer tick, último tick remoto confirmado (-1 = ninguno),
+# cantidad de entradas y luego una máscara de botones (1 byte) por tick
+PACKET_MAGIC = b"MN"
+PACKET_HEADER = struct.Struct('<2siiH')
+
+# Entradas enviadas como máximo por paquete
+MAX_PACKET_INPUTS = 256
+
+def encode_inputs(first_frame: int, ack_frame: int, masks: List[int]) -> bytes:
+    """
+    Serializa un tramo de entradas locales.
+    
+    Args:
+        first_frame: Tick de la primera entrada
+        ack_frame: Último tick de la entrada remota recibido sin huecos
+        masks: Máscaras de botones, una por tick
+    
+    Returns:
+        Bytes del paquete
+    """
+    return PACKET_HEADER.pack(PACKET_MAGIC, first_frame, ack_frame, len(masks)) + bytes(masks)
+
+def decode_inputs(packet: bytes) -> Tuple[int, int, bytes]:
+    """
+    Lee un paquete de entradas.
+    
+    Args:
+        packet: Bytes del paquete
+    
+    Returns:
+        Tupla (primer tick, tick confirmado, máscaras)
+    """
+    magic, first_frame, ack_frame, count = PACKET_HEADER.unpack_from(packet, 0)
+    masks = packet[PACKET_HEADER.size:PACKET_HEADER.size + count]
+    if magic != PACKET_MAGIC or len(masks) != count:
+        raise ValueError("Paquete de entradas inválido")
+    return first_frame, ack_frame, masks
+
+def two_player_scene(mario_input: InputProvider, luigi_input: InputProvider) -> GameScene:
+    """Crea la escena de dos jugadores usada por defecto"""
+    return GameScene(mario_input, second_player=luigi_input)
+
+class RollbackSession:
+    """
+    Partida de dos jugadores sincronizada por rollback.
+    Se llama a `advance` una vez por tick con la entrada local; la sesión
+    envía y recibe entradas, corrige predicciones fallidas y avanza la escena.
+    """
+    
+    # Botones que viajan por la red. Reiniciar funciona desde cualquiera de
+    # los dos lados; pausa y debug se descartan (pausar solo una de las dos
+    # simulaciones las desincronizaría), así que en red no están disponibles
+    NETWORK_BUTTONS = Button.GAMEPLAY | Button.RESTART
+    
+    def __init__(self, local_player: int, transport: Transport, input_delay: int = 2,
+                 max_prediction: int = 8,
+                 scene_factory: Callable[[InputProvider, InputProvider], GameScene] = two_player_scene):
+        """
+        Inicializa la sesión y construye la escena.
+        
+        Args:
+            local_player: 0 si este lado controla a Mario, 1 si controla a Luigi
+            transport: Canal hacia el otro jugador
+            input_delay: Ticks de retardo de la entrada local; reducen los
+                rollbacks a costa de respuesta
+            max_prediction: Ticks máximos simulados por delante de la última
+                entrada remota; pasado ese margen la sesión espera
+            scene_factory: Crea la escena a partir de la entrada de Mario y
+                la de Luigi; ambos lados deben usar el mismo nivel
+        """
+        self.local_player = local_player
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_prediction = max_prediction
+        
+        self.inputs = [ManualInput(), ManualInput()]
+        self.scene = scene_factory(self.inputs[0], self.inputs[1])
+        
+        self.frame = 0  # Próximo tick a simular
+        self.local_inputs: Dict[int, int] = {frame: Button.NONE for frame in range(input_delay)}
+        self.remote_inputs: Dict[int, int] = {}
+        self.last_remote_frame = -1  # Último tick remoto recibido sin huecos
+        self.remote_ack = -1  # Último tick local que el otro lado confirmó
+        self._predicted: Dict[int, int] = {}  # Entradas remotas supuestas por tick
+        self._snapshots: Dict[int, bytes] = {}  # Estado antes de simular cada tick
+        self._rollback_frame = None  # Primer tick con una predicción fallida
+        self._pruned_frame = 0  # Los datos anteriores a este tick ya se descartaron
+        
+        # Estadísticas
+        self.rollbacks = 0
+        self.rollback_frames = 0
+        self.max_rollback = 0
+        self.stalls = 0
+    
+    @property
+    def confirmed_frame(self) -> int:
+        """Retorna el último tick simulado con las entradas reales de ambos"""
+        return min(self.frame - 1, self.last_remote_frame)
+    
+    def advance(self, local_buttons: int) -> bool:
+        """
+        Avanza la partida un tick.
+        
+        Args:
+            local_buttons: Máscara de botones del jugador local en este tick
+        
+        Returns:
+            False si la sesión tuvo que esperar entradas remotas y no avanzó
+        """
+        # La entrada local se aplica `input_delay` ticks después. Mientras se
+        # espera, el tick destino no cambia y se conserva la primera entrada
+        target = self.frame + self.input_delay
+        if target not in self.local_inputs:
+            self.local_inputs[target] = local_buttons & self.NETWORK_BUTTONS
+        
+        self._send()
+        self._receive()
+        
+        if self._rollback_frame is not None:
+            self._rollback()
+        
+        if self.frame - self.last_remote_frame > self.max_prediction:
+            self.stalls += 1
+            return False
+        
+        self._simulate(self.frame)
+        self.frame += 1
+        self._prune()
+        return True
+    
+    def _send(self) -> None:
+        """Envía las entradas locales que el otro lado aún no confirmó"""
+        first = max(self.remote_ack + 1, self._pruned_frame)
+        last = self.frame + self.input_delay
+        first = max(first, last + 1 - MAX_PACKET_INPUTS)
+        local_inputs = self.local_inputs
+        masks = [local_inputs[frame] for frame in range(first, last + 1)]
+        self.transport.send(encode_inputs(first, self.last_remote_frame, masks))
+    
+    def _receive(self) -> None:
+        """Registra las entradas remotas llegadas y detecta predicciones fallidas"""
+        remote_inputs = self.remote_inputs
+        predicted = self._predicted
+        for packet in self.transport.receive():
+            try:
+                first, ack, masks = decode_inputs(packet)
+            except (ValueError, struct.error):
+                continue
+            
+            if ack > self.remote_ack:
+                self.remote_ack = ack
+            
+            for frame in range(max(first, self.last_remote_frame + 1), first + len(masks)):
+                if frame in remote_inputs:
+                    continue
+                mask = masks[frame - first]
+                remote_inputs[frame] = mask
+                
+                # Ya simulado con otra entrada: hay que volver a ese tick
+                if frame in predicted and predicted.pop(frame) != mask:
+                    if self._rollback_frame is None or frame < self._rollback_frame:
+                        self._rollback_frame = frame
+        
+        # Avanzar el último tick remoto contiguo
+        frame = self.last_remote_frame + 1
+        while frame in remote_inputs:
+            frame += 1
+        self.last_remote_frame = frame - 1
+    
+    def _rollback(self) -> None:
+        """Restaura el tick de la primera predicción fallida y re-simula hasta el actual"""
+        start = self._rollback_frame
+        self._rollback_frame = None
+        
+        self.scene.restore(self._snapshots[start])
+        for frame in range(start, self.frame):
+            self._simulate(frame)
+        
+        depth = self.frame - start
+        self.rollbacks += 1
+        self.rollback_frames += depth
+        if depth > self.max_rollback:
+            self.max_rollback = depth
+    
+    def _simulate(self, frame: int) -> None:
+        """
+        Simula un tick con la entrada local y la remota (real o predicha).
+        
+        Args:
+            frame: Tick a simular
+        """
+        remote = self.remote_inputs.get(frame)
+        if remote is None:
+            # Predicción: se repite la última entrada remota conocida
+            remote = self.remote_inputs.get(self.last_remote_frame, Button.NONE)
+            self._predicted[frame] = remote
+            # Solo un tick predicho puede ser el inicio de un rollback
+            self._snapshots[frame] = self.scene.snapshot()
+        
+        self.inputs[self.local_player].set(self.local_inputs.get(frame, Button.NONE))
+        self.inputs[1 - self.local_player].set(remote)
+        self.scene.update()
+    
+    def _prune(self) -> None:
+        """Descarta snapshots y entradas que ya no se pueden necesitar"""
+        # Los ticks con ambas entradas confirmadas no vuelven a simularse,
+        # y la entrada local se guarda hasta que el otro lado la confirme
+        floor = min(self.confirmed_frame, self.remote_ack + 1)
+        for frame in range(self._pruned_frame, floor):
+            self._snapshots.pop(frame, None)
+            self._predicted.pop(frame, None)
+            self.local_inputs.pop(frame, None)
+            self.remote_inputs.pop(frame, None)
+        if floor > self._pruned_frame:
+            self._pruned_frame = floor
+    
+    def close(self) -> None:
+        """Cierra el transporte"""
+        self.transport.close()
@@ -0,0 +1,219 @@
+"""
+Transportes de paquetes para el juego en red.
+La sesión de rollback solo necesita enviar y recibir datagramas sin
+bloquear; `UdpTransport` lo hace con asyncio y `LoopbackTransport` simula
+la red dentro del mismo proceso (latencia y pérdida) para pruebas.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+import random
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+class Transport(ABC):
+    """
+    Canal de datagramas hacia el otro jugador.
+    Las subclases implementan `send` y `receive`; ninguno de los dos bloquea.
+    """
+    
+    @abstractmethod
+    def send(self, packet: bytes) -> None:
+        """
+        Envía un paquete (puede perderse).
+        
+        Args:
+            packet: Bytes del paquete
+        """
+        pass
+    
+    @abstractmethod
+    def receive(self) -> List[bytes]:
+        """
+        Obtiene los paquetes llegados desde la última llamada.
+        
+        Returns:
+            Lista de paquetes, en orden de llegada
+        """
+        pass
+    
+    def close(self) -> None:
+        """Libera los recursos del transporte"""
+        pass
+
+class LoopbackTransport(Transport):
+    """
+    Extremo de una red simulada en memoria. Cada llamada a `receive`
+    cuenta como un tick: un paquete llega `latency` ticks después de
+    enviarse, salvo que se pierda.
+    """
+    
+    def __init__(self, latency: int = 0, loss: float = 0.0, seed: Optional[int] = None):
+        """
+        Inicializa el extremo (usar `pair` para crear dos conectados).
+        
+        Args:
+            latency: Ticks que tarda en llegar cada paquete
+            loss: Probabilidad de perder cada paquete (0 a 1)
+            seed: Semilla de las pérdidas, para repetir una prueba
+        """
+        self.latency = latency
+        self.loss = loss
+        self.peer: Optional['LoopbackTransport'] = None
+        self._random = random.Random(seed)
+        self._inbox: Deque[Tuple[int, bytes]] = deque()
+        self._clock = 0
+        self.sent = 0
+        self.dropped = 0
+    
+    @classmethod
+    def pair(cls, latency: int = 0, loss: float = 0.0,
+             seed: Optional[int] = None) -> Tuple['LoopbackTransport', 'LoopbackTransport']:
+        """
+        Crea dos extremos conectados entre sí.
+        
+        Args:
+            latency: Ticks que tarda en llegar cada paquete
+            loss: Probabilidad de perder cada paquete (0 a 1)
+            seed: Semilla de las pérdidas
+        
+        Returns:
+            Tupla (extremo A, extremo B)
+        """
+        a = cls(latency, loss, seed)
+        b = cls(latency, loss, None if seed is None else seed + 1)
+        a.peer = b
+        b.peer = a
+        return a, b
+    
+    def send(self, packet: bytes) -> None:
+        """Encola el paquete en el otro extremo"""
+        self.sent += 1
+        if self.loss and self._random.random() < self.loss:
+            self.dropped += 1
+            return
+        peer = self.peer
+        peer._inbox.append((peer._clock + self.latency, packet))
+    
+    def receive(self) -> List[bytes]:
+        """Avanza un tick y entrega los paquetes que ya llegaron"""
+        self._clock += 1
+        inbox = self._inbox
+        packets = []
+        while inbox and inbox[0][0] <= self._clock:
+            packets.append(inbox.popleft()[1])
+        return packets
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """Protocolo de asyncio que deja los datagramas en una cola"""
+    
+    def __init__(self, inbox: Deque[bytes]):
+        """
+        Inicializa el protocolo.
+        
+        Args:
+            inbox: Cola donde dejar los datagramas recibidos
+        """
+        self.inbox = inbox
+    
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Encola el datagrama recibido"""
+        self.inbox.append(data)
+    
+    def error_received(self, exc: Exception) -> None:
+        """Ignora los errores de envío"""
+        # Con UDP el otro extremo puede no estar escuchando todavía:
+        # los paquetes perdidos se reenvían en los siguientes
+        pass
+
+class UdpTransport(Transport):
+    """
+    Transporte UDP sobre asyncio.
+    Dentro de un programa asyncio se abre con `await open()`; desde el loop
+    de Pyxel (síncrono) `start()` corre el event loop en un hilo propio.
+    """
+    
+    def __init__(self, local_addr: Tuple[str, int], remote_addr: Tuple[str, int]):
+        """
+        Inicializa el transporte (sin abrir el socket).
+        
+        Args:
+            local_addr: Dirección (host, puerto) donde escuchar
+            remote_addr: Dirección (host, puerto) del otro jugador
+        """
+        self.local_addr = local_addr
+        self.remote_addr = remote_addr
+        self._inbox: Deque[bytes] = deque()
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    async def open(self) -> None:
+        """Abre el socket en el event loop actual"""
+        self._loop = asyncio.get_running_loop()
+        self._transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self._inbox),
+            local_addr=self.local_addr,
+            remote_addr=self.remote_addr
+        )
+    
+    def start(self, timeout: float = 5.0) -> None:
+        """
+        Abre el socket en un event loop que corre en un hilo en segundo plano.
+        
+        Args:
+            timeout: Segundos máximos de espera hasta que el socket esté abierto
+        """
+        ready = threading.Event()
+        errors = []
+        
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.open())
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.close()
+        
+        self._thread = threading.Thread(target=run, name="netplay-udp", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise TimeoutError("No se pudo abrir el socket UDP")
+        if errors:
+            raise errors[0]
+    
+    def send(self, packet: bytes) -> None:
+        """Envía el paquete al otro jugador"""
+        if self._transport is None:
+            return
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._transport.sendto, packet)
+        else:
+            self._transport.sendto(packet)
+    
+    def receive(self) -> List[bytes]:
+        """Retorna los datagramas recibidos"""
+        inbox = self._inbox
+        packets = []
+        while inbox:
+            packets.append(inbox.popleft())
+        return packets
+    
+    def close(self) -> None:
+        """Cierra el socket y detiene el hilo del event loop si lo hay"""
+        if self._transport is None:
+            return
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._transport.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        else:
+            self._transport.close()
+        self._transport = None
@@ -1,3 +1,7 @@
 # Physics package
 
 from .engine import PhysicsEngine, CollisionDetector
+from .spatial_hash import SpatialHash
+from .batch import BodyBuffer
+from .broadphase import SweepAndPrune
+from .queries import SpatialQuery, RayHit
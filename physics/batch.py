@@ -0,0 +1,192 @@
+"""
+Buffers de cuerpos dinámicos en formato structure-of-arrays (NumPy).
+Permiten aplicar gravedad, integración y restricciones a muchas entidades
+con unas pocas operaciones vectorizadas por frame.
+
+Las entidades no son vistas sobre el buffer: sus atributos físicos son
+atributos normales y son la fuente de verdad. Cada paso vectorizado copia
+las columnas que necesita al buffer (`pull`) y devuelve las que cambió
+(`push`), una vez por tick. Esa copia tiene un costo fijo, así que con
+pocos cuerpos conviene el camino escalar (ver
+`GameScene.BATCH_MIN_ENEMIES`).
+"""
+
+import numpy as np
+from operator import attrgetter
+from typing import List, Optional, Any, Sequence
+
+class BodyBuffer:
+    """
+    Almacena posición, velocidad y tamaño de muchos cuerpos en arrays
+    contiguos. Cada entidad enlazada ocupa un slot, pero sus atributos
+    siguen siendo atributos normales (la IA y las colisiones los leen
+    cientos de veces por tick): el buffer es la copia de trabajo de los
+    pasos vectorizados, que se sincroniza en bloque con `pull` antes del
+    paso y con `push` después.
+    """
+    
+    # Columnas del buffer (mismo nombre que el atributo de la entidad)
+    COLUMNS = ('x', 'y', 'velocity_x', 'velocity_y', 'width', 'height')
+    _COLUMN_INDEX = {column: index for index, column in enumerate(COLUMNS)}
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Inicializa el buffer de cuerpos.
+        
+        Args:
+            capacity: Capacidad inicial (crece automáticamente)
+        """
+        self.capacity = max(1, capacity)
+        
+        # Todas las columnas en un solo bloque (una fila por columna);
+        # x, y, etc. son vistas de sus filas
+        self.data = np.zeros((len(self.COLUMNS), self.capacity))
+        self._bind_columns()
+        
+        # Slots que participan del paso de física
+        self.enabled = np.zeros(self.capacity, dtype=bool)
+        
+        # Slots usados: [0, size). Los liberados se reutilizan
+        self.size = 0
+        self._free_slots: List[int] = []
+        self._owners: List[Optional[Any]] = [None] * self.capacity
+    
+    def _bind_columns(self) -> None:
+        """Crea las vistas por columna sobre el bloque de datos"""
+        for index, column in enumerate(self.COLUMNS):
+            setattr(self, column, self.data[index])
+    
+    def _grow(self) -> None:
+        """Duplica la capacidad de todos los arrays"""
+        new_capacity = self.capacity * 2
+        
+        data = np.zeros((len(self.COLUMNS), new_capacity))
+        data[:, :self.capacity] = self.data
+        self.data = data
+        self._bind_columns()
+        
+        enabled = np.zeros(new_capacity, dtype=bool)
+        enabled[:self.capacity] = self.enabled
+        self.enabled = enabled
+        
+        self._owners.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+    
+    def attach(self, body: Any) -> int:
+        """
+        Enlaza una entidad al buffer copiando su estado actual.
+        
+        Args:
+            body: Entidad con los atributos de `COLUMNS` y `_body_buffer`/`_body_slot`
+        
+        Returns:
+            Índice del slot asignado
+        """
+        if body._body_buffer is self:
+            return body._body_slot
+        if body._body_buffer is not None:
+            body._body_buffer.detach(body)
+        
+        # Leer los valores locales antes de enlazar
+        values = [getattr(body, column) for column in self.COLUMNS]
+        
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self.size >= self.capacity:
+                self._grow()
+            slot = self.size
+            self.size += 1
+        
+        for column, value in zip(self.COLUMNS, values):
+            getattr(self, column)[slot] = value
+        self.enabled[slot] = True
+        self._owners[slot] = body
+        
+        body._body_buffer = self
+        body._body_slot = slot
+        return slot
+    
+    def detach(self, body: Any) -> None:
+        """
+        Desenlaza una entidad y libera su slot. Sus atributos ya tienen
+        el último estado (ver `push`).
+        
+        Args:
+            body: Entidad previamente enlazada
+        """
+        if body._body_buffer is not self:
+            return
+        
+        slot = body._body_slot
+        body._body_buffer = None
+        body._body_slot = -1
+        
+        self.enabled[slot] = False
+        self._owners[slot] = None
+        self._free_slots.append(slot)
+    
+    def set_enabled(self, body: Any, enabled: bool) -> None:
+        """
+        Incluye o excluye un cuerpo enlazado del paso de física.
+        
+        Args:
+            body: Entidad enlazada a este buffer
+            enabled: True para simularla
+        """
+        if body._body_buffer is self:
+            self.enabled[body._body_slot] = enabled
+    
+    def enabled_slots(self) -> np.ndarray:
+        """Retorna los slots habilitados para el paso de física"""
+        return np.flatnonzero(self.enabled[:self.size])
+    
+    def pull(self, slots: np.ndarray, columns: Sequence[str] = COLUMNS) -> None:
+        """
+        Copia a los arrays los atributos actuales de los cuerpos de varios
+        slots (una lectura en bloque por cuerpo).
+        
+        Args:
+            slots: Slots a sincronizar
+            columns: Columnas a copiar
+        """
+        count = len(slots)
+        if count == 0:
+            return
+        owners = self._owners
+        bodies = [owners[slot] for slot in slots.tolist()]
+        for column in columns:
+            values = np.fromiter(map(attrgetter(column), bodies), dtype=np.float64, count=count)
+            self.data[self._COLUMN_INDEX[column], slots] = values
+    
+    def push(self, slots: np.ndarray, columns: Sequence[str] = COLUMNS) -> None:
+        """
+        Escribe en los atributos de los cuerpos de varios slots los valores
+        de los arrays (después de un paso vectorizado).
+        
+        Args:
+            slots: Slots a sincronizar
+            columns: Columnas a escribir
+        """
+        if len(slots) == 0:
+            return
+        owners = self._owners
+        bodies = [owners[slot] for slot in slots.tolist()]
+        rows = [self._COLUMN_INDEX[column] for column in columns]
+        for column, values in zip(columns, self.data[np.ix_(rows, slots)].tolist()):
+            for body, value in zip(bodies, values):
+                setattr(body, column, value)
+    
+    def clear(self) -> None:
+        """Desenlaza todas las entidades y vacía el buffer"""
+        for body in self._owners[:self.size]:
+            if body is not None:
+                self.detach(body)
+        
+        self.enabled[:] = False
+        self.size = 0
+        self._free_slots.clear()
+    
+    def __len__(self) -> int:
+        """Retorna el número de cuerpos enlazados"""
+        return self.size - len(self._free_slots)
@@ -0,0 +1,152 @@
+"""
+Broadphase sort-and-sweep para entidades dinámicas.
+Mantiene las entidades ordenadas por X y genera pares candidatos
+solo entre las que se solapan en ese eje.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from entities.base import Entity
+
+class SweepAndPrune:
+    """
+    Lista de entidades ordenada por su borde izquierdo.
+    Como las entidades se mueven poco entre frames, la lista está casi
+    ordenada y se reordena con insertion sort en tiempo casi lineal.
+    Un mapa entidad → índice permite quitar y consultar en O(1): `remove`
+    deja un hueco (None) que se compacta en el próximo `update`.
+    """
+    
+    def __init__(self):
+        """Inicializa el broadphase vacío"""
+        self._bodies: List[Optional[Entity]] = []
+        self._keys: List[float] = []
+        self._index: Dict[Entity, int] = {}
+        self._holes = 0
+    
+    def add(self, entity: Entity) -> None:
+        """
+        Agrega una entidad (se ubica en su lugar en el próximo `update`).
+        
+        Args:
+            entity: La entidad a agregar
+        """
+        self._index[entity] = len(self._bodies)
+        self._bodies.append(entity)
+        self._keys.append(entity.x)
+    
+    def remove(self, entity: Entity) -> None:
+        """
+        Quita una entidad del broadphase.
+        
+        Args:
+            entity: La entidad a quitar
+        """
+        index = self._index.pop(entity, None)
+        if index is not None:
+            self._bodies[index] = None
+            self._holes += 1
+    
+    def clear(self) -> None:
+        """Quita todas las entidades"""
+        self._bodies.clear()
+        self._keys.clear()
+        self._index.clear()
+        self._holes = 0
+    
+    def _compact(self) -> None:
+        """Cierra los huecos dejados por `remove` conservando el orden"""
+        if not self._holes:
+            return
+        
+        kept = [index for index, body in enumerate(self._bodies) if body is not None]
+        self._bodies = [self._bodies[index] for index in kept]
+        self._keys = [self._keys[index] for index in kept]
+        self._index = {body: index for index, body in enumerate(self._bodies)}
+        self._holes = 0
+    
+    @property
+    def entities(self) -> List[Entity]:
+        """Retorna las entidades en el orden actual del barrido (no modificar)"""
+        self._compact()
+        return self._bodies
+    
+    def set_order(self, entities: List[Entity]) -> None:
+        """
+        Reemplaza las entidades respetando el orden dado (por ejemplo, al
+        restaurar un snapshot, para que los pares salgan en el mismo orden).
+        
+        Args:
+            entities: Entidades en orden de barrido
+        """
+        self._bodies = list(entities)
+        self._keys = [0.0] * len(self._bodies)  # Se recalculan en `update`
+        self._index = {body: index for index, body in enumerate(self._bodies)}
+        self._holes = 0
+    
+    def update(self) -> None:
+        """
+        Relee las posiciones X y reordena la lista de forma incremental.
+        """
+        self._compact()
+        bodies = self._bodies
+        index = self._index
+        keys = [body.x for body in bodies]
+        
+        # Insertion sort: O(n) si el orden cambió poco desde el frame anterior
+        for i in range(1, len(keys)):
+            key = keys[i]
+            if keys[i - 1] <= key:
+                continue
+            
+            body = bodies[i]
+            j = i - 1
+            while j >= 0 and keys[j] > key:
+                keys[j + 1] = keys[j]
+                bodies[j + 1] = bodies[j]
+                index[bodies[j]] = j + 1
+                j -= 1
+            keys[j + 1] = key
+            bodies[j + 1] = body
+            index[body] = j + 1
+        
+        self._keys = keys
+    
+    def find_pairs(self) -> List[Tuple[Entity, Entity]]:
+        """
+        Genera los pares de entidades cuyos AABB se solapan.
+        Debe llamarse después de `update`.
+        
+        Returns:
+            Lista de pares (a, b) con a.x <= b.x
+        """
+        self._compact()
+        pairs = []
+        bodies = self._bodies
+        keys = self._keys
+        count = len(bodies)
+        
+        for i in range(count):
+            a = bodies[i]
+            if not a.collision_enabled:
+                continue
+            
+            a_right = keys[i] + a.width
+            a_top = a.y
+            a_bottom = a_top + a.height
+            
+            j = i + 1
+            while j < count and keys[j] < a_right:
+                b = bodies[j]
+                if b.collision_enabled and b.y < a_bottom and b.y + b.height > a_top:
+                    pairs.append((a, b))
+                j += 1
+        
+        return pairs
+    
+    def __len__(self) -> int:
+        """Retorna el número de entidades en el broadphase"""
+        return len(self._index)
+    
+    def __contains__(self, entity: Entity) -> bool:
+        """Verifica si una entidad está en el broadphase"""
+        return entity in self._index
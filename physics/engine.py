@@ -3,9 +3,14 @@ Sistema de física para el juego Mario Bros.
 Maneja gravedad, colisiones y movimiento de entidades.
 """
 
-from typing import List, Tuple, Optional
+import numpy as np
+from typing import List, Tuple, Optional, Union
 from entities.base import Entity
 from config.settings import GameSettings
+from physics.spatial_hash import SpatialHash
+from physics.batch import BodyBuffer
+from levels.tilemap import TileMap
+from core.tracing import traced
 
 class PhysicsEngine:
     """
@@ -58,19 +63,25 @@ class PhysicsEngine:
             return True
         return False
     
-    def check_platform_collision(self, entity: Entity, platforms: List[Entity]) -> bool:
+    def check_platform_collision(self, entity: Entity,
+                                 platforms: Union[List[Entity], SpatialHash]) -> bool:
         """
         Verifica y resuelve colisiones con plataformas.
         
         Args:
             entity: La entidad a verificar
-            platforms: Lista de plataformas
+            platforms: Lista de plataformas o hash espacial que las indexa
             
         Returns:
             True si la entidad está sobre una plataforma
         """
         on_platform = False
         
+        if isinstance(platforms, SpatialHash):
+            # Solo probar las plataformas cercanas. El margen cubre los
+            # desplazamientos que produce la propia resolución de colisiones.
+            platforms = platforms.query_entity(entity, max(entity.width, entity.height))
+        
         for platform in platforms:
             if not platform.active:
                 continue
@@ -99,6 +110,63 @@ class PhysicsEngine:
         
         return on_platform
     
+    def check_tile_collision(self, entity: Entity, tilemap: TileMap) -> bool:
+        """
+        Verifica y resuelve colisiones contra un mapa de tiles.
+        Solo se consultan las celdas que la entidad solapa, por lo que el
+        costo no depende del tamaño del nivel.
+        
+        Args:
+            entity: La entidad a verificar
+            tilemap: Mapa de tiles del nivel
+            
+        Returns:
+            True si la entidad está apoyada sobre un tile
+        """
+        on_tile = False
+        size = tilemap.tile_size
+        
+        for column, row in tilemap.solid_cells_in_rect(entity.x, entity.y, entity.width, entity.height):
+            tile_x = column * size
+            tile_y = row * size
+            
+            # Recalcular el solapamiento: resoluciones anteriores pueden
+            # haber sacado a la entidad de este tile
+            overlap_x = min(entity.right, tile_x + size) - max(entity.x, tile_x)
+            overlap_y = min(entity.bottom, tile_y + size) - max(entity.y, tile_y)
+            if overlap_x <= 0 or overlap_y <= 0:
+                continue
+            
+            above = entity.center_y < tile_y + size / 2
+            left = entity.center_x < tile_x + size / 2
+            
+            # Solo se puede empujar por caras expuestas (sin tile sólido
+            # vecino); evita enganches en las uniones entre tiles
+            vertical_free = not tilemap.is_solid(column, row - 1 if above else row + 1)
+            horizontal_free = not tilemap.is_solid(column - 1 if left else column + 1, row)
+            
+            if vertical_free and (overlap_y <= overlap_x or not horizontal_free):
+                if above:
+                    # Aterrizaje sobre el tile
+                    entity.y = tile_y - entity.height
+                    if entity.velocity_y > 0:
+                        entity.velocity_y = 0
+                    on_tile = True
+                else:
+                    # Golpe de cabeza
+                    entity.y = tile_y + size
+                    if entity.velocity_y < 0:
+                        entity.velocity_y = 0
+            elif horizontal_free:
+                # Colisión lateral
+                if left:
+                    entity.x = tile_x - entity.width
+                else:
+                    entity.x = tile_x + size
+                entity.velocity_x = 0
+        
+        return on_tile
+    
     def keep_in_bounds(self, entity: Entity, 
                       min_x: float = 0, max_x: float = float('inf'),
                       min_y: float = -float('inf'), max_y: float = float('inf')) -> None:
@@ -127,6 +195,89 @@ class PhysicsEngine:
         elif entity.bottom > max_y:
             entity.y = max_y - entity.height
             entity.velocity_y = 0
+    
+    @traced
+    def integrate_bodies(self, bodies: BodyBuffer, ground_y: float,
+                         slots: Optional[np.ndarray] = None) -> None:
+        """
+        Aplica gravedad, actualiza posiciones y resuelve la colisión con el
+        suelo para muchos cuerpos de un buffer a la vez.
+        Equivale a `apply_gravity`, `update_position` y
+        `check_ground_collision` llamados sobre cada cuerpo.
+        
+        Args:
+            bodies: Buffer con los cuerpos a simular
+            ground_y: Altura del suelo
+            slots: Slots a simular (por defecto, todos los habilitados)
+        """
+        if slots is None:
+            slots = bodies.enabled_slots()
+        if len(slots) == 0:
+            return
+        
+        height = bodies.height[slots]
+        
+        # Gravedad con velocidad máxima de caída
+        velocity_y = np.minimum(bodies.velocity_y[slots] + self.gravity, self.max_fall_speed)
+        
+        # Integración de posición
+        x = bodies.x[slots] + bodies.velocity_x[slots]
+        y = bodies.y[slots] + velocity_y
+        
+        # Colisión con el suelo
+        on_ground = y + height >= ground_y
+        y[on_ground] = ground_y - height[on_ground]
+        velocity_y[on_ground & (velocity_y > 0)] = 0.0
+        
+        bodies.x[slots] = x
+        bodies.y[slots] = y
+        bodies.velocity_y[slots] = velocity_y
+    
+    @traced
+    def keep_bodies_in_bounds(self, bodies: BodyBuffer,
+                              min_x: float = 0, max_x: float = float('inf'),
+                              min_y: float = -float('inf'), max_y: float = float('inf'),
+                              slots: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versión vectorizada de `keep_in_bounds` para un buffer de cuerpos.
+        
+        Args:
+            bodies: Buffer con los cuerpos a restringir
+            min_x: Límite izquierdo
+            max_x: Límite derecho
+            min_y: Límite superior
+            max_y: Límite inferior
+            slots: Slots a restringir (por defecto, todos los habilitados)
+            
+        Returns:
+            Slots corregidos en horizontal (x, velocity_x) y en vertical
+            (y, velocity_y)
+        """
+        if slots is None:
+            slots = bodies.enabled_slots()
+        
+        x = bodies.x[slots]
+        y = bodies.y[slots]
+        width = bodies.width[slots]
+        height = bodies.height[slots]
+        
+        # Límites horizontales (el derecho solo si no se corrigió el izquierdo)
+        left = x < min_x
+        right = ~left & (x + width > max_x)
+        horizontal = slots[left | right]
+        bodies.x[slots[left]] = min_x
+        bodies.x[slots[right]] = max_x - width[right]
+        bodies.velocity_x[horizontal] = 0.0
+        
+        # Límites verticales
+        top = y < min_y
+        bottom = ~top & (y + height > max_y)
+        vertical = slots[top | bottom]
+        bodies.y[slots[top]] = min_y
+        bodies.y[slots[bottom]] = max_y - height[bottom]
+        bodies.velocity_y[vertical] = 0.0
+        
+        return horizontal, vertical
 
 class CollisionDetector:
     """
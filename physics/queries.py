@@ -0,0 +1,329 @@
+"""
+Consultas espaciales sobre la geometría de colisión del nivel.
+Ofrece raycasts, consultas de punto y de AABB respaldadas por el hash
+espacial de plataformas y, si existe, por el mapa de tiles.
+"""
+
+import math
+import numpy as np
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+from entities.base import Entity
+from physics.spatial_hash import SpatialHash
+from levels.tilemap import TileMap
+from config.settings import GameSettings, LevelSettings
+
+class RayHit(NamedTuple):
+    """Resultado de un raycast"""
+    x: float                  # Punto de impacto en X
+    y: float                  # Punto de impacto en Y
+    distance: float           # Distancia desde el origen
+    normal_x: float           # Normal de la cara golpeada (0 si el origen ya era sólido)
+    normal_y: float
+    entity: Optional[Entity]  # Plataforma golpeada (None para tiles o suelo)
+
+def _ray_vs_rect(origin_x: float, origin_y: float, dir_x: float, dir_y: float,
+                 x: float, y: float, width: float, height: float) -> Optional[Tuple[float, float, float]]:
+    """
+    Intersección rayo–AABB por el método de slabs.
+    
+    Returns:
+        Tupla (t, normal_x, normal_y) de la primera intersección o None
+    """
+    t_near = -math.inf
+    t_far = math.inf
+    normal_x = normal_y = 0.0
+    
+    for origin, direction, low, high, axis in ((origin_x, dir_x, x, x + width, 0),
+                                               (origin_y, dir_y, y, y + height, 1)):
+        if direction == 0:
+            if origin < low or origin >= high:
+                return None
+            continue
+        
+        t1 = (low - origin) / direction
+        t2 = (high - origin) / direction
+        if t1 > t2:
+            t1, t2 = t2, t1
+        
+        if t1 > t_near:
+            t_near = t1
+            if axis == 0:
+                normal_x, normal_y = (-1.0 if direction > 0 else 1.0), 0.0
+            else:
+                normal_x, normal_y = 0.0, (-1.0 if direction > 0 else 1.0)
+        t_far = min(t_far, t2)
+        
+        if t_near > t_far:
+            return None
+    
+    if t_far < 0:
+        return None
+    if t_near < 0:
+        # El origen está dentro del rectángulo
+        return (0.0, 0.0, 0.0)
+    return (t_near, normal_x, normal_y)
+
+def _traverse_grid(origin_x: float, origin_y: float, dir_x: float, dir_y: float,
+                   max_distance: float, cell_size: float) -> Iterator[Tuple[int, int, float, float, float, float]]:
+    """
+    Recorre las celdas de una grilla que atraviesa un rayo (DDA).
+    
+    Yields:
+        Tuplas (cx, cy, t_entrada, t_salida, normal_x, normal_y)
+    """
+    cell_x = math.floor(origin_x / cell_size)
+    cell_y = math.floor(origin_y / cell_size)
+    
+    step_x = 1 if dir_x > 0 else -1
+    step_y = 1 if dir_y > 0 else -1
+    
+    if dir_x != 0:
+        boundary_x = (cell_x + (1 if dir_x > 0 else 0)) * cell_size
+        t_max_x = (boundary_x - origin_x) / dir_x
+        t_delta_x = cell_size / abs(dir_x)
+    else:
+        t_max_x = t_delta_x = math.inf
+    
+    if dir_y != 0:
+        boundary_y = (cell_y + (1 if dir_y > 0 else 0)) * cell_size
+        t_max_y = (boundary_y - origin_y) / dir_y
+        t_delta_y = cell_size / abs(dir_y)
+    else:
+        t_max_y = t_delta_y = math.inf
+    
+    t_enter = 0.0
+    normal_x = normal_y = 0.0
+    
+    while t_enter <= max_distance:
+        t_exit = min(t_max_x, t_max_y)
+        yield cell_x, cell_y, t_enter, t_exit, normal_x, normal_y
+        
+        if t_max_x < t_max_y:
+            cell_x += step_x
+            t_enter = t_max_x
+            t_max_x += t_delta_x
+            normal_x, normal_y = float(-step_x), 0.0
+        else:
+            cell_y += step_y
+            t_enter = t_max_y
+            t_max_y += t_delta_y
+            normal_x, normal_y = 0.0, float(-step_y)
+
+class SpatialQuery:
+    """
+    Servicio de consultas espaciales sobre la geometría sólida del nivel:
+    plataformas (vía hash espacial), tiles y el suelo plano.
+    Todas las consultas miran solo las celdas relevantes.
+    """
+    
+    def __init__(self, platforms: SpatialHash, tilemap: Optional[TileMap] = None,
+                 ground_y: float = math.inf, level_width: float = LevelSettings.LEVEL_WIDTH):
+        """
+        Inicializa el servicio de consultas.
+        
+        Args:
+            platforms: Hash espacial con la geometría de plataformas
+            tilemap: Mapa de tiles del nivel (opcional)
+            ground_y: Altura del suelo plano (inf si no hay)
+            level_width: Ancho del nivel en pixels
+        """
+        self.platforms = platforms
+        self.tilemap = tilemap
+        self.ground_y = ground_y
+        self.level_width = level_width
+    
+    def point_solid(self, x: float, y: float) -> bool:
+        """
+        Verifica si un punto está dentro de geometría sólida.
+        
+        Args:
+            x: Coordenada X en el mundo
+            y: Coordenada Y en el mundo
+        
+        Returns:
+            True si el punto es sólido
+        """
+        if y >= self.ground_y:
+            return True
+        
+        if self.tilemap is not None and self.tilemap.is_solid_at(x, y):
+            return True
+        
+        size = self.platforms.cell_size
+        for platform in self.platforms.query_cell(int(x // size), int(y // size)):
+            if (platform.active and
+                platform.x <= x < platform.right and
+                platform.y <= y < platform.bottom):
+                return True
+        
+        return False
+    
+    def points_solid(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Versión vectorizada de `point_solid` para muchos puntos a la vez.
+        Las plataformas se prueban por celda del hash espacial, contra
+        todos los puntos que caen en ella.
+        
+        Args:
+            xs: Coordenadas X en el mundo
+            ys: Coordenadas Y en el mundo
+        
+        Returns:
+            Array booleano, True para los puntos sólidos
+        """
+        solid = ys >= self.ground_y
+        
+        tilemap = self.tilemap
+        if tilemap is not None:
+            size = tilemap.tile_size
+            columns = xs // size
+            rows = ys // size
+            inside = ~solid & (columns >= 0) & (columns < tilemap.columns) & (rows >= 0) & (rows < tilemap.rows)
+            cells = (rows[inside] * tilemap.columns + columns[inside]).astype(np.intp)
+            tiles = np.frombuffer(tilemap.tiles, dtype=np.uint8)
+            flags = np.frombuffer(tilemap.tile_flags, dtype=np.uint8)
+            solid[inside] = (flags[tiles[cells]] & TileMap.FLAG_SOLID) != 0
+        
+        pending = np.flatnonzero(~solid)
+        if len(self.platforms) == 0 or len(pending) == 0:
+            return solid
+        
+        # Agrupar los puntos pendientes por celda del hash
+        size = self.platforms.cell_size
+        keys = np.stack((xs[pending] // size, ys[pending] // size), axis=1).astype(np.int64)
+        cells, inverse = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(inverse.ravel(), kind='stable')
+        bounds = np.searchsorted(inverse.ravel()[order], np.arange(len(cells) + 1))
+        
+        for index, (cell_x, cell_y) in enumerate(cells.tolist()):
+            platforms = self.platforms.query_cell(cell_x, cell_y)
+            if not platforms:
+                continue
+            points = pending[order[bounds[index]:bounds[index + 1]]]
+            px = xs[points]
+            py = ys[points]
+            hit = np.zeros(len(points), dtype=bool)
+            for platform in platforms:
+                if platform.active:
+                    hit |= (platform.x <= px) & (px < platform.right) & (platform.y <= py) & (py < platform.bottom)
+            solid[points] = hit
+        
+        return solid
+    
+    def query_aabb(self, x: float, y: float, width: float, height: float) -> List[Tuple[float, float, float, float]]:
+        """
+        Obtiene la geometría sólida que se solapa con un rectángulo.
+        El suelo plano se reporta recortado al ancho consultado.
+        
+        Args:
+            x: Posición X del rectángulo
+            y: Posición Y del rectángulo
+            width: Ancho del rectángulo
+            height: Alto del rectángulo
+        
+        Returns:
+            Lista de rectángulos (x, y, ancho, alto)
+        """
+        rects = []
+        right = x + width
+        bottom = y + height
+        
+        for platform in self.platforms.query(x, y, width, height):
+            if (platform.active and
+                platform.x < right and platform.right > x and
+                platform.y < bottom and platform.bottom > y):
+                rects.append(platform.rect)
+        
+        if self.tilemap is not None:
+            size = self.tilemap.tile_size
+            for column, row in self.tilemap.solid_cells_in_rect(x, y, width, height):
+                rects.append((column * size, row * size, size, size))
+        
+        if bottom > self.ground_y:
+            rects.append((x, self.ground_y, width, bottom - self.ground_y))
+        
+        return rects
+    
+    def raycast(self, x: float, y: float, direction_x: float, direction_y: float,
+                max_distance: float = GameSettings.WINDOW_WIDTH) -> Optional[RayHit]:
+        """
+        Lanza un rayo y retorna el primer impacto con geometría sólida.
+        
+        Args:
+            x: Origen X del rayo
+            y: Origen Y del rayo
+            direction_x: Dirección X (no necesita estar normalizada)
+            direction_y: Dirección Y
+            max_distance: Distancia máxima a recorrer
+        
+        Returns:
+            RayHit del impacto más cercano o None
+        """
+        length = math.hypot(direction_x, direction_y)
+        if length == 0:
+            return None
+        dir_x = direction_x / length
+        dir_y = direction_y / length
+        
+        best: Optional[Tuple[float, float, float, Optional[Entity]]] = None
+        
+        # Suelo plano
+        if y >= self.ground_y:
+            best = (0.0, 0.0, 0.0, None)
+        elif dir_y > 0:
+            t = (self.ground_y - y) / dir_y
+            if t <= max_distance:
+                best = (t, 0.0, -1.0, None)
+        
+        # Tiles: la primera celda sólida atravesada
+        if self.tilemap is not None:
+            limit = best[0] if best else max_distance
+            for cell_x, cell_y, t_enter, _, normal_x, normal_y in _traverse_grid(
+                    x, y, dir_x, dir_y, limit, self.tilemap.tile_size):
+                if self.tilemap.is_solid(cell_x, cell_y):
+                    best = (t_enter, normal_x, normal_y, None)
+                    break
+        
+        # Plataformas: recorrer celdas del hash hasta que ninguna celda
+        # posterior pueda tener un impacto más cercano
+        tested = set()
+        limit = best[0] if best else max_distance
+        for cell_x, cell_y, _, t_exit, _, _ in _traverse_grid(
+                x, y, dir_x, dir_y, limit, self.platforms.cell_size):
+            for platform in self.platforms.query_cell(cell_x, cell_y):
+                if not platform.active or id(platform) in tested:
+                    continue
+                tested.add(id(platform))
+                
+                hit = _ray_vs_rect(x, y, dir_x, dir_y,
+                                   platform.x, platform.y, platform.width, platform.height)
+                if hit is not None and hit[0] <= limit:
+                    best = (hit[0], hit[1], hit[2], platform)
+                    limit = hit[0]
+            
+            if best is not None and best[0] <= t_exit:
+                break
+        
+        if best is None:
+            return None
+        
+        t, normal_x, normal_y, entity = best
+        return RayHit(x + dir_x * t, y + dir_y * t, t, normal_x, normal_y, entity)
+    
+    def line_of_sight(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        """
+        Verifica si hay línea de visión directa entre dos puntos.
+        
+        Args:
+            x1: Coordenada X del primer punto
+            y1: Coordenada Y del primer punto
+            x2: Coordenada X del segundo punto
+            y2: Coordenada Y del segundo punto
+        
+        Returns:
+            True si ninguna geometría sólida bloquea el segmento
+        """
+        distance = math.hypot(x2 - x1, y2 - y1)
+        if distance == 0:
+            return not self.point_solid(x1, y1)
+        return self.raycast(x1, y1, x2 - x1, y2 - y1, distance) is None
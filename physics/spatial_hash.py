@@ -0,0 +1,185 @@
+"""
+Hash espacial de grilla uniforme para el broadphase de colisiones.
+Permite consultar solo las entidades cercanas a un AABB en lugar de
+recorrer listas completas.
+"""
+
+from typing import Dict, List, Tuple
+from entities.base import Entity
+from config.settings import GameSettings
+
+class SpatialHash:
+    """
+    Grilla uniforme que indexa entidades por las celdas que ocupan.
+    Pensada para geometría mayormente estática (plataformas, bloques).
+    """
+    
+    def __init__(self, cell_size: int = GameSettings.SPATIAL_HASH_CELL_SIZE):
+        """
+        Inicializa el hash espacial.
+        
+        Args:
+            cell_size: Tamaño de cada celda en pixels
+        """
+        self.cell_size = cell_size
+        
+        # Celda (cx, cy) -> entidades registradas en esa celda
+        self._cells: Dict[Tuple[int, int], List[Entity]] = {}
+        
+        # id(entidad) -> (entidad, celdas ocupadas, orden de inserción)
+        self._entries: Dict[int, Tuple[Entity, List[Tuple[int, int]], int]] = {}
+        self._next_order = 0
+    
+    def _cells_for_rect(self, x: float, y: float, width: float, height: float) -> List[Tuple[int, int]]:
+        """
+        Calcula las celdas que cubre un rectángulo.
+        
+        Args:
+            x: Posición X del rectángulo
+            y: Posición Y del rectángulo
+            width: Ancho del rectángulo
+            height: Alto del rectángulo
+        
+        Returns:
+            Lista de coordenadas de celda (cx, cy)
+        """
+        size = self.cell_size
+        min_cx = int(x // size)
+        max_cx = int((x + width) // size)
+        min_cy = int(y // size)
+        max_cy = int((y + height) // size)
+        
+        return [(cx, cy)
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)]
+    
+    def insert(self, entity: Entity) -> None:
+        """
+        Registra una entidad en las celdas que ocupa actualmente.
+        
+        Args:
+            entity: La entidad a registrar
+        """
+        if id(entity) in self._entries:
+            self.update(entity)
+            return
+        
+        cells = self._cells_for_rect(entity.x, entity.y, entity.width, entity.height)
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(entity)
+        
+        self._entries[id(entity)] = (entity, cells, self._next_order)
+        self._next_order += 1
+    
+    def remove(self, entity: Entity) -> None:
+        """
+        Elimina una entidad del hash.
+        
+        Args:
+            entity: La entidad a eliminar
+        """
+        entry = self._entries.pop(id(entity), None)
+        if entry is None:
+            return
+        
+        for cell in entry[1]:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.remove(entity)
+            if not bucket:
+                del self._cells[cell]
+    
+    def update(self, entity: Entity) -> None:
+        """
+        Vuelve a registrar una entidad que cambió de posición o tamaño.
+        Conserva su orden de inserción original.
+        
+        Args:
+            entity: La entidad a actualizar
+        """
+        entry = self._entries.get(id(entity))
+        if entry is None:
+            self.insert(entity)
+            return
+        
+        order = entry[2]
+        self.remove(entity)
+        
+        cells = self._cells_for_rect(entity.x, entity.y, entity.width, entity.height)
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(entity)
+        self._entries[id(entity)] = (entity, cells, order)
+    
+    def query(self, x: float, y: float, width: float, height: float) -> List[Entity]:
+        """
+        Obtiene las entidades registradas en las celdas que cubre un AABB.
+        El resultado puede incluir entidades que no se solapan exactamente
+        (es un broadphase); el orden es el de inserción.
+        
+        Args:
+            x: Posición X del rectángulo
+            y: Posición Y del rectángulo
+            width: Ancho del rectángulo
+            height: Alto del rectángulo
+        
+        Returns:
+            Lista de entidades candidatas sin duplicados
+        """
+        cells = self._cells
+        found: Dict[int, Entity] = {}
+        
+        for cell in self._cells_for_rect(x, y, width, height):
+            bucket = cells.get(cell)
+            if bucket:
+                for entity in bucket:
+                    found[id(entity)] = entity
+        
+        if len(found) < 2:
+            return list(found.values())
+        
+        # Mantener el orden de inserción para que la resolución sea
+        # idéntica a recorrer la lista completa de plataformas
+        entries = self._entries
+        return sorted(found.values(), key=lambda entity: entries[id(entity)][2])
+    
+    def query_entity(self, entity: Entity, margin: float = 0) -> List[Entity]:
+        """
+        Obtiene las entidades cercanas a otra entidad.
+        
+        Args:
+            entity: La entidad de referencia
+            margin: Margen extra alrededor del rectángulo de la entidad
+        
+        Returns:
+            Lista de entidades candidatas
+        """
+        return self.query(entity.x - margin, entity.y - margin,
+                          entity.width + margin * 2, entity.height + margin * 2)
+    
+    def query_cell(self, cell_x: int, cell_y: int) -> List[Entity]:
+        """
+        Obtiene las entidades registradas en una celda concreta.
+        
+        Args:
+            cell_x: Coordenada X de la celda
+            cell_y: Coordenada Y de la celda
+            
+        Returns:
+            Lista de entidades de la celda (no modificar)
+        """
+        return self._cells.get((cell_x, cell_y), [])
+    
+    def clear(self) -> None:
+        """Elimina todas las entidades del hash"""
+        self._cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+    
+    def __len__(self) -> int:
+        """Retorna el número de entidades registradas"""
+        return len(self._entries)
+    
+    def __contains__(self, entity: Entity) -> bool:
+        """Verifica si una entidad está registrada"""
+        return id(entity) in self._entries
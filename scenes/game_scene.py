@@ -1,15 +1,34 @@
 """
 Escena principal del juego donde ocurre la acción.
 Maneja la lógica del gameplay, entidades y renderizado.
+Pyxel solo se importa al dibujar, así la simulación corre sin él
+(ver simulation.headless).
 """
 
-import pyxel
-from typing import List
-from entities.player import Mario
+import struct
+import numpy as np
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+from entities.player import Mario, Luigi
 from entities.base import Entity
+from entities.enemies.base import Enemy
 from entities.enemies.goomba import Goomba
 from physics.engine import PhysicsEngine
+from physics.spatial_hash import SpatialHash
+from physics.batch import BodyBuffer
+from physics.broadphase import SweepAndPrune
+from physics.queries import SpatialQuery
+from levels.tilemap import TileMap
+from levels.geometry import merge_static_blocks
 from core.camera import Camera
+from core.activation import ActivationRegion
+from core.input import Button, InputProvider, PyxelInput
+from core.snapshot import RecordBlock, layout_for
+from core.rewind import RewindBuffer
+from core.profiler import FrameProfiler
+from core.tracing import traced
+from core.memory import scene_memory, summarize_report
+from ui.profiler_overlay import ProfilerOverlay
 from config.settings import GameSettings, LevelSettings
 
 class GameScene:
@@ -18,29 +37,96 @@ class GameScene:
     Coordina todas las entidades, física y renderizado.
     """
     
-    def __init__(self):
-        """Inicializa la escena del juego"""
+    # Posición inicial X de cada jugador (Mario, Luigi)
+    PLAYER_SPAWN_X = (50, 74)
+    
+    # Altura a partir de la cual se pierde a quien cae (los niveles de
+    # tiles pueden tener pozos): el jugador pierde una vida y el enemigo
+    # se elimina. No se limita el borde inferior, así siempre se alcanza
+    PLAYER_FALL_LIMIT_Y = GameSettings.WINDOW_HEIGHT + 50
+    ENEMY_FALL_LIMIT_Y = GameSettings.WINDOW_HEIGHT + 100
+    
+    # Enemigos despiertos a partir de los cuales conviene la física por
+    # lotes: con menos, el costo fijo de NumPy por tick supera al de
+    # recorrerlos uno a uno y se usa el camino escalar (mismo resultado)
+    BATCH_MIN_ENEMIES = 64
+    
+    # Formato de snapshot: cabecera de la escena y pertenencia de cada enemigo
+    # cabecera: generación, tick, jugadores, enemigos, enemigos en escena,
+    # cámara (x, y, objetivo x, y), pausa, game over, nivel completo, debug
+    SNAPSHOT_HEADER = struct.Struct('<IIIIIdddd????')
+    # prefijo de cada jugador: entrada (actual, anterior), orden en el broadphase
+    SNAPSHOT_PLAYER_PREFIX = 'IIi'
+    # prefijo de cada enemigo: en escena, activación (0 despierto, 1 dormido,
+    # -1 fuera), orden en la activación, clave de dormido, orden en el broadphase
+    SNAPSHOT_ENEMY_PREFIX = '?bidi'
+    
+    def __init__(self, input_provider: Optional[InputProvider] = None,
+                 enemy_bodies: Optional[BodyBuffer] = None,
+                 rewind: Optional[RewindBuffer] = None,
+                 second_player: Optional[InputProvider] = None):
+        """
+        Inicializa la escena del juego.
+        
+        Args:
+            input_provider: Fuente de entrada (por defecto, el teclado vía Pyxel).
+                Con otra fuente la escena se puede simular sin ventana
+            enemy_bodies: Buffer de cuerpos compartido con otras escenas
+                (ver `integrate_enemy_bodies`); por defecto uno propio
+            rewind: Buffer de rebobinado; con él se guarda un snapshot por
+                tick y mantener Button.REWIND vuelve atrás en el tiempo
+            second_player: Entrada de Luigi; sin ella se juega solo con Mario.
+                Pausa y debug son los de Mario; reiniciar, de cualquiera
+        """
         
         # Sistemas principales
         self.physics_engine = PhysicsEngine()
         self.camera = Camera()
+        self.input = input_provider if input_provider is not None else PyxelInput()
         
         # Entidades
-        self.mario = Mario(50, LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT)
+        self.mario = Mario(self.PLAYER_SPAWN_X[0], LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT, self.input)
+        self.luigi: Optional[Luigi] = None
+        if second_player is not None:
+            self.luigi = Luigi(self.PLAYER_SPAWN_X[1], LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT, second_player)
+        self.players: List[Mario] = [self.mario] if self.luigi is None else [self.mario, self.luigi]
         self.entities: List[Entity] = []
         self.platforms: List[Entity] = []
+        self.platform_hash = SpatialHash()  # Broadphase para colisiones con plataformas
+        self.collision_geometry: List[Entity] = []  # Plataformas fusionadas (solo colisión)
         self.enemies: List[Goomba] = []  # Lista específica para enemigos
+        self._enemy_registry: List[Goomba] = []  # Todos los enemigos creados en el nivel (snapshots)
+        self._enemy_layouts = []  # Formato de snapshot de cada enemigo del registro
+        self._enemy_blocks = {}  # Bloques de registros por cantidad de enemigos
+        self.enemy_bodies = enemy_bodies if enemy_bodies is not None else BodyBuffer()  # Física por lotes de los enemigos
+        self.activation = ActivationRegion()  # Enemigos despiertos cerca de la cámara
+        self.broadphase = SweepAndPrune()  # Pares candidatos entre jugadores y enemigos
+        for player in self.players:
+            self.broadphase.add(player)
+        self._player_block = RecordBlock([layout_for(type(player), self.SNAPSHOT_PLAYER_PREFIX)
+                                          for player in self.players])  # Snapshot de los jugadores
         
         # Estado del juego
+        self.tick = 0  # Ticks de simulación ejecutados
+        self.generation = 0  # Cambia cada vez que se reconstruye el nivel
         self.paused = False
         self.game_over = False
         self.level_complete = False
         
+        # Rebobinado (opcional)
+        self.rewind = rewind
+        self.rewinding = False
+        
         # Configuración del nivel actual
         self.ground_y = LevelSettings.GROUND_Y
+        self.level_width = LevelSettings.LEVEL_WIDTH
+        self.tilemap: Optional[TileMap] = None  # Capa de colisión por tiles (opcional)
+        self.spatial_query = SpatialQuery(self.platform_hash, None, self.ground_y, self.level_width)
         
         # Debug info
         self.show_debug = False
+        self.profiler: Optional[FrameProfiler] = None  # Tiempos por subsistema (lo asigna el juego)
+        self.profiler_overlay = ProfilerOverlay()
         
         self._create_test_level()
     
@@ -54,27 +140,121 @@ class GameScene:
         self.add_enemy(goomba1)
         self.add_enemy(goomba2)
         self.add_enemy(goomba3)
+        
+        self.build_static_collision()
     
+    @traced
     def update(self) -> None:
         """Actualiza la lógica de la escena cada frame"""
+        if self.update_begin():
+            self.integrate_enemy_bodies()
+            if self.profiler is not None:
+                self.profiler.lap('enemies')
+            self.update_end()
+    
+    @traced
+    def update_begin(self) -> bool:
+        """
+        Primera etapa del tick: entrada, Mario y lógica de los enemigos,
+        hasta antes de su paso de física por lotes.
+        
+        Returns:
+            False si la escena está en pausa o terminada (no seguir el tick)
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark()
+        
+        # Leer la entrada de este tick
+        self.input.poll()
+        if self.luigi is not None:
+            self.luigi.input.poll()
+        
+        # Mientras se mantiene el botón, restaurar un tick hacia atrás
+        rewinding = self.rewind is not None and self.input.is_held(Button.REWIND)
+        if rewinding:
+            self._rewind_step(not self.rewinding)
+            if profiler is not None:
+                profiler.lap('rewind')
+        self.rewinding = rewinding
+        if rewinding:
+            return False
+        
+        self.tick += 1
         
         # Manejar input global
         self._handle_global_input()
+        if profiler is not None:
+            profiler.lap('input')
         
         if self.paused or self.game_over:
-            return
+            return False
         
-        # Actualizar Mario
-        self.mario.update()
+        # Actualizar jugadores y aplicarles física
+        for player in self.players:
+            player.update()
+            self._apply_physics_to_player(player)
+        if profiler is not None:
+            profiler.lap('mario')
         
-        # Aplicar física a Mario
-        self._apply_physics_to_mario()
+        # Despertar/dormir enemigos según la cámara
+        self._update_activation()
         
         # Actualizar enemigos
         self._update_enemies()
+        if profiler is not None:
+            profiler.lap('enemies')
+        return True
+    
+    @traced
+    def integrate_enemy_bodies(self, scenes: Optional[Sequence['GameScene']] = None) -> None:
+        """
+        Etapa por lotes del tick: gravedad, movimiento y suelo de los
+        enemigos despiertos. Si varias escenas comparten `enemy_bodies`
+        (mismo nivel), basta con llamarla una vez por tick con todas las
+        que siguen corriendo; las pausadas o terminadas no se simulan.
+        Los atributos de los enemigos se copian al buffer antes del paso y
+        se devuelven después, una vez por tick en bloque.
         
-        # Verificar colisiones entre Mario y enemigos
-        self._check_mario_enemy_collisions()
+        Args:
+            scenes: Escenas cuyos enemigos simular, con el mismo buffer
+                (por defecto, solo esta)
+        """
+        if scenes is None:
+            scenes = (self,)
+        awake = [enemy for scene in scenes for enemy in scene.activation.awake]
+        
+        if len(awake) < self.BATCH_MIN_ENEMIES:
+            engine = self.physics_engine
+            for enemy in awake:
+                engine.apply_gravity(enemy)
+                engine.update_position(enemy)
+                engine.check_ground_collision(enemy, self.ground_y)
+            return
+        
+        bodies = self.enemy_bodies
+        slots = np.fromiter(map(attrgetter('_body_slot'), awake), dtype=np.intp, count=len(awake))
+        bodies.pull(slots, ('x', 'y', 'velocity_x', 'velocity_y', 'height'))
+        self.physics_engine.integrate_bodies(bodies, self.ground_y, slots)
+        bodies.push(slots, ('x', 'y', 'velocity_y'))
+    
+    @traced
+    def update_end(self) -> None:
+        """
+        Última etapa del tick: geometría de los enemigos, colisiones,
+        otras entidades, cámara y condiciones de game over.
+        """
+        profiler = self.profiler
+        
+        # Resolver enemigos contra plataformas y tiles, y decidir giros
+        self._resolve_enemy_geometry()
+        if profiler is not None:
+            profiler.lap('enemies')
+        
+        # Verificar colisiones entre jugadores y enemigos, y entre enemigos
+        self._check_collisions()
+        if profiler is not None:
+            profiler.lap('collisions')
         
         # Actualizar otras entidades
         for entity in self.entities[:]:  # Copia para poder eliminar durante iteración
@@ -82,83 +262,149 @@ class GameScene:
                 entity.update()
             else:
                 self.entities.remove(entity)
+        if profiler is not None:
+            profiler.lap('entities')
         
-        # Actualizar cámara para seguir a Mario
-        self.camera.follow_target(self.mario.x, self.mario.y)
+        # Actualizar cámara para seguir a Mario (o al punto medio entre ambos jugadores)
+        if self.luigi is None:
+            self.camera.follow_target(self.mario.x, self.mario.y)
+        else:
+            self.camera.follow_target((self.mario.x + self.luigi.x) / 2, (self.mario.y + self.luigi.y) / 2)
+        if profiler is not None:
+            profiler.lap('camera')
         
         # Verificar condiciones de game over
         self._check_game_over()
+        if profiler is not None:
+            profiler.lap('mario')
+        
+        # Guardar el estado del tick para poder rebobinar
+        if self.rewind is not None:
+            self.rewind.push(self.snapshot())
+            if profiler is not None:
+                profiler.lap('rewind')
+    
+    def _rewind_step(self, starting: bool) -> None:
+        """
+        Vuelve al estado guardado más reciente del buffer de rebobinado.
+        
+        Args:
+            starting: True en el primer tick del rebobinado; el snapshot más
+                reciente es entonces el estado actual y se descarta
+        """
+        if starting:
+            self.rewind.pop()
+        data = self.rewind.pop()
+        if data is not None:
+            # Conservar la entrada actual para detectar pulsaciones al soltar
+            buttons = self.input.buttons
+            previous = self.input.previous
+            self.restore(data)
+            self.input.buttons = buttons
+            self.input.previous = previous
     
     def _handle_global_input(self) -> None:
-        """Maneja input que afecta toda la escena"""
+        """
+        Maneja input que afecta toda la escena. Pausa y debug se leen de la
+        entrada de Mario; reiniciar, de la de cualquier jugador (en red el
+        jugador local puede ser Luigi). En red solo viaja RESTART (ver
+        `RollbackSession.NETWORK_BUTTONS`), así que pausa y debug no están
+        disponibles.
+        """
         
         # Pausar/despausar
-        if pyxel.btnp(pyxel.KEY_P):
+        if self.input.is_pressed(Button.PAUSE):
             self.paused = not self.paused
         
         # Toggle debug info
-        if pyxel.btnp(pyxel.KEY_F1):
+        if self.input.is_pressed(Button.DEBUG):
             self.show_debug = not self.show_debug
         
         # Restart (para testing)
-        if pyxel.btnp(pyxel.KEY_R):
-            self._restart_level()
+        if any(player.input.is_pressed(Button.RESTART) for player in self.players):
+            self.reset()
     
-    def _apply_physics_to_mario(self) -> None:
-        """Aplica física específicamente a Mario"""
+    def _apply_physics_to_player(self, player: Mario) -> None:
+        """
+        Aplica física a un jugador.
+        
+        Args:
+            player: Mario o Luigi
+        """
         
         # Aplicar gravedad
-        self.physics_engine.apply_gravity(self.mario)
+        self.physics_engine.apply_gravity(player)
         
         # Actualizar posición
-        self.physics_engine.update_position(self.mario)
+        self.physics_engine.update_position(player)
         
         # Verificar colisión con el suelo
-        mario_on_ground = self.physics_engine.check_ground_collision(self.mario, self.ground_y)
+        on_ground = self.physics_engine.check_ground_collision(player, self.ground_y)
         
         # Verificar colisiones con plataformas
-        mario_on_platform = self.physics_engine.check_platform_collision(self.mario, self.platforms)
+        on_platform = self.physics_engine.check_platform_collision(player, self.platform_hash)
         
-        # Actualizar estado de Mario
-        self.mario.set_on_ground(mario_on_ground or mario_on_platform)
+        # Verificar colisiones con los tiles del nivel
+        if self.tilemap is not None:
+            on_platform = self.physics_engine.check_tile_collision(player, self.tilemap) or on_platform
         
-        # Mantener a Mario dentro de los límites del nivel
+        # Actualizar estado del jugador
+        player.set_on_ground(on_ground or on_platform)
+        
+        # Mantener al jugador dentro de los límites horizontales del nivel
+        # (por abajo puede caer hasta PLAYER_FALL_LIMIT_Y)
         self.physics_engine.keep_in_bounds(
-            self.mario, 
+            player, 
             min_x=0, 
-            max_x=LevelSettings.LEVEL_WIDTH,
-            max_y=GameSettings.WINDOW_HEIGHT + 50  # Permitir caer un poco fuera de pantalla
+            max_x=self.level_width
         )
     
     def _check_game_over(self) -> None:
         """Verifica condiciones de game over"""
         
-        # Mario cayó fuera del nivel
-        if self.mario.y > GameSettings.WINDOW_HEIGHT + 50:
-            if self.mario.take_damage():
-                self.game_over = True
-            else:
-                self._restart_mario_position()
+        # Un jugador cayó fuera del nivel (la partida termina si alguno se queda sin vidas)
+        for player in self.players:
+            if player.y > self.PLAYER_FALL_LIMIT_Y:
+                if player.take_damage():
+                    self.game_over = True
+                else:
+                    self._restart_player_position(player)
     
-    def _restart_mario_position(self) -> None:
-        """Reinicia la posición de Mario al inicio del nivel"""
-        self.mario.reset_position(50, LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT)
+    def _restart_player_position(self, player: Mario) -> None:
+        """
+        Reinicia la posición de un jugador al inicio del nivel.
+        
+        Args:
+            player: Mario o Luigi
+        """
+        spawn_x = self.PLAYER_SPAWN_X[self.players.index(player)]
+        player.reset_position(spawn_x, LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT)
     
-    def _restart_level(self) -> None:
+    def reset(self) -> None:
         """Reinicia completamente el nivel"""
-        self.mario.reset_position(50, LevelSettings.GROUND_Y - GameSettings.MARIO_HEIGHT)
-        self.mario.lives = 3
-        self.mario.score = 0
-        self.mario.coins = 0
+        for player in self.players:
+            self._restart_player_position(player)
+            player.lives = 3
+            player.score = 0
+            player.coins = 0
         self.camera.set_position(0, 0)
         self.game_over = False
         self.level_complete = False
         self.paused = False
         
-        # Reiniciar enemigos
+        # Reiniciar enemigos (el buffer puede ser compartido: solo los propios)
         for enemy in self.enemies:
             enemy.destroy()
+            self.enemy_bodies.detach(enemy)
         self.enemies.clear()
+        self._enemy_registry.clear()
+        self._enemy_layouts.clear()
+        self._enemy_blocks.clear()
+        self.generation += 1
+        self.activation.clear()
+        self.broadphase.clear()
+        for player in self.players:
+            self.broadphase.add(player)
         
         # Limpiar entidades muertas
         self.entities = [e for e in self.entities if e.active]
@@ -166,8 +412,13 @@ class GameScene:
         # Recrear nivel
         self._create_test_level()
     
+    @traced
     def draw(self) -> None:
         """Dibuja toda la escena"""
+        import pyxel
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark()
         
         # Limpiar pantalla
         pyxel.cls(GameSettings.COLOR_SKY)
@@ -180,11 +431,16 @@ class GameScene:
             if entity.visible:
                 entity.draw(self.camera.x, self.camera.y)
         
-        # Dibujar enemigos (ya están en entities, pero por claridad)
-        # Los enemigos ya se dibujan en el loop anterior
+        # Dibujar enemigos (solo los despiertos pueden estar en pantalla)
+        for enemy in self.activation.awake:
+            if enemy.visible:
+                enemy.draw(self.camera.x, self.camera.y)
         
-        # Dibujar Mario (siempre al final para que esté encima)
-        self.mario.draw(self.camera.x, self.camera.y)
+        # Dibujar jugadores (siempre al final para que estén encima)
+        for player in reversed(self.players):
+            player.draw(self.camera.x, self.camera.y)
+        if profiler is not None:
+            profiler.lap('draw')
         
         # Dibujar UI
         self._draw_ui()
@@ -195,9 +451,12 @@ class GameScene:
         
         # Dibujar overlays (pausa, game over)
         self._draw_overlays()
+        if profiler is not None:
+            profiler.lap('ui')
     
     def _draw_level(self) -> None:
         """Dibuja el nivel estático (suelo, pipes, etc.)"""
+        import pyxel
         
         # Dibujar el suelo
         ground_screen_y = self.ground_y - self.camera.y
@@ -210,9 +469,34 @@ class GameScene:
                 GameSettings.WINDOW_HEIGHT - max(0, ground_screen_y),
                 GameSettings.COLOR_GROUND
             )
+        
+        # Dibujar los tiles visibles del nivel
+        if self.tilemap is not None:
+            self._draw_tiles()
+    
+    def _draw_tiles(self) -> None:
+        """Dibuja solo los tiles que caen dentro de la cámara"""
+        import pyxel
+        tilemap = self.tilemap
+        size = tilemap.tile_size
+        first_column, last_column, first_row, last_row = tilemap.cell_range(
+            self.camera.x, self.camera.y, GameSettings.WINDOW_WIDTH, GameSettings.WINDOW_HEIGHT
+        )
+        
+        for row in range(max(first_row, 0), min(last_row, tilemap.rows - 1) + 1):
+            for column in range(max(first_column, 0), min(last_column, tilemap.columns - 1) + 1):
+                color = tilemap.tile_colors.get(tilemap.get_tile(column, row))
+                if color is not None:
+                    pyxel.rect(
+                        column * size - self.camera.x,
+                        row * size - self.camera.y,
+                        size, size,
+                        color
+                    )
     
     def _draw_ui(self) -> None:
         """Dibuja la interfaz de usuario (score, vidas, etc.)"""
+        import pyxel
         
         # Score
         pyxel.text(8, 8, f"SCORE: {self.mario.score:06d}", GameSettings.COLOR_TEXT, None)
@@ -222,9 +506,19 @@ class GameScene:
         
         # Monedas
         pyxel.text(8, 24, f"COINS: {self.mario.coins:03d}", GameSettings.COLOR_TEXT, None)
+        
+        # Segundo jugador
+        if self.luigi is not None:
+            pyxel.text(8, 32, f"LUIGI: {self.luigi.score:06d} x{self.luigi.lives}", GameSettings.COLOR_TEXT, None)
+        
+        # Indicador de rebobinado
+        if self.rewinding:
+            text = "<< REWIND"
+            pyxel.text(GameSettings.WINDOW_WIDTH - len(text) * 4 - 8, 8, text, GameSettings.COLOR_TEXT, None)
     
     def _draw_debug_info(self) -> None:
         """Dibuja información de debug"""
+        import pyxel
         
         debug_y = GameSettings.WINDOW_HEIGHT - 40
         
@@ -239,9 +533,45 @@ class GameScene:
         
         # Posición de cámara
         pyxel.text(8, debug_y + 24, f"Camera: ({self.camera.x:.1f}, {self.camera.y:.1f})", GameSettings.COLOR_TEXT, None)
+        
+        # Tiempos por subsistema
+        if self.profiler is not None:
+            self.profiler_overlay.draw(self.profiler, *self._count_entities(), memory=self.get_memory_usage)
+    
+    def _count_entities(self) -> Tuple[int, int]:
+        """
+        Cuenta las entidades simuladas y las que caen dentro de la cámara.
+        
+        Returns:
+            Tupla (activas, visibles)
+        """
+        left = self.camera.x
+        right = left + GameSettings.WINDOW_WIDTH
+        top = self.camera.y
+        bottom = top + GameSettings.WINDOW_HEIGHT
+        active = len(self.players) + len(self.activation.awake)
+        visible = 0
+        for group in (self.players, self.activation.awake, self.entities):
+            for entity in group:
+                if (entity.visible and entity.x < right and entity.x + entity.width > left
+                        and entity.y < bottom and entity.y + entity.height > top):
+                    visible += 1
+        active += sum(1 for entity in self.entities if entity.active)
+        return active, visible
+    
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Mide la memoria de la escena por subsistema (ver `core.memory.scene_memory`
+        para el desglose completo).
+        
+        Returns:
+            Diccionario subsistema -> bytes
+        """
+        return summarize_report(scene_memory(self))
     
     def _draw_overlays(self) -> None:
         """Dibuja overlays como pausa o game over"""
+        import pyxel
         
         if self.paused:
             # Fondo semi-transparente
@@ -267,6 +597,30 @@ class GameScene:
             
             pyxel.text(text_x - 16, text_y + 16, "Press R to restart", GameSettings.COLOR_TEXT, None)
     
+    def set_tilemap(self, tilemap: Optional[TileMap], use_ground: bool = False) -> None:
+        """
+        Establece la capa de colisión por tiles del nivel.
+        
+        Args:
+            tilemap: Mapa de tiles (None para quitarlo)
+            use_ground: True para mantener además el suelo plano en ground_y
+        """
+        self.tilemap = tilemap
+        
+        if tilemap is None:
+            self.ground_y = LevelSettings.GROUND_Y
+            self.level_width = LevelSettings.LEVEL_WIDTH
+        else:
+            # El suelo lo definen los tiles (permite pozos)
+            if not use_ground:
+                self.ground_y = float('inf')
+            self.level_width = tilemap.pixel_width
+        
+        self.spatial_query.tilemap = tilemap
+        self.spatial_query.ground_y = self.ground_y
+        self.spatial_query.level_width = self.level_width
+        self.camera.set_bounds(0, self.level_width, 0, LevelSettings.LEVEL_HEIGHT)
+    
     def add_entity(self, entity: Entity) -> None:
         """
         Añade una entidad a la escena.
@@ -278,14 +632,28 @@ class GameScene:
     
     def add_platform(self, platform: Entity) -> None:
         """
-        Añade una plataforma a la escena.
+        Añade una plataforma a la escena. Si se agrega después de
+        `build_static_collision` se registra tal cual, sin fusionar.
         
         Args:
             platform: La plataforma a añadir
         """
         self.platforms.append(platform)
+        self.platform_hash.insert(platform)
         self.add_entity(platform)
     
+    def build_static_collision(self) -> None:
+        """
+        Paso de carga del nivel: fusiona los bloques adyacentes de
+        `platforms` en rectángulos grandes y registra solo esos en el
+        hash espacial. Las plataformas originales se siguen dibujando.
+        """
+        self.collision_geometry = merge_static_blocks(self.platforms)
+        
+        self.platform_hash.clear()
+        for geometry in self.collision_geometry:
+            self.platform_hash.insert(geometry)
+    
     def add_enemy(self, enemy: Goomba) -> None:
         """
         Añade un enemigo a la escena.
@@ -294,71 +662,333 @@ class GameScene:
             enemy: El enemigo a añadir
         """
         self.enemies.append(enemy)
-        self.add_entity(enemy)
+        self._enemy_registry.append(enemy)
+        self._enemy_layouts.append(layout_for(type(enemy), self.SNAPSHOT_ENEMY_PREFIX))
+        self.enemy_bodies.attach(enemy)
+        
+        # Empieza dormido; se despierta cuando la cámara se acerca
+        self.activation.add(enemy)
+        self.enemy_bodies.set_enabled(enemy, False)
+    
+    def remove_enemy(self, enemy: Goomba) -> None:
+        """
+        Quita un enemigo de la escena.
+        
+        Args:
+            enemy: El enemigo a quitar
+        """
+        if enemy in self.enemies:
+            self.enemies.remove(enemy)
+        if not enemy.asleep:
+            self.broadphase.remove(enemy)
+        self.activation.remove(enemy)
+        self.enemy_bodies.detach(enemy)
     
+    @traced
+    def snapshot(self) -> bytes:
+        """
+        Captura el estado dinámico de la escena en un buffer binario plano:
+        jugadores (con su entrada), enemigos (incluida su pertenencia a la escena, la activación y
+        el broadphase), cámara y flags. La geometría estática del
+        nivel no se incluye.
+        
+        Returns:
+            Bytes del snapshot
+        """
+        registry = self._enemy_registry
+        block = self._enemy_block(len(registry))
+        player_block = self._player_block
+        
+        # Las entidades se comparan por identidad, así que sirven de clave
+        in_scene = set(self.enemies)
+        awake_rank = {enemy: index for index, enemy in enumerate(self.activation.awake)}
+        sleep_rank = {enemy: index for index, enemy in enumerate(self.activation.sleeping)}
+        sleeping_keys = self.activation.sleeping_keys
+        sweep_rank = {entity: index for index, entity in enumerate(self.broadphase.entities)}
+        
+        header = self.SNAPSHOT_HEADER
+        size = header.size + player_block.size + block.size
+        buffer = bytearray(size)
+        
+        camera = self.camera
+        header.pack_into(
+            buffer, 0,
+            self.generation, self.tick, len(self.players), len(registry), len(self.enemies),
+            camera.x, camera.y, camera.target_x, camera.target_y,
+            self.paused, self.game_over, self.level_complete, self.show_debug
+        )
+        offset = header.size
+        player_block.pack_into(buffer, offset, self.players, [
+            (player.input.buttons, player.input.previous, sweep_rank.get(player, -1))
+            for player in self.players
+        ])
+        offset += player_block.size
+        
+        prefixes = []
+        for enemy in registry:
+            if enemy in awake_rank:
+                state, rank, sleep_key = 0, awake_rank[enemy], 0.0
+            elif enemy in sleep_rank:
+                rank = sleep_rank[enemy]
+                state, sleep_key = 1, sleeping_keys[rank]
+            else:
+                state, rank, sleep_key = -1, -1, 0.0
+            prefixes.append((enemy in in_scene, state, rank, sleep_key, sweep_rank.get(enemy, -1)))
+        
+        block.pack_into(buffer, offset, registry, prefixes)
+        return bytes(buffer)
+    
+    @traced
+    def restore(self, data: bytes) -> None:
+        """
+        Restaura un estado capturado con `snapshot`. Si el nivel se
+        reconstruyó desde entonces, se reconstruye de nuevo antes de aplicarlo.
+        
+        Args:
+            data: Bytes de un snapshot de esta escena
+        """
+        header = self.SNAPSHOT_HEADER
+        (generation, tick, player_count, enemy_count, scene_count,
+         camera_x, camera_y, camera_target_x, camera_target_y,
+         paused, game_over, level_complete, show_debug) = header.unpack_from(data, 0)
+        
+        if player_count != len(self.players):
+            raise ValueError("El snapshot es de una partida con otra cantidad de jugadores")
+        
+        if generation != self.generation:
+            self.reset()
+            self.generation = generation
+        
+        registry = self._enemy_registry
+        if enemy_count > len(registry):
+            raise ValueError("El snapshot tiene enemigos que esta escena no conoce")
+        
+        self.tick = tick
+        camera = self.camera
+        camera.x = camera_x
+        camera.y = camera_y
+        camera.target_x = camera_target_x
+        camera.target_y = camera_target_y
+        self.paused = paused
+        self.game_over = game_over
+        self.level_complete = level_complete
+        self.show_debug = show_debug
+        
+        offset = header.size
+        swept = []
+        player_prefixes = self._player_block.unpack_into(data, offset, self.players)
+        for player, (buttons, previous, sweep_rank) in zip(self.players, player_prefixes):
+            player.input.buttons = buttons
+            player.input.previous = previous
+            if sweep_rank >= 0:
+                swept.append((sweep_rank, player))
+        offset += self._player_block.size
+        
+        bodies = self.enemy_bodies
+        enemies = []
+        enabled = []
+        awake = []
+        sleeping = []
+        
+        # Creados después del snapshot: salen de la escena y del registro,
+        # así el próximo snapshot vuelve a ser idéntico al restaurado
+        for enemy in registry[enemy_count:]:
+            bodies.detach(enemy)
+        if enemy_count < len(registry):
+            del registry[enemy_count:]
+            del self._enemy_layouts[enemy_count:]
+            for count in [count for count in self._enemy_blocks if count > enemy_count]:
+                del self._enemy_blocks[count]
+        
+        block = self._enemy_block(enemy_count)
+        prefixes = block.unpack_into(data, offset, registry)
+        offset += block.size
+        
+        for enemy, (in_scene, state, rank, sleep_key, sweep_rank) in zip(registry, prefixes):
+            if in_scene:
+                if enemy._body_buffer is not bodies:
+                    bodies.attach(enemy)
+                enemies.append(enemy)
+                enabled.append(state == 0)
+            else:
+                bodies.detach(enemy)
+            
+            if state == 0:
+                awake.append((rank, enemy))
+            elif state == 1:
+                sleeping.append((rank, sleep_key, enemy))
+            else:
+                enemy.asleep = False
+            if sweep_rank >= 0:
+                swept.append((sweep_rank, enemy))
+        
+        # Habilitación de los cuerpos en bloque (los atributos físicos ya
+        # se restauraron con el resto del estado)
+        slots = [enemy._body_slot for enemy in enemies]
+        if scene_count != len(slots):
+            raise ValueError("Snapshot corrupto: enemigos en escena no coinciden")
+        if slots:
+            bodies.enabled[slots] = enabled
+        
+        self.enemies = enemies
+        awake.sort(key=itemgetter(0))
+        sleeping.sort(key=itemgetter(0))
+        self.activation.rebuild(
+            [enemy for _, enemy in awake],
+            [enemy for _, _, enemy in sleeping],
+            [key for _, key, _ in sleeping]
+        )
+        swept.sort(key=itemgetter(0))
+        self.broadphase.set_order([entity for _, entity in swept])
+    
+    def _enemy_block(self, count: int) -> RecordBlock:
+        """
+        Obtiene el bloque de registros de snapshot de los primeros `count`
+        enemigos del registro (`restore` descarta los bloques más grandes
+        al recortar el registro).
+        
+        Args:
+            count: Cantidad de enemigos
+            
+        Returns:
+            Bloque de registros
+        """
+        block = self._enemy_blocks.get(count)
+        if block is None:
+            block = self._enemy_blocks[count] = RecordBlock(self._enemy_layouts[:count])
+        return block
+    
+    @traced
+    def _update_activation(self) -> None:
+        """Despierta o duerme enemigos según la posición de la cámara"""
+        woken, slept = self.activation.update(self.camera)
+        
+        for enemy in woken:
+            self.enemy_bodies.set_enabled(enemy, True)
+            self.broadphase.add(enemy)
+        for enemy in slept:
+            self.enemy_bodies.set_enabled(enemy, False)
+            self.broadphase.remove(enemy)
+    
+    @traced
     def _update_enemies(self) -> None:
-        """Actualiza todos los enemigos"""
-        for enemy in self.enemies[:]:  # Copia para poder eliminar durante iteración
+        """Actualiza la lógica de los enemigos despiertos"""
+        for enemy in self.activation.awake[:]:  # Copia para poder eliminar durante iteración
             if enemy.active:
                 enemy.update()
-                
-                # Aplicar física al enemigo
-                self._apply_physics_to_enemy(enemy)
-                
-                # Verificar si debería darse la vuelta
-                if enemy.should_turn_around(self.ground_y):
-                    enemy.turn_around()
             else:
-                self.enemies.remove(enemy)
-                if enemy in self.entities:
-                    self.entities.remove(enemy)
+                self.remove_enemy(enemy)
     
-    def _apply_physics_to_enemy(self, enemy: Goomba) -> None:
+    @traced
+    def _resolve_enemy_geometry(self) -> None:
         """
-        Aplica física a un enemigo específico.
-        
-        Args:
-            enemy: El enemigo al que aplicar física
+        Resuelve a los enemigos despiertos contra plataformas, tiles y los
+        límites del nivel (después del paso por lotes) y decide si deben
+        darse la vuelta.
         """
-        # Aplicar gravedad
-        self.physics_engine.apply_gravity(enemy)
+        # Verificar colisiones con plataformas (solo si hay alguna)
+        if len(self.platform_hash):
+            for enemy in self.activation.awake:
+                self.physics_engine.check_platform_collision(enemy, self.platform_hash)
+        
+        # Verificar colisiones con los tiles del nivel
+        if self.tilemap is not None:
+            for enemy in self.activation.awake:
+                self.physics_engine.check_tile_collision(enemy, self.tilemap)
+        
+        awake = self.activation.awake
+        if len(awake) < self.BATCH_MIN_ENEMIES:
+            self._resolve_enemy_bounds_and_turns(awake)
+            return
         
-        # Actualizar posición
-        self.physics_engine.update_position(enemy)
+        # Mantener a los enemigos dentro de los límites horizontales del nivel
+        bodies = self.enemy_bodies
+        slots = np.fromiter(map(attrgetter('_body_slot'), awake), dtype=np.intp, count=len(awake))
+        bodies.pull(slots, ('x', 'y', 'width', 'height'))
+        horizontal, _ = self.physics_engine.keep_bodies_in_bounds(
+            bodies,
+            min_x=-50,  # Permitir que salga un poco de pantalla
+            max_x=self.level_width + 50,
+            slots=slots
+        )
+        bodies.push(horizontal, ('x', 'velocity_x'))
         
-        # Verificar colisión con el suelo
-        self.physics_engine.check_ground_collision(enemy, self.ground_y)
+        # Los que cayeron en un pozo se eliminan (`_update_enemies` los quita)
+        for index in np.flatnonzero(bodies.y[slots] > self.ENEMY_FALL_LIMIT_Y).tolist():
+            awake[index].destroy()
         
-        # Verificar colisiones con plataformas
-        self.physics_engine.check_platform_collision(enemy, self.platforms)
+        # Verificar si deberían darse la vuelta (todos a la vez)
+        turning = Enemy.should_turn_around_batch(awake, self.spatial_query)
+        for index in np.flatnonzero(turning).tolist():
+            awake[index].turn_around()
+    
+    def _resolve_enemy_bounds_and_turns(self, enemies: List[Goomba]) -> None:
+        """
+        Camino escalar de los límites, las caídas y los giros de
+        `_resolve_enemy_geometry`, para pocos enemigos.
         
-        # Mantener al enemigo dentro de los límites del nivel
-        self.physics_engine.keep_in_bounds(
-            enemy,
-            min_x=-50,  # Permitir que salga un poco de pantalla
-            max_x=LevelSettings.LEVEL_WIDTH + 50,
-            max_y=GameSettings.WINDOW_HEIGHT + 100
-        )
+        Args:
+            enemies: Enemigos despiertos
+        """
+        for enemy in enemies:
+            self.physics_engine.keep_in_bounds(
+                enemy,
+                min_x=-50,  # Permitir que salga un poco de pantalla
+                max_x=self.level_width + 50
+            )
+            if enemy.y > self.ENEMY_FALL_LIMIT_Y:
+                enemy.destroy()
+            if enemy.should_turn_around(self.ground_y, self.spatial_query):
+                enemy.turn_around()
     
-    def _check_mario_enemy_collisions(self) -> None:
-        """Verifica colisiones entre Mario y todos los enemigos"""
-        for enemy in self.enemies:
-            if not enemy.active or not enemy.is_alive:
-                continue
-                
-            collision_type = enemy.check_mario_collision(self.mario)
+    @traced
+    def _check_collisions(self) -> None:
+        """
+        Verifica colisiones entre entidades dinámicas usando el broadphase
+        sort-and-sweep: solo se prueban los pares que se solapan.
+        """
+        self.broadphase.update()
+        
+        for a, b in self.broadphase.find_pairs():
+            a_is_player = isinstance(a, Mario)
+            b_is_player = isinstance(b, Mario)
+            if a_is_player:
+                # Los jugadores se atraviesan entre sí
+                if not b_is_player:
+                    self._handle_player_enemy_collision(a, b)
+            elif b_is_player:
+                self._handle_player_enemy_collision(b, a)
+            else:
+                # Dos enemigos chocan: ambos se dan la vuelta. Si sus centros
+                # coinciden, el primero del barrido va a la izquierda (el
+                # orden del barrido se restaura con los snapshots)
+                a.bounce_off(b, left_on_tie=True)
+                b.bounce_off(a)
+    
+    def _handle_player_enemy_collision(self, player: Mario, enemy: Goomba) -> None:
+        """
+        Resuelve el contacto entre un jugador y un enemigo candidato.
+        
+        Args:
+            player: Mario o Luigi
+            enemy: El enemigo que se solapa con el jugador
+        """
+        if not enemy.active or not enemy.is_alive:
+            return
+        
+        collision_type = enemy.check_mario_collision(player)
+        
+        if collision_type == "stomp":
+            # El jugador pisó al enemigo
+            enemy.take_damage("stomp")
+            player.add_score(enemy.score_value)
             
-            if collision_type == "stomp":
-                # Mario pisó al enemigo
-                enemy.take_damage("stomp")
-                self.mario.add_score(enemy.score_value)
-                
-                # Hacer que Mario rebote un poco
-                self.mario.velocity_y = -4
-                
-            elif collision_type == "damage":
-                # Mario recibe daño del enemigo
-                if self.mario.take_damage():
-                    self.game_over = True
-                else:
-                    self._restart_mario_position()
+            # Hacer que el jugador rebote un poco
+            player.velocity_y = -4
+            
+        elif collision_type == "damage":
+            # El jugador recibe daño del enemigo
+            if player.take_damage():
+                self.game_over = True
+            else:
+                self._restart_player_position(player)
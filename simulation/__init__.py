@@ -0,0 +1,5 @@
+# Simulation package
+
+from .headless import HeadlessRunner
+from .batch import BatchSimulator, Scenario, RunResult, run_scenario
+from .vector_env import VectorEnv
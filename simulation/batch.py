@@ -0,0 +1,140 @@
+"""
+Simulación de escenarios en paralelo.
+Reparte simulaciones independientes del nivel entre un pool de procesos
+y recoge los resultados de cada una.
+"""
+
+import multiprocessing
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+from core.input import Button, ScriptedInput
+from simulation.headless import HeadlessRunner
+from config.settings import GameSettings
+
+class Scenario(NamedTuple):
+    """Escenario a simular: un guion de entrada y un límite de ticks"""
+    name: str
+    segments: Tuple[Tuple[int, int], ...]  # Tramos (máscara de botones, ticks)
+    max_ticks: int = GameSettings.FPS * 60
+
+class RunResult(NamedTuple):
+    """Resultado de simular un escenario"""
+    name: str
+    score: int
+    death_frame: Optional[int]  # Tick de la primera vida perdida (None si no murió)
+    frames_survived: int        # Ticks simulados hasta el game over o el límite
+    lives: int
+    game_over: bool
+
+def parse_buttons(value: Union[int, str, Sequence[str]]) -> int:
+    """
+    Convierte una descripción de botones en máscara de bits.
+    
+    Args:
+        value: Máscara entera, nombres separados por '+' o '|' ("RIGHT+JUMP")
+            o lista de nombres
+    
+    Returns:
+        Máscara de bits de Button
+    """
+    if isinstance(value, int):
+        return value
+    
+    if isinstance(value, str):
+        value = value.replace('|', '+').split('+')
+    
+    mask = 0
+    for name in value:
+        name = name.strip().upper()
+        if not name:
+            continue
+        button = getattr(Button, name, None)
+        if not isinstance(button, int):
+            raise ValueError(f"Botón desconocido: {name}")
+        mask |= button
+    return mask
+
+def scenario_from_dict(data: dict) -> Scenario:
+    """
+    Crea un escenario a partir de su descripción (por ejemplo, desde JSON).
+    
+    Args:
+        data: Diccionario con 'name', 'input' (lista de [botones, ticks])
+            y opcionalmente 'max_ticks'
+    
+    Returns:
+        El escenario equivalente
+    """
+    segments = tuple((parse_buttons(buttons), int(ticks)) for buttons, ticks in data.get('input', []))
+    return Scenario(
+        name=str(data.get('name', 'scenario')),
+        segments=segments,
+        max_ticks=int(data.get('max_ticks', GameSettings.FPS * 60))
+    )
+
+def run_scenario(scenario: Scenario) -> RunResult:
+    """
+    Simula un escenario completo sin ventana.
+    Es una función de módulo para poder enviarse a otros procesos.
+    
+    Args:
+        scenario: El escenario a simular
+    
+    Returns:
+        Resultado de la simulación
+    """
+    runner = HeadlessRunner(ScriptedInput.from_segments(scenario.segments))
+    mario = runner.scene.mario
+    lives = mario.lives
+    death_frame = None
+    
+    while runner.tick < scenario.max_ticks and not runner.game_over:
+        runner.step()
+        if mario.lives < lives and death_frame is None:
+            death_frame = runner.tick
+        lives = mario.lives
+    
+    return RunResult(
+        name=scenario.name,
+        score=mario.score,
+        death_frame=death_frame,
+        frames_survived=runner.tick,
+        lives=mario.lives,
+        game_over=runner.game_over
+    )
+
+class BatchSimulator:
+    """
+    Ejecuta muchos escenarios repartidos entre procesos.
+    Cada escenario se simula en su propia escena, así que los
+    resultados no dependen del orden ni del número de procesos.
+    """
+    
+    def __init__(self, processes: Optional[int] = None, chunksize: int = 1):
+        """
+        Inicializa el simulador por lotes.
+        
+        Args:
+            processes: Número de procesos (None = uno por CPU, 1 = sin pool)
+            chunksize: Escenarios que se envían juntos a cada proceso
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunksize = max(1, chunksize)
+    
+    def run(self, scenarios: Iterable[Scenario]) -> List[RunResult]:
+        """
+        Simula todos los escenarios.
+        
+        Args:
+            scenarios: Escenarios a simular
+        
+        Returns:
+            Resultados en el mismo orden que los escenarios
+        """
+        scenarios = list(scenarios)
+        processes = min(self.processes, len(scenarios))
+        
+        if processes <= 1:
+            return [run_scenario(scenario) for scenario in scenarios]
+        
+        with multiprocessing.Pool(processes) as pool:
+            return pool.map(run_scenario, scenarios, chunksize=self.chunksize)
@@ -0,0 +1,57 @@
+"""
+Simulación sin ventana.
+Avanza GameScene tick a tick sin inicializar Pyxel ni dibujar, con la
+entrada tomada de un guion, de una grabación o de código (bots).
+"""
+
+from typing import Callable, Optional
+from scenes.game_scene import GameScene
+from core.input import InputProvider, ManualInput
+
+class HeadlessRunner:
+    """
+    Ejecuta la lógica del juego tan rápido como permita la CPU.
+    Solo llama a `GameScene.update`; nunca a `draw` ni a Pyxel.
+    """
+    
+    def __init__(self, input_provider: Optional[InputProvider] = None,
+                 scene_factory: Callable[[InputProvider], GameScene] = GameScene):
+        """
+        Inicializa el runner y construye la escena.
+        
+        Args:
+            input_provider: Fuente de entrada (por defecto, ManualInput)
+            scene_factory: Función que crea la escena a partir de la entrada
+        """
+        self.input = input_provider if input_provider is not None else ManualInput()
+        self.scene = scene_factory(self.input)
+        self.tick = 0
+    
+    @property
+    def game_over(self) -> bool:
+        """Retorna True si la partida terminó"""
+        return self.scene.game_over
+    
+    def step(self) -> None:
+        """Avanza la simulación un tick"""
+        self.scene.update()
+        self.tick += 1
+    
+    def run(self, max_ticks: int, stop_on_game_over: bool = True) -> int:
+        """
+        Avanza la simulación varios ticks.
+        
+        Args:
+            max_ticks: Máximo de ticks a simular
+            stop_on_game_over: True para detenerse al terminar la partida
+            
+        Returns:
+            Número de ticks simulados
+        """
+        scene = self.scene
+        for ticks in range(max_ticks):
+            if stop_on_game_over and scene.game_over:
+                return ticks
+            scene.update()
+            self.tick += 1
+        return max_ticks
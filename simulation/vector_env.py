@@ -0,0 +1,222 @@
+"""
+Entorno vectorizado para agentes de aprendizaje por refuerzo.
+Mantiene N escenas independientes y las avanza juntas con un array de
+acciones, devolviendo observaciones, recompensas y fines de episodio
+como arrays de NumPy.
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from scenes.game_scene import GameScene
+from physics.batch import BodyBuffer
+from core.input import Button, InputProvider, ManualInput
+from config.settings import GameSettings, LevelSettings
+
+class VectorEnv:
+    """
+    N partidas que avanzan en paralelo dentro del mismo proceso.
+    Todas las escenas comparten un único BodyBuffer, así la física de los
+    enemigos de todos los entornos se resuelve con una sola pasada
+    vectorizada por tick en lugar de una por escena.
+    """
+    
+    # Enemigos más cercanos incluidos en la observación
+    NEAREST_ENEMIES = 4
+    
+    # Observación: Mario (x, y, vx, vy, en suelo, vidas) + (dx, dy, vivo) por enemigo
+    MARIO_FEATURES = 6
+    ENEMY_FEATURES = 3
+    OBSERVATION_SIZE = MARIO_FEATURES + NEAREST_ENEMIES * ENEMY_FEATURES
+    
+    # Recompensas
+    PROGRESS_REWARD = 0.1   # Por pixel de avance máximo hacia la derecha
+    SCORE_REWARD = 0.01     # Por punto de score
+    DEATH_PENALTY = 10.0    # Por vida perdida
+    
+    def __init__(self, num_envs: int, max_steps: Optional[int] = None, frame_skip: int = 1,
+                 scene_factory: Callable[[InputProvider, BodyBuffer], GameScene] = GameScene):
+        """
+        Inicializa los entornos.
+        
+        Args:
+            num_envs: Número de partidas en paralelo
+            max_steps: Pasos máximos por episodio (None = sin límite)
+            frame_skip: Ticks de simulación por paso (la acción se repite)
+            scene_factory: Crea una escena a partir de su entrada y del buffer
+                compartido; todas deben usar el mismo nivel
+        """
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.frame_skip = max(1, frame_skip)
+        
+        self.bodies = BodyBuffer(capacity=max(64, num_envs * 8))
+        self.inputs: List[ManualInput] = [ManualInput() for _ in range(num_envs)]
+        self.scenes: List[GameScene] = [scene_factory(provider, self.bodies) for provider in self.inputs]
+        
+        # Estadísticas por episodio
+        self.episode_steps = np.zeros(num_envs, dtype=np.int64)
+        self._best_x = np.zeros(num_envs)
+        self._last_score = np.zeros(num_envs)
+        self._last_lives = np.zeros(num_envs)
+        
+        for index in range(num_envs):
+            self._reset_stats(index)
+        
+        self._observations = np.zeros((num_envs, self.OBSERVATION_SIZE), dtype=np.float32)
+        self._mario_state = np.zeros((num_envs, self.MARIO_FEATURES))
+    
+    def reset(self) -> np.ndarray:
+        """
+        Reinicia todos los entornos.
+        
+        Returns:
+            Observaciones iniciales, array (num_envs, OBSERVATION_SIZE)
+        """
+        for index in range(self.num_envs):
+            self._reset_env(index)
+        return self._observe()
+    
+    def _reset_env(self, index: int) -> None:
+        """Reinicia un entorno y sus estadísticas"""
+        self.scenes[index].reset()
+        self.inputs[index].reset()
+        self._reset_stats(index)
+    
+    def _reset_stats(self, index: int) -> None:
+        """Reinicia las estadísticas del episodio de un entorno"""
+        mario = self.scenes[index].mario
+        self.episode_steps[index] = 0
+        self._best_x[index] = mario.x
+        self._last_score[index] = mario.score
+        self._last_lives[index] = mario.lives
+    
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Avanza todos los entornos un paso.
+        Los entornos que terminan se reinician automáticamente y su fila de
+        observaciones ya corresponde al nuevo episodio.
+        
+        Args:
+            actions: Máscaras de botones (Button), una por entorno; solo se
+                usan los botones de juego (Button.GAMEPLAY)
+        
+        Returns:
+            Tupla (observaciones, recompensas, terminados, info). `info` trae
+            'score', 'episode_steps' y 'truncated' del paso actual
+        """
+        actions = np.asarray(actions, dtype=np.int64) & Button.GAMEPLAY
+        for provider, action in zip(self.inputs, actions.tolist()):
+            provider.set(action)
+        
+        scenes = self.scenes
+        for _ in range(self.frame_skip):
+            # Las escenas terminadas esperan al reinicio del final del paso
+            running = [scene for scene in scenes if scene.update_begin()]
+            if not running:
+                break
+            
+            # Un solo paso de física para los enemigos de las escenas que
+            # siguen corriendo
+            running[0].integrate_enemy_bodies(running)
+            
+            for scene in running:
+                scene.update_end()
+        
+        self.episode_steps += 1
+        
+        # Estado de Mario en bloque
+        state = self._read_mario_state()
+        x = state[:, 0]
+        lives = state[:, 5].copy()
+        score = np.array([scene.mario.score for scene in scenes], dtype=np.float64)
+        game_over = np.array([scene.game_over for scene in scenes], dtype=bool)
+        
+        # Recompensa: progreso nuevo, score ganado y vidas perdidas
+        progress = np.maximum(x - self._best_x, 0.0)
+        self._best_x = np.maximum(self._best_x, x)
+        rewards = (progress * self.PROGRESS_REWARD +
+                   (score - self._last_score) * self.SCORE_REWARD -
+                   np.maximum(self._last_lives - lives, 0.0) * self.DEATH_PENALTY)
+        self._last_score = score
+        self._last_lives = lives
+        
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        if self.max_steps is not None:
+            truncated = ~game_over & (self.episode_steps >= self.max_steps)
+        dones = game_over | truncated
+        
+        info = {
+            'score': score.astype(np.int64),
+            'episode_steps': self.episode_steps.copy(),
+            'truncated': truncated,
+        }
+        
+        for index in np.flatnonzero(dones):
+            self._reset_env(index)
+        
+        return self._observe(), rewards.astype(np.float32), dones, info
+    
+    def _read_mario_state(self) -> np.ndarray:
+        """
+        Copia el estado de los Marios al array compartido.
+        
+        Returns:
+            Array (num_envs, MARIO_FEATURES): x, y, vx, vy, en suelo, vidas
+        """
+        state = self._mario_state
+        for index, scene in enumerate(self.scenes):
+            mario = scene.mario
+            state[index] = (mario.x, mario.y, mario.velocity_x, mario.velocity_y,
+                            mario.is_on_ground, mario.lives)
+        return state
+    
+    def _observe(self) -> np.ndarray:
+        """
+        Construye las observaciones normalizadas de todos los entornos.
+        
+        Returns:
+            Array (num_envs, OBSERVATION_SIZE) de float32
+        """
+        state = self._read_mario_state()
+        observations = self._observations
+        observations.fill(0.0)
+        
+        # Mario: posición relativa al nivel, velocidades relativas a la máxima
+        observations[:, 0] = state[:, 0] / LevelSettings.LEVEL_WIDTH
+        observations[:, 1] = state[:, 1] / LevelSettings.LEVEL_HEIGHT
+        observations[:, 2] = state[:, 2] / GameSettings.MARIO_SPEED
+        observations[:, 3] = state[:, 3] / GameSettings.MAX_FALL_SPEED
+        observations[:, 4] = state[:, 4]
+        observations[:, 5] = state[:, 5]
+        
+        # Enemigos despiertos más cercanos, en distancias de pantalla.
+        # Se juntan los de todos los entornos y se ordenan en bloque
+        env_ids = []
+        positions = []
+        alive = []
+        for index, scene in enumerate(self.scenes):
+            for enemy in scene.activation.awake:
+                env_ids.append(index)
+                positions.append((enemy.x, enemy.y))
+                alive.append(enemy.is_alive)
+        
+        if positions:
+            env_ids = np.array(env_ids, dtype=np.int64)
+            positions = np.array(positions, dtype=np.float64)
+            dx = (positions[:, 0] - state[env_ids, 0]) / GameSettings.WINDOW_WIDTH
+            dy = (positions[:, 1] - state[env_ids, 1]) / GameSettings.WINDOW_HEIGHT
+            
+            # Orden por entorno y distancia; rango dentro de cada entorno
+            order = np.lexsort((np.abs(dx), env_ids))
+            sorted_envs = env_ids[order]
+            rank = np.arange(len(order)) - np.searchsorted(sorted_envs, sorted_envs)
+            keep = rank < self.NEAREST_ENEMIES
+            
+            rows = sorted_envs[keep]
+            columns = self.MARIO_FEATURES + rank[keep] * self.ENEMY_FEATURES
+            selected = order[keep]
+            observations[rows, columns] = dx[selected]
+            observations[rows, columns + 1] = dy[selected]
+            observations[rows, columns + 2] = np.array(alive, dtype=np.float32)[selected]
+        
+        return observations.copy()
@@ -0,0 +1,10 @@
+"""
+Configuración común de los tests.
+Agrega la raíz del proyecto al path para importar los paquetes del juego
+igual que main.py.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
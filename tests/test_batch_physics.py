@@ -0,0 +1,31 @@
+"""
+Tests de la física por lotes de los enemigos: el camino vectorizado y el
+escalar deben dar exactamente el mismo estado.
+"""
+
+import pytest
+from benchmarks.scenes import SceneConfig, SyntheticScene
+from levels.tilemap import TileMap
+
+LEVEL = ['.' * 120] * 9 + ['.' * 20 + 'BBBB' + '.' * 96, '#' * 30 + '..' + '#' * 88, '#' * 120]
+
+def run_scene(batch_min_enemies, config, tilemap=False, ticks=300):
+    """Simula una escena sintética y devuelve el estado de sus enemigos en cada tick"""
+    scene = SyntheticScene(config)
+    scene.BATCH_MIN_ENEMIES = batch_min_enemies
+    if tilemap:
+        scene.set_tilemap(TileMap.from_strings(LEVEL))
+    
+    states = []
+    for _ in range(ticks):
+        scene.update()
+        states.append([(enemy.x, enemy.y, enemy.velocity_x, enemy.velocity_y, enemy.moving_left, enemy.active)
+                       for enemy in scene._enemy_registry])
+    return states
+
+@pytest.mark.parametrize('config, tilemap', [
+    (SceneConfig(40, 60, 2048, True), False),
+    (SceneConfig(100, 0, 1024, True), True),
+])
+def test_batch_and_scalar_paths_match(config, tilemap):
+    assert run_scene(0, config, tilemap) == run_scene(float('inf'), config, tilemap)
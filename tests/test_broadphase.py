@@ -0,0 +1,49 @@
+"""
+Tests del broadphase sort-and-sweep y del rebote entre enemigos.
+"""
+
+from entities.enemies.goomba import Goomba
+from physics.broadphase import SweepAndPrune
+
+def test_remove_keeps_sweep_order_and_membership():
+    goombas = [Goomba(x, 0) for x in (50, 10, 40, 20, 30)]
+    broadphase = SweepAndPrune()
+    for goomba in goombas:
+        broadphase.add(goomba)
+    broadphase.update()
+    
+    broadphase.remove(goombas[2])
+    broadphase.remove(goombas[2])  # Quitar dos veces no falla
+    
+    assert goombas[2] not in broadphase
+    assert goombas[0] in broadphase
+    assert len(broadphase) == 4
+    assert [goomba.x for goomba in broadphase.entities] == [10, 20, 30, 50]
+    
+    # Los índices siguen válidos tras reordenar y compactar
+    goombas[1].x = 60
+    broadphase.update()
+    broadphase.remove(goombas[1])
+    broadphase.add(goombas[2])
+    broadphase.update()
+    assert [goomba.x for goomba in broadphase.entities] == [20, 30, 40, 50]
+
+def test_find_pairs_skips_removed_entities():
+    a, b, c = Goomba(0, 0), Goomba(4, 0), Goomba(8, 0)
+    broadphase = SweepAndPrune()
+    for goomba in (a, b, c):
+        broadphase.add(goomba)
+    broadphase.update()
+    broadphase.remove(b)
+    
+    assert broadphase.find_pairs() == [(a, c)]
+
+def test_enemies_with_equal_centers_bounce_apart():
+    a, b = Goomba(100, 0), Goomba(100, 0)
+    a.moving_left = b.moving_left = True
+    
+    a.bounce_off(b, left_on_tie=True)
+    b.bounce_off(a)
+    
+    assert a.moving_left
+    assert not b.moving_left
@@ -0,0 +1,49 @@
+"""
+Tests de GameScene: reglas de la partida sobre niveles de tiles.
+"""
+
+from core.input import Button, ScriptedInput
+from entities.enemies.goomba import Goomba
+from levels.tilemap import TileMap
+from scenes.game_scene import GameScene
+
+# Nivel de tiles con un pozo de 4 columnas cerca del inicio
+PIT_LEVEL = ['.' * 40] * 10 + ['#' * 8 + '....' + '#' * 28] * 2
+
+def make_pit_scene(buttons=()):
+    """Crea una escena sobre el nivel con pozo, sin suelo plano"""
+    scene = GameScene(ScriptedInput(list(buttons)))
+    scene.set_tilemap(TileMap.from_strings(PIT_LEVEL))
+    return scene
+
+def test_falling_into_a_pit_costs_a_life():
+    scene = make_pit_scene([Button.RIGHT] * 60)
+    lives = scene.mario.lives
+    
+    for _ in range(60):
+        scene.update()
+    
+    assert scene.mario.lives == lives - 1
+    assert scene.mario.y < GameScene.PLAYER_FALL_LIMIT_Y
+    assert not scene.game_over
+
+def test_falling_into_a_pit_repeatedly_ends_the_game():
+    scene = make_pit_scene([Button.RIGHT] * 600)
+    
+    for _ in range(600):
+        scene.update()
+    
+    assert scene.game_over
+
+def test_enemy_that_falls_into_a_pit_is_removed():
+    scene = make_pit_scene()
+    tile = scene.tilemap.tile_size
+    goomba = Goomba(9 * tile, 0)
+    scene.add_enemy(goomba)
+    scene.activation.margin = scene.activation.sleep_margin = float('inf')
+    
+    for _ in range(200):
+        scene.update()
+    
+    assert goomba not in scene.enemies
+    assert not goomba.active
@@ -0,0 +1,34 @@
+"""
+Tests de la simulación sin ventana: no debe depender de Pyxel.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se bloquea `import pyxel` antes de importar el juego, como en una máquina
+# sin la biblioteca compartida de SDL
+HEADLESS_SCRIPT = '''
+import sys
+sys.modules['pyxel'] = None
+from core.input import Button, ScriptedInput
+from simulation.headless import HeadlessRunner
+from simulation import VectorEnv
+
+runner = HeadlessRunner(ScriptedInput([Button.RIGHT] * 120))
+assert runner.run(120) == 120
+assert runner.scene.mario.x > 50
+
+env = VectorEnv(2)
+env.reset()
+env.step([Button.RIGHT, 0])
+print('ok')
+'''
+
+def test_headless_runner_without_pyxel():
+    result = subprocess.run([sys.executable, '-c', HEADLESS_SCRIPT], cwd=ROOT,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'ok'
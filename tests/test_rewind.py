@@ -0,0 +1,55 @@
+"""
+Tests del buffer de rebobinado: cada snapshot guardado vuelve intacto.
+"""
+
+from core.input import Button, ManualInput
+from core.rewind import RewindBuffer
+from entities.enemies.goomba import Goomba
+from scenes.game_scene import GameScene
+
+def record_snapshots(ticks, add_enemy_at=None):
+    """Simula una partida y devuelve el snapshot de cada tick"""
+    mario = ManualInput()
+    scene = GameScene(mario)
+    snapshots = []
+    for tick in range(ticks):
+        if tick == add_enemy_at:
+            scene.add_enemy(Goomba(300, 100))  # Cambia el tamaño del snapshot
+        mario.set(Button.RIGHT | Button.JUMP if tick % 50 < 25 else Button.LEFT)
+        scene.update()
+        snapshots.append(scene.snapshot())
+    return snapshots
+
+def test_pops_return_every_pushed_snapshot_newest_first():
+    snapshots = record_snapshots(200, add_enemy_at=70)
+    rewind = RewindBuffer(capacity=len(snapshots), keyframe_interval=16)
+    for snapshot in snapshots:
+        rewind.push(snapshot)
+    
+    popped = [rewind.pop() for _ in snapshots]
+    
+    assert popped == snapshots[::-1]
+    assert rewind.pop() is None
+
+def test_full_buffer_keeps_the_most_recent_snapshots():
+    snapshots = record_snapshots(100)
+    rewind = RewindBuffer(capacity=40, keyframe_interval=16)
+    for snapshot in snapshots:
+        rewind.push(snapshot)
+    
+    assert len(rewind) == 40
+    assert [rewind.pop() for _ in range(40)] == snapshots[:-41:-1]
+
+def test_push_after_pop_starts_from_a_new_keyframe():
+    snapshots = record_snapshots(60)
+    rewind = RewindBuffer(capacity=60, keyframe_interval=16)
+    for snapshot in snapshots[:40]:
+        rewind.push(snapshot)
+    for _ in range(10):
+        rewind.pop()
+    
+    # Se retoma desde el tick 30, como tras soltar el botón de rebobinar
+    for snapshot in snapshots[30:]:
+        rewind.push(snapshot)
+    
+    assert [rewind.pop() for _ in range(60)] == snapshots[::-1]
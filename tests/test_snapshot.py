@@ -0,0 +1,54 @@
+"""
+Tests del snapshot binario de GameScene: restaurar y volver a capturar
+debe dar exactamente los mismos bytes.
+"""
+
+from core.input import Button, ManualInput
+from entities.enemies.goomba import Goomba
+from scenes.game_scene import GameScene
+
+def advance(scene, inputs, ticks, buttons=Button.RIGHT | Button.JUMP):
+    """Avanza la escena con los mismos botones para todos los jugadores"""
+    for _ in range(ticks):
+        for provider in inputs:
+            provider.set(buttons)
+        scene.update()
+
+def test_snapshot_round_trip_is_byte_identical():
+    mario = ManualInput()
+    scene = GameScene(mario)
+    advance(scene, [mario], 90)
+    saved = scene.snapshot()
+    
+    advance(scene, [mario], 120, Button.LEFT | Button.RUN)
+    assert scene.snapshot() != saved
+    
+    scene.restore(saved)
+    assert scene.snapshot() == saved
+
+def test_restored_scene_continues_like_the_original():
+    mario, luigi = ManualInput(), ManualInput()
+    scene = GameScene(mario, second_player=luigi)
+    advance(scene, [mario, luigi], 60)
+    saved = scene.snapshot()
+    
+    advance(scene, [mario, luigi], 150)
+    expected = scene.snapshot()
+    
+    scene.restore(saved)
+    advance(scene, [mario, luigi], 150)
+    assert scene.snapshot() == expected
+
+def test_enemies_added_after_the_snapshot_are_dropped_on_restore():
+    mario = ManualInput()
+    scene = GameScene(mario)
+    advance(scene, [mario], 30)
+    enemies = list(scene.enemies)
+    saved = scene.snapshot()
+    
+    scene.add_enemy(Goomba(200, 100))
+    advance(scene, [mario], 30)
+    
+    scene.restore(saved)
+    assert scene.enemies == enemies
+    assert scene.snapshot() == saved
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Hornea los sprites en disco.
+Construye el atlas de todos los conjuntos registrados y guarda los image
+banks en assets/sprites/sprites.pyxres (más su manifiesto JSON), para que
+el juego los cargue al iniciar con una sola llamada. El juego también lo
+regenera solo cuando cambia el código de los sprites; este script sirve
+para dejarlo listo al instalar (por ejemplo, en máquinas de solo lectura).
+
+Uso:
+    python tools/bake_sprites.py [--check] [-o sprites.pyxres]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyxel
+from config.settings import GameSettings
+from assets.sprites import sprite_manager
+from assets.sprites.cache import SpriteBankCache
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Hornea los image banks de sprites")
+    parser.add_argument("--check", action="store_true",
+                        help="Solo verificar si el archivo horneado está al día (código de salida 1 si no)")
+    parser.add_argument("-o", "--output", help="Archivo .pyxres (por defecto, el que usa el juego)")
+    args = parser.parse_args()
+    
+    cache = SpriteBankCache(args.output)
+    if args.check:
+        current = cache.is_current()
+        print(f"{'✅ Al día' if current else '❌ Desactualizado'}: {cache.path}")
+        sys.exit(0 if current else 1)
+    
+    pyxel.init(GameSettings.WINDOW_WIDTH, GameSettings.WINDOW_HEIGHT, title="bake_sprites")
+    sprite_manager.cache = cache
+    start = time.perf_counter()
+    sprite_manager.preload(use_cache=False)
+    elapsed = time.perf_counter() - start
+    
+    atlas = sprite_manager.atlas
+    print(f"🍞 {len(atlas.handles)} sprites ({len(atlas.entries)} regiones, banks {atlas.used_banks()}) "
+          f"horneados en {elapsed * 1000:.1f} ms")
+    print(f"💾 {cache.path}")
+    print(f"🔑 {cache.content_hash()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Ejecuta escenarios del juego en paralelo y sin ventana.
+Lee uno o más archivos JSON con escenarios y muestra los resultados.
+
+Formato de cada archivo (un escenario o una lista de escenarios):
+    {"name": "salto", "max_ticks": 600,
+     "input": [["RIGHT", 60], ["RIGHT+JUMP", 1], ["RIGHT+RUN", 300]]}
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.batch import BatchSimulator, scenario_from_dict
+
+def load_scenarios(paths):
+    """
+    Carga los escenarios de una lista de archivos JSON.
+    
+    Args:
+        paths: Rutas de los archivos
+    
+    Returns:
+        Lista de escenarios
+    """
+    scenarios = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [data]
+        scenarios.extend(scenario_from_dict(item) for item in data)
+    return scenarios
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Simulación de escenarios en paralelo")
+    parser.add_argument("scenarios", nargs="+", help="Archivos JSON con escenarios")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="Procesos (por defecto, uno por CPU)")
+    parser.add_argument("--chunksize", type=int, default=1, help="Escenarios por envío a cada proceso")
+    parser.add_argument("-o", "--output", help="Guardar los resultados en un archivo JSON")
+    args = parser.parse_args()
+    
+    scenarios = load_scenarios(args.scenarios)
+    simulator = BatchSimulator(args.processes, args.chunksize)
+    
+    start = time.perf_counter()
+    results = simulator.run(scenarios)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{'Escenario':<24} {'Score':>7} {'Muerte':>7} {'Frames':>7}")
+    for result in results:
+        death = result.death_frame if result.death_frame is not None else "-"
+        print(f"{result.name:<24} {result.score:>7} {death:>7} {result.frames_survived:>7}")
+    
+    total_ticks = sum(result.frames_survived for result in results)
+    print(f"\n{len(results)} escenarios, {total_ticks} ticks en {elapsed:.2f}s "
+          f"({total_ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([result._asdict() for result in results], f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Mide el costo del rollback de la partida en red.
+Corre dos sesiones conectadas por LoopbackTransport (con latencia y
+pérdida simuladas) con entradas aleatorias, comprueba que ambos lados
+terminen en el mismo estado y mide cuánto cuesta restaurar y re-simular
+N ticks, que es lo que debe entrar en un frame de dibujo.
+
+Uso:
+    python tools/bench_rollback.py [--frames N] [--latency T] [--loss P] [--depth D]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.input import Button
+from netplay import LoopbackTransport, RollbackSession
+from config.settings import GameSettings
+
+# Entradas posibles de cada jugador y ticks que se mantiene cada una
+CHOICES = [
+    Button.NONE, Button.RIGHT, Button.RIGHT | Button.RUN, Button.RIGHT | Button.JUMP,
+    Button.LEFT, Button.LEFT | Button.JUMP, Button.JUMP,
+]
+HOLD_TICKS = 12
+
+def play(args):
+    """
+    Juega una partida entre dos sesiones conectadas en memoria.
+    
+    Returns:
+        Tupla (sesión A, sesión B, segundos de simulación por lado)
+    """
+    a, b = LoopbackTransport.pair(args.latency, args.loss, args.seed)
+    sessions = [RollbackSession(0, a, args.delay, args.max_prediction),
+                RollbackSession(1, b, args.delay, args.max_prediction)]
+    rng = random.Random(args.seed)
+    buttons = [Button.NONE, Button.NONE]
+    elapsed = [0.0, 0.0]
+    
+    for frame in range(args.frames):
+        if frame % HOLD_TICKS == 0:
+            buttons = [rng.choice(CHOICES), rng.choice(CHOICES)]
+        for index, session in enumerate(sessions):
+            mask = buttons[index]
+            if session.scene.game_over:
+                mask |= Button.RESTART
+            start = time.perf_counter()
+            session.advance(mask)
+            elapsed[index] += time.perf_counter() - start
+    
+    # Sin entradas nuevas hasta que ambos lados confirmen todo lo jugado
+    for _ in range(args.latency * 2 + args.delay + args.max_prediction + 60):
+        for session in sessions:
+            session.advance(Button.NONE)
+    
+    return sessions[0], sessions[1], elapsed
+
+def measure_depth(depth, repeats):
+    """
+    Mide restaurar un snapshot y re-simular `depth` ticks en una escena de
+    dos jugadores, como hace un rollback.
+    
+    Returns:
+        Milisegundos por rollback
+    """
+    a, _ = LoopbackTransport.pair()
+    session = RollbackSession(0, a)
+    scene = session.scene
+    inputs = session.inputs
+    for _ in range(60):
+        inputs[0].set(Button.RIGHT)
+        scene.update()
+    
+    state = scene.snapshot()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        scene.restore(state)
+        for tick in range(depth):
+            inputs[0].set(Button.RIGHT | Button.JUMP if tick == 0 else Button.RIGHT)
+            inputs[1].set(Button.LEFT)
+            scene.snapshot()
+            scene.update()
+    return (time.perf_counter() - start) / repeats * 1000
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Benchmark del rollback de la partida en red")
+    parser.add_argument("--frames", type=int, default=3600, help="Ticks a jugar")
+    parser.add_argument("--latency", type=int, default=4, help="Latencia simulada en ticks")
+    parser.add_argument("--loss", type=float, default=0.05, help="Probabilidad de perder cada paquete")
+    parser.add_argument("--delay", type=int, default=2, help="Retardo de la entrada local en ticks")
+    parser.add_argument("--max-prediction", type=int, default=8, help="Ticks máximos de predicción")
+    parser.add_argument("--depth", type=int, default=8, help="Ticks re-simulados en la medición aislada")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla de entradas y pérdidas")
+    args = parser.parse_args()
+    
+    session_a, session_b, elapsed = play(args)
+    
+    print(f"🎮 {args.frames} ticks, latencia {args.latency}, pérdida {args.loss:.0%}, retardo {args.delay}")
+    for name, session, seconds in (("A", session_a, elapsed[0]), ("B", session_b, elapsed[1])):
+        average = session.rollback_frames / max(session.rollbacks, 1)
+        print(f"  {name}: {seconds / args.frames * 1000:.3f} ms/tick, {session.rollbacks} rollbacks "
+              f"(media {average:.1f}, máx {session.max_rollback} ticks), {session.stalls} esperas")
+    
+    same = (session_a.frame == session_b.frame and
+            session_a.scene.snapshot() == session_b.scene.snapshot())
+    print(f"  Estado final idéntico en ambos lados: {'sí' if same else 'NO'}")
+    
+    budget = 1000 / GameSettings.FPS
+    cost = measure_depth(args.depth, 200)
+    print(f"⏱️  Rollback de {args.depth} ticks: {cost:.3f} ms ({cost / budget:.1%} de un frame de {budget:.1f} ms)")
+    
+    if not same:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
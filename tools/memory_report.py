@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Reporte de memoria de una partida larga.
+Juega una escena sintética sin ventana (con rebobinado) durante muchos
+ticks y muestra cada cierto intervalo la memoria de cada subsistema y la
+reservada por Python (tracemalloc). Al final muestra el desglose completo
+y cuánto creció cada paquete, para encontrar lo que crece sin límite.
+
+Uso:
+    python tools/memory_report.py [--ticks N] [--every N] [--goombas N] [--draw] [-o reporte.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.scenes import SceneConfig, SyntheticScene
+from benchmarks.runner import init_pyxel
+from core.memory import MemoryTracker, scene_memory, summarize_report
+from core.rewind import RewindBuffer
+
+def kilobytes(size):
+    """Formatea bytes como KB con signo opcional"""
+    return f"{size / 1024:,.1f} KB"
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Reporte de memoria por subsistema")
+    parser.add_argument("--ticks", type=int, default=36000, help="Ticks a jugar (36000 = 10 minutos)")
+    parser.add_argument("--every", type=int, default=3600, help="Mostrar la memoria cada N ticks")
+    parser.add_argument("--goombas", type=int, default=30, help="Goombas del nivel")
+    parser.add_argument("--platforms", type=int, default=50, help="Bloques del nivel")
+    parser.add_argument("--length", type=int, default=2048, help="Largo del nivel en pixels")
+    parser.add_argument("--no-rewind", action="store_true", help="Jugar sin buffer de rebobinado")
+    parser.add_argument("--draw", action="store_true", help="Dibujar cada tick (carga los sprites; requiere Pyxel)")
+    parser.add_argument("-o", "--output", help="Guardar el reporte en un archivo JSON")
+    args = parser.parse_args()
+    
+    draw = args.draw and init_pyxel()
+    
+    tracker = MemoryTracker()
+    tracker.start()
+    
+    scene = SyntheticScene(SceneConfig(args.goombas, args.platforms, args.length))
+    if not args.no_rewind:
+        scene.rewind = RewindBuffer()
+    
+    subsystems = list(summarize_report(scene_memory(scene)))
+    print(f"{'tick':>8} {'python':>12} " + " ".join(f"{name:>11}" for name in subsystems))
+    checkpoints = []
+    for tick in range(1, args.ticks + 1):
+        scene.update()
+        if draw:
+            scene.draw()
+        if tick % args.every == 0 or tick == args.ticks:
+            totals = summarize_report(scene_memory(scene))
+            traced = tracker.current()['current']
+            checkpoints.append({'tick': tick, 'python': traced, 'subsystems': totals})
+            print(f"{tick:>8} {kilobytes(traced):>12} " +
+                  " ".join(f"{kilobytes(totals.get(name, 0)):>11}" for name in subsystems))
+    
+    report = scene_memory(scene)
+    packages = tracker.by_package()
+    growth = tracker.growth()
+    
+    print("\n📦 Desglose final:")
+    for subsystem, parts in report.items():
+        print(f"  {subsystem}: {kilobytes(sum(parts.values()))}")
+        for name, size in sorted(parts.items(), key=lambda item: -item[1]):
+            print(f"    {name:<20} {kilobytes(size):>12}")
+    
+    print(f"\n🐍 Memoria de Python por paquete (pico {kilobytes(tracker.current()['peak'])}):")
+    for package, size in packages.items():
+        print(f"  {package:<20} {kilobytes(size):>12}  ({growth.get(package, 0) / 1024:+,.1f} KB desde el inicio)")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'checkpoints': checkpoints, 'breakdown': report,
+                       'packages': packages, 'growth': growth}, f, indent=2)
+        print(f"\n💾 Reporte guardado en {args.output}")
+
+if __name__ == "__main__":
+    main()
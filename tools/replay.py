@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Reproduce una grabación de entrada sin ventana y a máxima velocidad.
+Sirve para reproducir reportes de bugs: la simulación es determinista,
+así que el estado en cada tick es el mismo que en la partida original.
+
+Uso:
+    python tools/replay.py partida.rec [--until TICK] [--every N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.recording import InputReplay
+from core.rewind import RewindBuffer
+from scenes.game_scene import GameScene
+from simulation.headless import HeadlessRunner
+
+def describe(runner):
+    """Retorna una línea con el estado de la partida"""
+    scene = runner.scene
+    mario = scene.mario
+    return (f"tick {runner.tick:>7}  mario=({mario.x:.1f}, {mario.y:.1f})  "
+            f"score={mario.score}  lives={mario.lives}  game_over={scene.game_over}")
+
+def main():
+    """Función principal del script"""
+    parser = argparse.ArgumentParser(description="Reproducción de grabaciones sin ventana")
+    parser.add_argument("recording", help="Archivo de grabación")
+    parser.add_argument("--until", type=int, default=None, help="Detenerse en este tick")
+    parser.add_argument("--every", type=int, default=0, help="Mostrar el estado cada N ticks")
+    args = parser.parse_args()
+    
+    replay = InputReplay.load(args.recording)
+    size = os.path.getsize(args.recording)
+    print(f"📼 {args.recording}: {replay.frame_count} ticks, {len(replay.runs)} corridas, {size} bytes")
+    
+    # Misma escena que el juego: la grabación puede incluir rebobinados
+    runner = HeadlessRunner(replay, lambda provider: GameScene(provider, rewind=RewindBuffer()))
+    total = replay.frame_count if args.until is None else min(args.until, replay.frame_count)
+    
+    start = time.perf_counter()
+    while runner.tick < total:
+        # Seguir aunque haya game over: la grabación puede reiniciar el nivel
+        runner.step()
+        if args.every and runner.tick % args.every == 0:
+            print(describe(runner))
+    elapsed = time.perf_counter() - start
+    
+    if not (args.every and runner.tick % args.every == 0):
+        print(describe(runner))
+    print(f"⏱️  {runner.tick} ticks en {elapsed:.2f}s ({runner.tick / max(elapsed, 1e-9):.0f} ticks/s)")
+
+if __name__ == "__main__":
+    main()
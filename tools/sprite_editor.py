@@ -134,7 +134,7 @@ mario_sprite = [
 # 1. Copia el array de colores
 # 2. Pégalo en assets/sprites.py
 # 3. Añádelo a la función _create_mario_sprites()
-# 4. Úsalo en draw_mario_sprite()
+# 4. Úsalo con sprite_manager.resolve() y sprite_manager.draw()
 """
     
     with open("/Users/darioabadie/deployr/mario_game/sprite_template.txt", "w") as f:
@@ -1 +1,2 @@
 # UI package
+from .profiler_overlay import ProfilerOverlay
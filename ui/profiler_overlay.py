@@ -0,0 +1,136 @@
+"""
+Overlay de rendimiento para el modo debug.
+Muestra los percentiles del tiempo de frame, el tiempo medio de cada
+subsistema, la cantidad de entidades activas y visibles y un gráfico de
+los últimos frames con la línea del presupuesto (1 / FPS).
+"""
+
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+from core.profiler import FrameProfiler
+from config.settings import GameSettings
+
+class ProfilerOverlay:
+    """Panel con los datos de un FrameProfiler"""
+    
+    # Geometría del panel
+    WIDTH = 112
+    LINE_HEIGHT = 7
+    GRAPH_HEIGHT = 24
+    
+    # Colores
+    COLOR_PANEL = 0        # Negro
+    COLOR_GRAPH_BG = 1     # Azul oscuro
+    COLOR_BUDGET = 13      # Gris
+    COLOR_OK = 11          # Verde
+    COLOR_SLOW = 8         # Rojo
+    
+    # Frames entre recálculos de las estadísticas (los percentiles no son gratis)
+    REFRESH_FRAMES = 15
+    # Frames entre mediciones de memoria (recorrer la escena cuesta milisegundos)
+    MEMORY_REFRESH_FRAMES = 120
+    # Subsistemas de memoria por línea
+    MEMORY_PER_LINE = 3
+    
+    def __init__(self, x: int = GameSettings.WINDOW_WIDTH - 116, y: int = 18):
+        """
+        Inicializa el overlay.
+        
+        Args:
+            x: Posición X del panel en pantalla
+            y: Posición Y del panel en pantalla
+        """
+        self.x = x
+        self.y = y
+        self.budget_ms = 1000 / GameSettings.FPS
+        self._frames_until_refresh = 0
+        self._percentiles = (0.0, 0.0, 0.0)
+        self._sections = {}
+        self._frames_until_memory = 0
+        self._memory_lines = []
+    
+    def draw(self, profiler: FrameProfiler, active: int, visible: int,
+             memory: Optional[Callable[[], Dict[str, int]]] = None) -> None:
+        """
+        Dibuja el panel.
+        
+        Args:
+            profiler: Profiler con el historial de frames
+            active: Entidades activas (simuladas)
+            visible: Entidades dentro de la pantalla
+            memory: Función que retorna los bytes por subsistema (opcional)
+        """
+        import pyxel
+        if self._frames_until_refresh <= 0:
+            self._percentiles = profiler.percentiles()
+            self._sections = profiler.section_averages()
+            self._frames_until_refresh = self.REFRESH_FRAMES
+        self._frames_until_refresh -= 1
+        
+        lines = [f"MS p50/95/99 {self._percentiles[0]:.1f}/{self._percentiles[1]:.1f}/{self._percentiles[2]:.1f}"]
+        lines.extend(f"{name:<11}{ms:6.2f}" for name, ms in self._sections.items())
+        lines.append(f"ACTIVE {active} VISIBLE {visible}")
+        
+        if memory is not None:
+            if self._frames_until_memory <= 0:
+                self._memory_lines = self._format_memory(memory())
+                self._frames_until_memory = self.MEMORY_REFRESH_FRAMES
+            self._frames_until_memory -= 1
+            lines.extend(self._memory_lines)
+        
+        x, y = self.x, self.y
+        height = len(lines) * self.LINE_HEIGHT + self.GRAPH_HEIGHT + 6
+        pyxel.rect(x - 2, y - 2, self.WIDTH, height, self.COLOR_PANEL)
+        
+        for line in lines:
+            pyxel.text(x, y, line, GameSettings.COLOR_TEXT, None)
+            y += self.LINE_HEIGHT
+        
+        self._draw_graph(profiler, x, y + 2)
+    
+    def _format_memory(self, usage: Dict[str, int]) -> List[str]:
+        """
+        Arma las líneas de memoria: KB por subsistema y, si tracemalloc está
+        activo, el total reservado por Python.
+        
+        Args:
+            usage: Bytes por subsistema
+        
+        Returns:
+            Líneas de texto
+        """
+        items = [f"{name[:3].upper()} {size // 1024}K" for name, size in usage.items()]
+        if tracemalloc.is_tracing():
+            items.append(f"PY {tracemalloc.get_traced_memory()[0] // 1024}K")
+        lines = []
+        for index in range(0, len(items), self.MEMORY_PER_LINE):
+            prefix = "MEM " if index == 0 else "    "
+            lines.append(prefix + " ".join(items[index:index + self.MEMORY_PER_LINE]))
+        return lines
+    
+    def _draw_graph(self, profiler: FrameProfiler, x: int, y: int) -> None:
+        """
+        Dibuja los últimos tiempos de frame como barras; la escala llega
+        hasta el doble del presupuesto y la línea marca el presupuesto.
+        
+        Args:
+            profiler: Profiler con el historial de frames
+            x: Esquina izquierda del gráfico
+            y: Borde superior del gráfico
+        """
+        import pyxel
+        width = GameSettings.PROFILER_GRAPH_FRAMES
+        height = self.GRAPH_HEIGHT
+        pyxel.rect(x, y, width, height, self.COLOR_GRAPH_BG)
+        
+        history = profiler.history()[-width:]
+        scale = height / (self.budget_ms * 2)
+        bottom = y + height - 1
+        start = x + width - len(history)
+        for offset, ms in enumerate(history.tolist()):
+            bar = min(int(ms * scale) + 1, height)
+            color = self.COLOR_OK if ms <= self.budget_ms else self.COLOR_SLOW
+            pyxel.line(start + offset, bottom, start + offset, bottom - bar + 1, color)
+        
+        budget_y = bottom - int(self.budget_ms * scale)
+        pyxel.line(x, budget_y, x + width - 1, budget_y, self.COLOR_BUDGET)